@@ -1,52 +1,71 @@
 'use client';
 
-import { useEffect, useState } from 'react';
+import { useCallback, useEffect, useState } from 'react';
 import { useSession } from 'next-auth/react';
 import { useRouter } from 'next/navigation';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
-import { Package, CheckCircle, XCircle, ArrowLeft, Trash2 } from 'lucide-react';
+import { Package, ArrowLeft, Download } from 'lucide-react';
 import Link from 'next/link';
 import { toast } from 'sonner';
-import {
-  Table,
-  TableBody,
-  TableCell,
-  TableHead,
-  TableHeader,
-  TableRow,
-} from '@/components/ui/table';
+import dynamic from 'next/dynamic';
+import { usePaginatedItems } from '@/hooks/use-paginated-items';
+
+const PAGE_SIZE = 50;
+
+const AdminItemsTable = dynamic(() => import('@/components/admin-items-table'), {
+  loading: () => (
+    <div className="text-center py-12">
+      <div className="inline-block animate-spin rounded-full h-8 w-8 border-4 border-cyan-500 border-t-transparent"></div>
+    </div>
+  ),
+});
+
+function countOf(facet, value) {
+  return facet?.find((bucket) => bucket.value === value)?.count || 0;
+}
 
 export default function AdminPage() {
   const { data: session, status } = useSession();
   const router = useRouter();
-  const [items, setItems] = useState([]);
-  const [loading, setLoading] = useState(true);
+  const isAdmin = session?.user?.role === 'admin';
+  const [stats, setStats] = useState({ total: 0, lost: 0, found: 0, verified: 0 });
+
+  const { items, setItems, loading, hasMore, loadMore } = usePaginatedItems(
+    {},
+    { pageSize: PAGE_SIZE, enabled: isAdmin }
+  );
 
   useEffect(() => {
     if (status === 'unauthenticated') {
       router.push('/login');
-    } else if (session?.user?.role !== 'admin') {
+    } else if (status === 'authenticated' && !isAdmin) {
       toast.error('Access denied. Admin only.');
       router.push('/');
-    } else {
-      fetchItems();
     }
-  }, [status, session, router]);
+  }, [status, isAdmin, router]);
 
-  const fetchItems = async () => {
+  // Totals come from the facet counts so they cover every item, not just the
+  // pages loaded so far.
+  const fetchStats = useCallback(async () => {
     try {
-      const res = await fetch('/api/items');
-      const data = await res.json();
-      setItems(data.items || []);
+      const res = await fetch('/api/items/facets');
+      const { facets } = await res.json();
+      setStats({
+        total: (facets?.status || []).reduce((sum, bucket) => sum + bucket.count, 0),
+        lost: countOf(facets?.status, 'Lost'),
+        found: countOf(facets?.status, 'Found'),
+        verified: countOf(facets?.verified, true),
+      });
     } catch (error) {
-      console.error('Failed to fetch items:', error);
-      toast.error('Failed to load items');
-    } finally {
-      setLoading(false);
+      console.error('Failed to fetch stats:', error);
     }
-  };
+  }, []);
+
+  useEffect(() => {
+    if (isAdmin) fetchStats();
+  }, [isAdmin, fetchStats]);
 
   const handleVerify = async (id, currentStatus) => {
     try {
@@ -59,7 +78,8 @@ export default function AdminPage() {
       if (!res.ok) throw new Error('Failed to update item');
 
       toast.success(`Item ${!currentStatus ? 'verified' : 'unverified'} successfully`);
-      fetchItems();
+      setItems((prev) => prev.map((item) => (item.id === id ? { ...item, verified: !currentStatus } : item)));
+      fetchStats();
     } catch (error) {
       console.error('Verify error:', error);
       toast.error(error.message);
@@ -77,14 +97,15 @@ export default function AdminPage() {
       if (!res.ok) throw new Error('Failed to delete item');
 
       toast.success('Item deleted successfully');
-      fetchItems();
+      setItems((prev) => prev.filter((item) => item.id !== id));
+      fetchStats();
     } catch (error) {
       console.error('Delete error:', error);
       toast.error(error.message);
     }
   };
 
-  if (status === 'loading' || loading) {
+  if (status === 'loading' || (loading && items.length === 0)) {
     return (
       <div className="min-h-screen bg-gradient-to-br from-gray-900 via-black to-gray-900 flex items-center justify-center">
         <div className="text-center">
@@ -109,9 +130,17 @@ export default function AdminPage() {
               <h1 className="text-4xl font-bold text-white mb-2">Admin Dashboard</h1>
               <p className="text-gray-400">Manage all lost and found items</p>
             </div>
-            <Badge className="bg-cyan-500/20 text-cyan-400 border-cyan-500 text-lg px-4 py-2">
-              {items.length} Total Items
-            </Badge>
+            <div className="flex items-center gap-3">
+              <Button asChild variant="outline" className="border-white/20 text-white hover:bg-white/10">
+                <a href="/api/items/export?format=csv">
+                  <Download className="w-4 h-4 mr-2" />
+                  Export CSV
+                </a>
+              </Button>
+              <Badge className="bg-cyan-500/20 text-cyan-400 border-cyan-500 text-lg px-4 py-2">
+                {stats.total} Total Items
+              </Badge>
+            </div>
           </div>
         </div>
 
@@ -122,7 +151,7 @@ export default function AdminPage() {
               <CardTitle className="text-sm text-gray-400">Total Items</CardTitle>
             </CardHeader>
             <CardContent>
-              <p className="text-3xl font-bold text-white">{items.length}</p>
+              <p className="text-3xl font-bold text-white">{stats.total}</p>
             </CardContent>
           </Card>
           <Card className="bg-white/5 backdrop-blur-md border-white/10">
@@ -131,7 +160,7 @@ export default function AdminPage() {
             </CardHeader>
             <CardContent>
               <p className="text-3xl font-bold text-red-400">
-                {items.filter(i => i.status === 'Lost').length}
+                {stats.lost}
               </p>
             </CardContent>
           </Card>
@@ -141,7 +170,7 @@ export default function AdminPage() {
             </CardHeader>
             <CardContent>
               <p className="text-3xl font-bold text-emerald-400">
-                {items.filter(i => i.status === 'Found').length}
+                {stats.found}
               </p>
             </CardContent>
           </Card>
@@ -151,7 +180,7 @@ export default function AdminPage() {
             </CardHeader>
             <CardContent>
               <p className="text-3xl font-bold text-cyan-400">
-                {items.filter(i => i.verified).length}
+                {stats.verified}
               </p>
             </CardContent>
           </Card>
@@ -169,73 +198,14 @@ export default function AdminPage() {
                 <p className="text-gray-400">No items found</p>
               </div>
             ) : (
-              <div className="overflow-x-auto">
-                <Table>
-                  <TableHeader>
-                    <TableRow className="border-white/10 hover:bg-white/5">
-                      <TableHead className="text-gray-300">Title</TableHead>
-                      <TableHead className="text-gray-300">Status</TableHead>
-                      <TableHead className="text-gray-300">Category</TableHead>
-                      <TableHead className="text-gray-300">Location</TableHead>
-                      <TableHead className="text-gray-300">Posted By</TableHead>
-                      <TableHead className="text-gray-300">Verified</TableHead>
-                      <TableHead className="text-gray-300">Actions</TableHead>
-                    </TableRow>
-                  </TableHeader>
-                  <TableBody>
-                    {items.map((item) => (
-                      <TableRow key={item.id} className="border-white/10 hover:bg-white/5">
-                        <TableCell className="text-white font-medium">
-                          <Link href={`/item/${item.id}`} className="hover:text-cyan-400">
-                            {item.title}
-                          </Link>
-                        </TableCell>
-                        <TableCell>
-                          <Badge
-                            variant="outline"
-                            className={`${
-                              item.status === 'Lost'
-                                ? 'border-red-500 text-red-400'
-                                : 'border-emerald-500 text-emerald-400'
-                            }`}
-                          >
-                            {item.status}
-                          </Badge>
-                        </TableCell>
-                        <TableCell className="text-gray-300">{item.category}</TableCell>
-                        <TableCell className="text-gray-300">{item.location}</TableCell>
-                        <TableCell className="text-gray-300">{item.userName}</TableCell>
-                        <TableCell>
-                          {item.verified ? (
-                            <CheckCircle className="w-5 h-5 text-emerald-400" />
-                          ) : (
-                            <XCircle className="w-5 h-5 text-gray-600" />
-                          )}
-                        </TableCell>
-                        <TableCell>
-                          <div className="flex gap-2">
-                            <Button
-                              size="sm"
-                              variant="outline"
-                              onClick={() => handleVerify(item.id, item.verified)}
-                              className="border-cyan-500 text-cyan-400 hover:bg-cyan-500 hover:text-white"
-                            >
-                              {item.verified ? 'Unverify' : 'Verify'}
-                            </Button>
-                            <Button
-                              size="sm"
-                              variant="destructive"
-                              onClick={() => handleDelete(item.id)}
-                            >
-                              <Trash2 className="w-4 h-4" />
-                            </Button>
-                          </div>
-                        </TableCell>
-                      </TableRow>
-                    ))}
-                  </TableBody>
-                </Table>
-              </div>
+              <AdminItemsTable
+                items={items}
+                hasMore={hasMore}
+                loading={loading}
+                loadMore={loadMore}
+                handleVerify={handleVerify}
+                handleDelete={handleDelete}
+              />
             )}
           </CardContent>
         </Card>
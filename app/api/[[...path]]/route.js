@@ -1,20 +1,32 @@
-import { MongoClient } from 'mongodb'
 import { v4 as uuidv4 } from 'uuid'
 import { NextResponse } from 'next/server'
+import { getDb } from '@/lib/mongodb'
+import { getWriteBuffer } from '@/lib/writeBuffer'
+import { ensureStatusIndexes, GRANULARITIES, queryRollups, recordRollups } from '@/lib/statusRollups'
 
-// MongoDB connection
-let client
-let db
-
+// MongoDB connection, shared with the rest of the app so the per-process
+// pool size (MONGO_MAX_POOL_SIZE) caps every connection this worker opens
 async function connectToMongo() {
-  if (!client) {
-    client = new MongoClient(process.env.MONGO_URL)
-    await client.connect()
-    db = client.db(process.env.DB_NAME)
-  }
+  const db = await getDb()
+  ensureStatusIndexes(db).catch((error) => console.error('Status index error:', error))
   return db
 }
 
+// Heartbeats are buffered in memory and written in batches
+function statusBuffer() {
+  return getWriteBuffer(
+    'status_checks',
+    async () => (await connectToMongo()).collection('status_checks'),
+    {
+      maxSize: parseInt(process.env.STATUS_BUFFER_MAX_SIZE || '500', 10),
+      maxDelayMs: parseInt(process.env.STATUS_BUFFER_FLUSH_MS || '1000', 10),
+      // Duplicates were stored by an earlier attempt whose flush never reached
+      // the rollups, so they are counted here too
+      onFlush: async (inserted, duplicates) => recordRollups(await connectToMongo(), [...inserted, ...duplicates])
+    }
+  )
+}
+
 // Helper function to handle CORS
 function handleCORS(response) {
   response.headers.set('Access-Control-Allow-Origin', process.env.CORS_ORIGINS || '*')
@@ -64,14 +76,43 @@ async function handleRoute(request, { params }) {
         timestamp: new Date()
       }
 
-      await db.collection('status_checks').insertOne(statusObj)
+      statusBuffer().push({ ...statusObj })
       return handleCORS(NextResponse.json(statusObj))
     }
 
+    // Status buffer stats - GET /api/status/buffer
+    if (route === '/status/buffer' && method === 'GET') {
+      return handleCORS(NextResponse.json(statusBuffer().getStats()))
+    }
+
+    // Status rollups - GET /api/status/rollups?client=&granularity=minute|hour&from=&to=
+    if (route === '/status/rollups' && method === 'GET') {
+      const { searchParams } = new URL(request.url)
+      const granularity = searchParams.get('granularity') || 'minute'
+      const from = searchParams.get('from') ? new Date(searchParams.get('from')) : null
+      const to = searchParams.get('to') ? new Date(searchParams.get('to')) : null
+
+      if (!GRANULARITIES[granularity] || (from && isNaN(from)) || (to && isNaN(to))) {
+        return handleCORS(NextResponse.json(
+          { error: "Invalid rollup parameters" },
+          { status: 400 }
+        ))
+      }
+
+      const rollups = await queryRollups(db, {
+        client: searchParams.get('client'),
+        granularity,
+        from,
+        to
+      })
+      return handleCORS(NextResponse.json(rollups))
+    }
+
     // Status endpoints - GET /api/status
     if (route === '/status' && method === 'GET') {
       const statusChecks = await db.collection('status_checks')
         .find({})
+        .sort({ timestamp: -1 })
         .limit(1000)
         .toArray()
 
@@ -1,6 +1,7 @@
 import NextAuth from 'next-auth';
 import CredentialsProvider from 'next-auth/providers/credentials';
 import { getUserByEmail, verifyPassword, getUserById } from '@/lib/auth';
+import { withAdmission } from '@/lib/admission';
 
 export const authOptions = {
   providers: [
@@ -65,4 +66,7 @@ export const authOptions = {
 
 const handler = NextAuth(authOptions);
 
-export { handler as GET, handler as POST };
+// Session reads are cheap and keep signed-in users working under load;
+// sign-ins (bcrypt) are the first to be shed.
+export const GET = withAdmission('read', handler);
+export const POST = withAdmission('auth', handler);
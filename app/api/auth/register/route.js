@@ -1,7 +1,8 @@
 import { NextResponse } from 'next/server';
 import { createUser } from '@/lib/auth';
+import { withAdmission } from '@/lib/admission';
 
-export async function POST(request) {
+export const POST = withAdmission('auth', async (request) => {
   try {
     const { email, password, name } = await request.json();
 
@@ -32,4 +33,4 @@ export async function POST(request) {
       { status: 500 }
     );
   }
-}
+});
@@ -0,0 +1,12 @@
+import { NextResponse } from 'next/server';
+
+export const dynamic = 'force-dynamic';
+
+// Liveness: the process is up and serving requests. No dependency checks, so
+// a slow database never gets a healthy instance restarted.
+export async function GET() {
+  return NextResponse.json(
+    { status: 'alive', uptime: process.uptime() },
+    { headers: { 'Cache-Control': 'no-store' } }
+  );
+}
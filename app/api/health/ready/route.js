@@ -0,0 +1,19 @@
+import { NextResponse } from 'next/server';
+import { getReadiness, startWarmup } from '@/lib/readiness';
+
+export const dynamic = 'force-dynamic';
+
+// Readiness: 200 only once Mongo is connected, indexes are verified and the
+// warmup requests have run; 503 until then so the orchestrator holds traffic.
+export async function GET() {
+  const readiness = getReadiness();
+
+  if (!readiness.ready) {
+    startWarmup();
+  }
+
+  return NextResponse.json(
+    { status: readiness.ready ? 'ready' : 'starting', ...readiness },
+    { status: readiness.ready ? 200 : 503, headers: { 'Cache-Control': 'no-store' } }
+  );
+}
@@ -2,12 +2,21 @@ import { NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '../../auth/[...nextauth]/route';
 import { getDb } from '@/lib/mongodb';
+import { reindexItem, unindexItem } from '@/lib/matching';
+import { invalidateFacets } from '@/lib/facets';
+import { findArchivedItem, locateItem } from '@/lib/archive';
+import { notifyItemUpdated } from '@/lib/notifications';
+import { rememberWrite, withReadSession, withWriteSession, writeTokenFrom } from '@/lib/consistency';
+import { withAdmission } from '@/lib/admission';
 
-export async function GET(request, { params }) {
+const MATCHED_FIELDS = ['title', 'description', 'category', 'status', 'location', 'date'];
+
+export const GET = withAdmission('read', async (request, { params }) => {
   try {
     const { id } = params;
-    const db = await getDb();
-    const item = await db.collection('items').findOne({ id });
+    const item = await withReadSession(writeTokenFrom(request), (db, session) =>
+      db.collection('items').findOne({ id }, { projection: { features: 0 }, session })
+    ) || await findArchivedItem(id, { features: 0 });
 
     if (!item) {
       return NextResponse.json(
@@ -24,9 +33,9 @@ export async function GET(request, { params }) {
       { status: 500 }
     );
   }
-}
+});
 
-export async function PUT(request, { params }) {
+export const PUT = withAdmission('write', async (request, { params }) => {
   try {
     const session = await getServerSession(authOptions);
 
@@ -39,9 +48,17 @@ export async function PUT(request, { params }) {
 
     const { id } = params;
     const body = await request.json();
+
+    if ('resolved' in body && typeof body.resolved !== 'boolean') {
+      return NextResponse.json(
+        { error: 'resolved must be a boolean' },
+        { status: 400 }
+      );
+    }
+
     const db = await getDb();
 
-    const item = await db.collection('items').findOne({ id });
+    const { item, collection } = await locateItem(db, id);
 
     if (!item) {
       return NextResponse.json(
@@ -62,16 +79,45 @@ export async function PUT(request, { params }) {
       ...body,
       updatedAt: new Date().toISOString()
     };
+    // Resolved items are archived on the next run regardless of age.
+    if (body.resolved === true && !item.resolved) updates.resolvedAt = updates.updatedAt;
+
+    const { result: updatedItem, token } = await withWriteSession(async (db, dbSession) => {
+      const items = db.collection(collection.collectionName);
+      await items.updateOne(
+        { id },
+        { $set: updates },
+        { session: dbSession }
+      );
+      return await items.findOne({ id }, { projection: { features: 0 }, session: dbSession });
+    });
 
-    await db.collection('items').updateOne(
-      { id },
-      { $set: updates }
-    );
+    // The archiver may have moved the item between the lookup and the write.
+    if (!updatedItem) {
+      return NextResponse.json(
+        { error: 'Item not found' },
+        { status: 404 }
+      );
+    }
 
-    const updatedItem = await db.collection('items').findOne({ id });
+    invalidateFacets();
+    notifyItemUpdated(item, updates, session.user);
+
+    // Edits to the matched fields change the item's features; like on
+    // creation, a scoring failure must not fail the update.
+    if (!updatedItem.archived && MATCHED_FIELDS.some((field) => field in body)) {
+      try {
+        updatedItem.matches = await reindexItem(item, updatedItem);
+      } catch (error) {
+        console.error('Match indexing error:', error);
+      }
+    }
 
-    return NextResponse.json(
-      { message: 'Item updated successfully', item: updatedItem }
+    return rememberWrite(
+      NextResponse.json(
+        { message: 'Item updated successfully', item: updatedItem }
+      ),
+      token
     );
   } catch (error) {
     console.error('Update item error:', error);
@@ -80,9 +126,9 @@ export async function PUT(request, { params }) {
       { status: 500 }
     );
   }
-}
+});
 
-export async function DELETE(request, { params }) {
+export const DELETE = withAdmission('write', async (request, { params }) => {
   try {
     const session = await getServerSession(authOptions);
 
@@ -96,7 +142,7 @@ export async function DELETE(request, { params }) {
     const { id } = params;
     const db = await getDb();
 
-    const item = await db.collection('items').findOne({ id });
+    const { item, collection } = await locateItem(db, id);
 
     if (!item) {
       return NextResponse.json(
@@ -113,10 +159,17 @@ export async function DELETE(request, { params }) {
       );
     }
 
-    await db.collection('items').deleteOne({ id });
-
-    return NextResponse.json(
-      { message: 'Item deleted successfully' }
+    const { token } = await withWriteSession((db, dbSession) =>
+      db.collection(collection.collectionName).deleteOne({ id }, { session: dbSession })
+    );
+    invalidateFacets();
+    await unindexItem(item);
+
+    return rememberWrite(
+      NextResponse.json(
+        { message: 'Item deleted successfully' }
+      ),
+      token
     );
   } catch (error) {
     console.error('Delete item error:', error);
@@ -125,4 +178,4 @@ export async function DELETE(request, { params }) {
       { status: 500 }
     );
   }
-}
+});
@@ -0,0 +1,48 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '../../auth/[...nextauth]/route';
+import { archiveItems } from '@/lib/archive';
+
+export async function POST(request) {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    if (session.user.role !== 'admin') {
+      return NextResponse.json(
+        { error: 'Forbidden' },
+        { status: 403 }
+      );
+    }
+
+    const body = await request.json().catch(() => ({}));
+    const options = { dryRun: body.dryRun === true };
+
+    if (body.maxAgeDays !== undefined) {
+      const maxAgeDays = Number(body.maxAgeDays);
+      if (!Number.isFinite(maxAgeDays) || maxAgeDays < 0) {
+        return NextResponse.json(
+          { error: 'maxAgeDays must be a non-negative number' },
+          { status: 400 }
+        );
+      }
+      options.maxAgeDays = maxAgeDays;
+    }
+
+    const report = await archiveItems(options);
+
+    return NextResponse.json({ message: 'Archive run finished', ...report });
+  } catch (error) {
+    console.error('Archive items error:', error);
+    return NextResponse.json(
+      { error: 'Failed to archive items' },
+      { status: 500 }
+    );
+  }
+}
@@ -0,0 +1,106 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { ObjectId } from 'mongodb';
+import { authOptions } from '../../auth/[...nextauth]/route';
+import { getDb } from '@/lib/mongodb';
+import { streamCursor } from '@/lib/streaming';
+import { findWithArchive } from '@/lib/archive';
+
+// Every row carries a `cursor` token (the document's _id). An interrupted
+// download resumes with `?after=<last cursor>`; the export walks _id in
+// ascending order across `items` and `items_archive` (archiving keeps the
+// _id), so the token stays valid while items move between them.
+const EXPORT_COLUMNS = [
+  'cursor', 'id', 'title', 'description', 'category', 'status', 'location', 'date',
+  'image', 'contactInfo', 'userId', 'userName', 'userEmail', 'verified', 'resolved', 'archived',
+  'createdAt', 'updatedAt'
+];
+
+const DATE_ONLY = /^\d{4}-\d{2}-\d{2}$/;
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// A bare `to` date includes that whole day, so it becomes an exclusive
+// bound at the following midnight.
+function parseDate(value, { endOfDay = false } = {}) {
+  if (!value) return null;
+  const date = new Date(value);
+  if (Number.isNaN(date.getTime())) return undefined;
+  if (endOfDay && DATE_ONLY.test(value)) return new Date(date.getTime() + DAY_MS).toISOString();
+  return date.toISOString();
+}
+
+export async function GET(request) {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    if (session.user.role !== 'admin') {
+      return NextResponse.json(
+        { error: 'Forbidden' },
+        { status: 403 }
+      );
+    }
+
+    const { searchParams } = new URL(request.url);
+    const format = searchParams.get('format') || 'csv';
+
+    if (format !== 'csv' && format !== 'ndjson') {
+      return NextResponse.json(
+        { error: 'Unsupported format' },
+        { status: 400 }
+      );
+    }
+
+    const from = parseDate(searchParams.get('from'));
+    const toParam = searchParams.get('to');
+    const to = parseDate(toParam, { endOfDay: true });
+    const after = searchParams.get('after');
+
+    if (from === undefined || to === undefined || (after && !ObjectId.isValid(after))) {
+      return NextResponse.json(
+        { error: 'Invalid export parameters' },
+        { status: 400 }
+      );
+    }
+
+    const query = {};
+    if (from || to) {
+      query.createdAt = {};
+      if (from) query.createdAt.$gte = from;
+      if (to) query.createdAt[DATE_ONLY.test(toParam) ? '$lt' : '$lte'] = to;
+    }
+
+    const status = searchParams.get('status');
+    const verified = searchParams.get('verified');
+    if (status && status !== 'all') query.status = status;
+    if (verified === 'true' || verified === 'false') query.verified = verified === 'true';
+    if (after) query._id = { $gt: new ObjectId(after) };
+
+    const db = await getDb();
+    const cursor = findWithArchive(db, query, {
+      projection: { features: 0, matches: 0 },
+      sort: { _id: 1 }
+    });
+
+    const filename = `items-export-${new Date().toISOString().slice(0, 10)}.${format}`;
+
+    return streamCursor(request, cursor, {
+      format,
+      columns: EXPORT_COLUMNS,
+      transform: ({ _id, ...item }) => ({ cursor: _id.toHexString(), ...item }),
+      headers: { 'Content-Disposition': `attachment; filename="${filename}"` }
+    });
+  } catch (error) {
+    console.error('Export items error:', error);
+    return NextResponse.json(
+      { error: 'Failed to export items' },
+      { status: 500 }
+    );
+  }
+}
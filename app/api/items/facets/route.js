@@ -0,0 +1,19 @@
+import { NextResponse } from 'next/server';
+import { getFacets } from '@/lib/facets';
+import { parseItemFilters } from '@/lib/items';
+import { withAdmission } from '@/lib/admission';
+
+export const GET = withAdmission('read', async (request) => {
+  try {
+    const { searchParams } = new URL(request.url);
+    const facets = await getFacets(parseItemFilters(searchParams));
+
+    return NextResponse.json({ facets });
+  } catch (error) {
+    console.error('Get facets error:', error);
+    return NextResponse.json(
+      { error: 'Failed to fetch facets' },
+      { status: 500 }
+    );
+  }
+});
@@ -0,0 +1,56 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '../../auth/[...nextauth]/route';
+import { importItems } from '@/lib/importer';
+import { withAdmission } from '@/lib/admission';
+
+export const POST = withAdmission('write', async (request) => {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    if (session.user.role !== 'admin') {
+      return NextResponse.json(
+        { error: 'Forbidden' },
+        { status: 403 }
+      );
+    }
+
+    const { searchParams } = new URL(request.url);
+    const contentType = request.headers.get('content-type') || '';
+    const format = searchParams.get('format') || (contentType.includes('csv') ? 'csv' : 'ndjson');
+
+    if (format !== 'csv' && format !== 'ndjson') {
+      return NextResponse.json(
+        { error: 'Unsupported format' },
+        { status: 400 }
+      );
+    }
+
+    if (!request.body) {
+      return NextResponse.json(
+        { error: 'Empty request body' },
+        { status: 400 }
+      );
+    }
+
+    const report = await importItems(request.body, format, session.user);
+
+    return NextResponse.json(
+      { message: 'Import finished', ...report },
+      { status: report.inserted > 0 ? 201 : 200 }
+    );
+  } catch (error) {
+    console.error('Import items error:', error);
+    return NextResponse.json(
+      { error: 'Failed to import items' },
+      { status: 500 }
+    );
+  }
+});
@@ -0,0 +1,64 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { ObjectId } from 'mongodb';
+import { authOptions } from '../../auth/[...nextauth]/route';
+import { backfillMatching } from '@/lib/matching';
+
+export async function POST(request) {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    if (session.user.role !== 'admin') {
+      return NextResponse.json(
+        { error: 'Forbidden' },
+        { status: 403 }
+      );
+    }
+
+    const body = await request.json().catch(() => ({}));
+    const options = {};
+
+    if (body.batchSize !== undefined) {
+      const batchSize = Number(body.batchSize);
+      if (!Number.isInteger(batchSize) || batchSize < 1) {
+        return NextResponse.json(
+          { error: 'batchSize must be a positive integer' },
+          { status: 400 }
+        );
+      }
+      options.batchSize = batchSize;
+    }
+
+    if (body.after !== undefined && body.after !== null) {
+      if (!ObjectId.isValid(body.after)) {
+        return NextResponse.json(
+          { error: 'after must be a cursor returned by a previous call' },
+          { status: 400 }
+        );
+      }
+      options.after = new ObjectId(body.after);
+    }
+
+    // One batch per request; call again with `after: nextCursor` until it
+    // comes back null.
+    const report = await backfillMatching(options);
+
+    return NextResponse.json({
+      message: report.nextCursor ? 'Match backfill batch finished' : 'Match backfill finished',
+      ...report
+    });
+  } catch (error) {
+    console.error('Match backfill error:', error);
+    return NextResponse.json(
+      { error: 'Failed to backfill matches' },
+      { status: 500 }
+    );
+  }
+}
@@ -1,41 +1,87 @@
 import { NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '../auth/[...nextauth]/route';
-import { getDb } from '@/lib/mongodb';
-import { v4 as uuidv4 } from 'uuid';
+import { getReadDb } from '@/lib/mongodb';
+import { indexItem } from '@/lib/matching';
+import { getFacets, invalidateFacets } from '@/lib/facets';
+import { buildItem, buildItemQuery, filtersCacheKey, missingItemFields, parseItemFilters, parsePagination } from '@/lib/items';
+import { requestedStreamFormat, streamCursor } from '@/lib/streaming';
+import { findWithArchive } from '@/lib/archive';
+import { notifyMatches } from '@/lib/notifications';
+import { enqueueSavedSearchMatch } from '@/lib/savedSearches';
+import { withIdempotency } from '@/lib/idempotency';
+import { rememberWrite, withReadSession, withWriteSession, writeTokenFrom } from '@/lib/consistency';
+import { withAdmission } from '@/lib/admission';
+import { singleFlight } from '@/lib/singleFlight';
 
-export async function GET(request) {
+function findItems(db, query, { includeArchived, skip, limit, session }) {
+  return includeArchived
+    ? findWithArchive(db, query, {
+      projection: { features: 0 },
+      sort: { createdAt: -1 },
+      skip,
+      limit,
+      session
+    })
+    : db.collection('items')
+      .find(query, { projection: { features: 0 }, session })
+      .sort({ createdAt: -1 })
+      .skip(skip || 0)
+      .limit(limit);
+}
+
+export const GET = withAdmission('read', async (request) => {
   try {
-    const db = await getDb();
     const { searchParams } = new URL(request.url);
-    
-    const query = {};
-    const search = searchParams.get('search');
-    const category = searchParams.get('category');
-    const location = searchParams.get('location');
-    const status = searchParams.get('status');
-    const verified = searchParams.get('verified');
-
-    if (search) {
-      query.$or = [
-        { title: { $regex: search, $options: 'i' } },
-        { description: { $regex: search, $options: 'i' } },
-        { location: { $regex: search, $options: 'i' } },
-        { category: { $regex: search, $options: 'i' } }
-      ];
+
+    const filters = parseItemFilters(searchParams);
+    const query = buildItemQuery(filters);
+    const pagination = parsePagination(searchParams);
+
+    const streamFormat = requestedStreamFormat(request, searchParams);
+    const includeArchived = searchParams.get('includeArchived') === 'true';
+
+    // Fetch one extra document when paginating to know whether another page exists.
+    const limit = pagination ? pagination.limit + (streamFormat ? 0 : 1) : 0;
+    const options = { includeArchived, skip: pagination?.skip, limit };
+
+    // Streams outlive this handler, so they read without a causal session.
+    if (streamFormat) {
+      const db = await getReadDb();
+      return streamCursor(request, findItems(db, query, options), { format: streamFormat });
     }
 
-    if (category && category !== 'all') query.category = category;
-    if (location && location !== 'all') query.location = location;
-    if (status && status !== 'all') query.status = status;
-    if (verified === 'true') query.verified = true;
+    const withFacets = searchParams.get('facets') === 'true';
+    const writeToken = writeTokenFrom(request);
 
-    const items = await db.collection('items')
-      .find(query)
-      .sort({ createdAt: -1 })
-      .toArray();
+    const loadBody = async () => {
+      const [items, facets] = await Promise.all([
+        withReadSession(writeToken, (db, session) =>
+          findItems(db, query, { ...options, session }).toArray()
+        ),
+        withFacets ? getFacets(filters) : null
+      ]);
 
-    return NextResponse.json({ items });
+      const body = { items };
+      if (pagination) {
+        body.hasMore = items.length > pagination.limit;
+        body.items = items.slice(0, pagination.limit);
+        body.page = pagination.page;
+        body.limit = pagination.limit;
+      }
+      if (facets) body.facets = facets;
+      return JSON.stringify(body);
+    };
+
+    // Identical concurrent listings share one query and one serialized body.
+    // Readers holding a write token need their own causal read, so they
+    // are not coalesced.
+    const key = JSON.stringify([filtersCacheKey(filters), pagination?.page, pagination?.limit, includeArchived, withFacets]);
+    const payload = writeToken ? await loadBody() : await singleFlight('items', key, loadBody);
+
+    return new NextResponse(payload, {
+      headers: { 'Content-Type': 'application/json' }
+    });
   } catch (error) {
     console.error('Get items error:', error);
     return NextResponse.json(
@@ -43,9 +89,9 @@ export async function GET(request) {
       { status: 500 }
     );
   }
-}
+});
 
-export async function POST(request) {
+export const POST = withAdmission('write', async (request) => {
   try {
     const session = await getServerSession(authOptions);
 
@@ -57,38 +103,44 @@ export async function POST(request) {
     }
 
     const body = await request.json();
-    const { title, description, category, status, location, date, image, contactInfo } = body;
 
-    if (!title || !description || !category || !status || !location || !date) {
+    if (missingItemFields(body).length > 0) {
       return NextResponse.json(
         { error: 'Missing required fields' },
         { status: 400 }
       );
     }
 
-    const db = await getDb();
-    const item = {
-      id: uuidv4(),
-      title,
-      description,
-      category,
-      status,
-      location,
-      date,
-      image: image || null,
-      contactInfo: contactInfo || session.user.email,
-      userId: session.user.id,
-      userName: session.user.name,
-      userEmail: session.user.email,
-      verified: false,
-      createdAt: new Date().toISOString()
-    };
+    // Client retries with the same Idempotency-Key get the first response
+    // back instead of creating a duplicate item.
+    return await withIdempotency(
+      request,
+      { scope: 'items', userId: session.user.id, fingerprint: body },
+      async () => {
+        const item = buildItem(body, session.user);
 
-    await db.collection('items').insertOne(item);
+        const { token } = await withWriteSession((db, dbSession) =>
+          db.collection('items').insertOne(item, { session: dbSession })
+        );
+        invalidateFacets();
+        enqueueSavedSearchMatch(item);
 
-    return NextResponse.json(
-      { message: 'Item created successfully', item },
-      { status: 201 }
+        // Matching is best-effort; a scoring failure must not fail the report itself.
+        try {
+          item.matches = await indexItem(item);
+          await notifyMatches(item, item.matches);
+        } catch (error) {
+          console.error('Match indexing error:', error);
+        }
+
+        return rememberWrite(
+          NextResponse.json(
+            { message: 'Item created successfully', item },
+            { status: 201 }
+          ),
+          token
+        );
+      }
     );
   } catch (error) {
     console.error('Create item error:', error);
@@ -97,4 +149,4 @@ export async function POST(request) {
       { status: 500 }
     );
   }
-}
+});
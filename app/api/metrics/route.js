@@ -0,0 +1,27 @@
+import { NextResponse } from 'next/server';
+import { renderMetrics, startHttpMetrics, startRuntimeMetrics } from '@/lib/metrics';
+
+export const dynamic = 'force-dynamic';
+
+// Prometheus scrape endpoint. When METRICS_TOKEN is set, scrapers must send
+// it as a bearer token.
+export async function GET(request) {
+  const token = process.env.METRICS_TOKEN;
+  if (token && request.headers.get('authorization') !== `Bearer ${token}`) {
+    return NextResponse.json(
+      { error: 'Unauthorized' },
+      { status: 401 }
+    );
+  }
+
+  // Normally started from instrumentation.js; a no-op once running.
+  startHttpMetrics();
+  startRuntimeMetrics();
+
+  return new NextResponse(renderMetrics(), {
+    headers: {
+      'Content-Type': 'text/plain; version=0.0.4; charset=utf-8',
+      'Cache-Control': 'no-store'
+    }
+  });
+}
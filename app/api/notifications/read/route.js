@@ -0,0 +1,45 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '../../auth/[...nextauth]/route';
+import { markRead } from '@/lib/notifications';
+import { withAdmission } from '@/lib/admission';
+
+// POST /api/notifications/read with { ids: [...] } or { all: true }
+export const POST = withAdmission('write', async (request) => {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    const body = await request.json();
+
+    if ('all' in body && typeof body.all !== 'boolean') {
+      return NextResponse.json(
+        { error: 'all must be a boolean' },
+        { status: 400 }
+      );
+    }
+
+    if (!body.all && !Array.isArray(body.ids)) {
+      return NextResponse.json(
+        { error: 'Provide ids or all' },
+        { status: 400 }
+      );
+    }
+
+    const unread = await markRead(session.user.id, { ids: body.ids, all: body.all === true });
+
+    return NextResponse.json({ unread });
+  } catch (error) {
+    console.error('Mark notifications read error:', error);
+    return NextResponse.json(
+      { error: 'Failed to update notifications' },
+      { status: 500 }
+    );
+  }
+});
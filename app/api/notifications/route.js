@@ -0,0 +1,30 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '../auth/[...nextauth]/route';
+import { listNotifications, parseInboxParams } from '@/lib/notifications';
+import { withAdmission } from '@/lib/admission';
+
+// GET /api/notifications?limit=&cursor=&unread=true
+export const GET = withAdmission('read', async (request) => {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    const { searchParams } = new URL(request.url);
+    const page = await listNotifications(session.user.id, parseInboxParams(searchParams));
+
+    return NextResponse.json(page);
+  } catch (error) {
+    console.error('Get notifications error:', error);
+    return NextResponse.json(
+      { error: 'Failed to fetch notifications' },
+      { status: 500 }
+    );
+  }
+});
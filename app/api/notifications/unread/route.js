@@ -0,0 +1,31 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '../../auth/[...nextauth]/route';
+import { getUnreadCount } from '@/lib/notifications';
+import { withAdmission } from '@/lib/admission';
+
+export const GET = withAdmission('read', async () => {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    const unread = await getUnreadCount(session.user.id);
+
+    return NextResponse.json(
+      { unread },
+      { headers: { 'Cache-Control': 'private, no-cache' } }
+    );
+  } catch (error) {
+    console.error('Get unread count error:', error);
+    return NextResponse.json(
+      { error: 'Failed to fetch unread count' },
+      { status: 500 }
+    );
+  }
+});
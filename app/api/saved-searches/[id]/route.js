@@ -0,0 +1,37 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '../../auth/[...nextauth]/route';
+import { deleteSavedSearch } from '@/lib/savedSearches';
+import { withAdmission } from '@/lib/admission';
+
+export const DELETE = withAdmission('write', async (request, { params }) => {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    const deleted = await deleteSavedSearch(session.user.id, params.id);
+
+    if (!deleted) {
+      return NextResponse.json(
+        { error: 'Saved search not found' },
+        { status: 404 }
+      );
+    }
+
+    return NextResponse.json(
+      { message: 'Saved search deleted successfully' }
+    );
+  } catch (error) {
+    console.error('Delete saved search error:', error);
+    return NextResponse.json(
+      { error: 'Failed to delete saved search' },
+      { status: 500 }
+    );
+  }
+});
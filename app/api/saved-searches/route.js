@@ -0,0 +1,60 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '../auth/[...nextauth]/route';
+import { SavedSearchError, createSavedSearch, listSavedSearches, parseSavedSearch } from '@/lib/savedSearches';
+import { withAdmission } from '@/lib/admission';
+
+export const GET = withAdmission('read', async () => {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    const savedSearches = await listSavedSearches(session.user.id);
+
+    return NextResponse.json({ savedSearches });
+  } catch (error) {
+    console.error('Get saved searches error:', error);
+    return NextResponse.json(
+      { error: 'Failed to fetch saved searches' },
+      { status: 500 }
+    );
+  }
+});
+
+// POST /api/saved-searches with the `GET /api/items` filters:
+// { search, category, location, status, name? }
+export const POST = withAdmission('write', async (request) => {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    const body = await request.json();
+    const savedSearch = await createSavedSearch(session.user, parseSavedSearch(body), body.name);
+
+    return NextResponse.json(
+      { message: 'Search saved successfully', savedSearch },
+      { status: 201 }
+    );
+  } catch (error) {
+    if (error instanceof SavedSearchError) {
+      return NextResponse.json({ error: error.message }, { status: error.status });
+    }
+    console.error('Create saved search error:', error);
+    return NextResponse.json(
+      { error: 'Failed to save search' },
+      { status: 500 }
+    );
+  }
+});
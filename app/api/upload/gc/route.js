@@ -0,0 +1,49 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '../../auth/[...nextauth]/route';
+import { collectOrphanedUploads } from '@/lib/uploadGc';
+
+export async function POST(request) {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    if (session.user.role !== 'admin') {
+      return NextResponse.json(
+        { error: 'Forbidden' },
+        { status: 403 }
+      );
+    }
+
+    const body = await request.json().catch(() => ({}));
+    // Dry run unless the caller explicitly opts into deleting files.
+    const options = { dryRun: body.dryRun !== false };
+
+    if (body.graceHours !== undefined) {
+      const graceHours = Number(body.graceHours);
+      if (!Number.isFinite(graceHours) || graceHours < 0) {
+        return NextResponse.json(
+          { error: 'graceHours must be a non-negative number' },
+          { status: 400 }
+        );
+      }
+      options.graceHours = graceHours;
+    }
+
+    const report = await collectOrphanedUploads(options);
+
+    return NextResponse.json({ message: 'Upload GC finished', ...report });
+  } catch (error) {
+    console.error('Upload GC error:', error);
+    return NextResponse.json(
+      { error: 'Failed to collect uploads' },
+      { status: 500 }
+    );
+  }
+}
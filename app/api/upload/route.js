@@ -4,9 +4,14 @@ import { authOptions } from '../auth/[...nextauth]/route';
 import { writeFile, mkdir } from 'fs/promises';
 import { existsSync } from 'fs';
 import path from 'path';
+import { createHash } from 'crypto';
 import { v4 as uuidv4 } from 'uuid';
+import { UPLOAD_DIR, uploadUrl } from '@/lib/uploads';
+import { withIdempotency } from '@/lib/idempotency';
+import { trackUploadBytes } from '@/lib/metrics';
+import { withAdmission } from '@/lib/admission';
 
-export async function POST(request) {
+export const POST = withAdmission('upload', async (request) => {
   try {
     const session = await getServerSession(authOptions);
 
@@ -27,32 +32,50 @@ export async function POST(request) {
       );
     }
 
-    const bytes = await file.arrayBuffer();
-    const buffer = Buffer.from(bytes);
+    // The multipart body is held in memory until the file is written.
+    trackUploadBytes(file.size);
+    try {
+      const bytes = await file.arrayBuffer();
+      const buffer = Buffer.from(bytes);
+      const fingerprint = {
+        name: file.name,
+        size: buffer.length,
+        sha256: createHash('sha256').update(buffer).digest('hex')
+      };
 
-    // Create uploads directory if it doesn't exist
-    const uploadDir = path.join(process.cwd(), 'public', 'uploads');
-    if (!existsSync(uploadDir)) {
-      await mkdir(uploadDir, { recursive: true });
-    }
+      // A retried upload with the same Idempotency-Key returns the first URL
+      // instead of writing another copy of the file.
+      return await withIdempotency(
+        request,
+        { scope: 'upload', userId: session.user.id, fingerprint },
+        async () => {
+          // Create uploads directory if it doesn't exist
+          if (!existsSync(UPLOAD_DIR)) {
+            await mkdir(UPLOAD_DIR, { recursive: true });
+          }
 
-    // Generate unique filename
-    const fileExt = path.extname(file.name);
-    const filename = `${uuidv4()}${fileExt}`;
-    const filepath = path.join(uploadDir, filename);
+          // Generate unique filename
+          const fileExt = path.extname(file.name);
+          const filename = `${uuidv4()}${fileExt}`;
+          const filepath = path.join(UPLOAD_DIR, filename);
 
-    // Write file
-    await writeFile(filepath, buffer);
+          // Write file
+          await writeFile(filepath, buffer);
 
-    const fileUrl = `/uploads/${filename}`;
+          const fileUrl = uploadUrl(filename);
 
-    return NextResponse.json(
-      { 
-        message: 'File uploaded successfully',
-        url: fileUrl
-      },
-      { status: 200 }
-    );
+          return NextResponse.json(
+            { 
+              message: 'File uploaded successfully',
+              url: fileUrl
+            },
+            { status: 200 }
+          );
+        }
+      );
+    } finally {
+      trackUploadBytes(-file.size);
+    }
   } catch (error) {
     console.error('Upload error:', error);
     return NextResponse.json(
@@ -60,4 +83,4 @@ export async function POST(request) {
       { status: 500 }
     );
   }
-}
+});
@@ -0,0 +1,98 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '../../../auth/[...nextauth]/route';
+import {
+  TUS_VERSION,
+  UploadError,
+  abortUpload,
+  appendToUpload,
+  getUploadSession
+} from '@/lib/resumableUploads';
+import { withAdmission } from '@/lib/admission';
+
+function offsetHeaders(upload) {
+  return {
+    'Upload-Offset': String(upload.offset),
+    'Upload-Length': String(upload.length),
+    'Tus-Resumable': TUS_VERSION,
+    'Cache-Control': 'no-store'
+  };
+}
+
+function errorResponse(error, fallback) {
+  if (error instanceof UploadError) {
+    return NextResponse.json({ error: error.message }, { status: error.status });
+  }
+  console.error(`${fallback}:`, error);
+  return NextResponse.json({ error: fallback }, { status: 500 });
+}
+
+async function requireSession() {
+  const session = await getServerSession(authOptions);
+  if (!session) throw new UploadError('Unauthorized', 401);
+  return session;
+}
+
+// HEAD reports the committed offset so an interrupted client can resume.
+export const HEAD = withAdmission('read', async (request, { params }) => {
+  try {
+    const session = await requireSession();
+    const upload = await getUploadSession(params.id, session.user);
+    return new Response(null, { status: 200, headers: offsetHeaders(upload) });
+  } catch (error) {
+    return new Response(null, { status: error instanceof UploadError ? error.status : 500 });
+  }
+});
+
+export const GET = withAdmission('read', async (request, { params }) => {
+  try {
+    const session = await requireSession();
+    const upload = await getUploadSession(params.id, session.user);
+    return NextResponse.json(
+      { id: upload.id, offset: upload.offset, length: upload.length, url: upload.url },
+      { headers: offsetHeaders(upload) }
+    );
+  } catch (error) {
+    return errorResponse(error, 'Failed to fetch upload session');
+  }
+});
+
+export const PATCH = withAdmission('upload', async (request, { params }) => {
+  try {
+    const session = await requireSession();
+    const offset = parseInt(request.headers.get('upload-offset'), 10);
+
+    if (!Number.isInteger(offset) || offset < 0) {
+      return NextResponse.json(
+        { error: 'Upload-Offset header is required' },
+        { status: 400 }
+      );
+    }
+
+    if (!request.body) {
+      return NextResponse.json(
+        { error: 'Empty request body' },
+        { status: 400 }
+      );
+    }
+
+    const result = await appendToUpload(params.id, session.user, offset, request.body);
+
+    return NextResponse.json(
+      { ...result, message: result.url ? 'File uploaded successfully' : 'Chunk accepted' },
+      { status: 200, headers: offsetHeaders(result) }
+    );
+  } catch (error) {
+    return errorResponse(error, 'Failed to append upload');
+  }
+}, { inProgress: true });
+
+export const DELETE = withAdmission('write', async (request, { params }) => {
+  try {
+    const session = await requireSession();
+    await abortUpload(params.id, session.user);
+    return NextResponse.json({ message: 'Upload aborted' });
+  } catch (error) {
+    return errorResponse(error, 'Failed to abort upload');
+  }
+});
@@ -0,0 +1,48 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '../../auth/[...nextauth]/route';
+import { TUS_VERSION, UploadError, createUploadSession } from '@/lib/resumableUploads';
+import { withAdmission } from '@/lib/admission';
+
+// Creates a resumable upload session. The length comes from the tus
+// `Upload-Length` header or a JSON body `{ filename, size }`.
+export const POST = withAdmission('upload', async (request) => {
+  try {
+    const session = await getServerSession(authOptions);
+
+    if (!session) {
+      return NextResponse.json(
+        { error: 'Unauthorized' },
+        { status: 401 }
+      );
+    }
+
+    const body = await request.json().catch(() => ({}));
+    const length = parseInt(request.headers.get('upload-length') ?? body.size, 10);
+
+    const upload = await createUploadSession({ filename: body.filename, length }, session.user);
+    const location = `/api/upload/sessions/${upload.id}`;
+
+    return NextResponse.json(
+      { id: upload.id, offset: upload.offset, length: upload.length, location },
+      {
+        status: 201,
+        headers: {
+          Location: location,
+          'Upload-Offset': String(upload.offset),
+          'Upload-Length': String(upload.length),
+          'Tus-Resumable': TUS_VERSION
+        }
+      }
+    );
+  } catch (error) {
+    if (error instanceof UploadError) {
+      return NextResponse.json({ error: error.message }, { status: error.status });
+    }
+    console.error('Create upload session error:', error);
+    return NextResponse.json(
+      { error: 'Failed to create upload session' },
+      { status: 500 }
+    );
+  }
+});
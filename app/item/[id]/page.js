@@ -6,7 +6,7 @@ import { useRouter, useParams } from 'next/navigation';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
-import { Package, MapPin, Calendar, Mail, User, ArrowLeft, Edit, Trash2 } from 'lucide-react';
+import { Package, MapPin, Calendar, Mail, User, ArrowLeft, Edit, Trash2, CheckCircle } from 'lucide-react';
 import Link from 'next/link';
 import Image from 'next/image';
 import { toast } from 'sonner';
@@ -38,6 +38,25 @@ export default function ItemDetailPage() {
     }
   };
 
+  const handleResolve = async () => {
+    try {
+      const res = await fetch(`/api/items/${params.id}`, {
+        method: 'PUT',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ resolved: true }),
+      });
+
+      if (!res.ok) throw new Error('Failed to update item');
+
+      const data = await res.json();
+      setItem(data.item);
+      toast.success('Item marked as resolved');
+    } catch (error) {
+      console.error('Resolve error:', error);
+      toast.error(error.message);
+    }
+  };
+
   const handleDelete = async () => {
     if (!confirm('Are you sure you want to delete this item?')) return;
 
@@ -133,6 +152,11 @@ export default function ItemDetailPage() {
                     Verified by Admin
                   </Badge>
                 )}
+                {item.resolved && (
+                  <Badge className="bg-cyan-500/20 text-cyan-400 border-cyan-500 w-fit">
+                    Resolved
+                  </Badge>
+                )}
               </CardHeader>
               <CardContent className="space-y-6">
                 {/* Description */}
@@ -179,6 +203,16 @@ export default function ItemDetailPage() {
                 {/* Action Buttons */}
                 {canEdit && (
                   <div className="pt-4 border-t border-white/10 flex gap-3">
+                    {!item.resolved && (
+                      <Button
+                        onClick={handleResolve}
+                        variant="outline"
+                        className="flex-1"
+                      >
+                        <CheckCircle className="w-4 h-4 mr-2" />
+                        Mark as Resolved
+                      </Button>
+                    )}
                     <Button
                       onClick={handleDelete}
                       variant="destructive"
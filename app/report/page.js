@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { useSession } from 'next-auth/react';
 import { useRouter, useSearchParams } from 'next/navigation';
 import { Button } from '@/components/ui/button';
@@ -12,6 +12,9 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@
 import { Package, Upload, ArrowLeft } from 'lucide-react';
 import Link from 'next/link';
 import { toast } from 'sonner';
+import { v4 as uuidv4 } from 'uuid';
+import { uploadResumable } from '@/lib/uploadClient';
+import { downscaleImage } from '@/lib/imageResize';
 
 export default function ReportPage() {
   const { data: session, status } = useSession();
@@ -31,6 +34,10 @@ export default function ReportPage() {
   const [file, setFile] = useState(null);
   const [preview, setPreview] = useState(null);
   const [loading, setLoading] = useState(false);
+  const [processing, setProcessing] = useState(false);
+  // Resubmitting the same report reuses its Idempotency-Key, so a retry after
+  // a timeout cannot create a second listing.
+  const submission = useRef({ fields: null, file: null, imageUrl: null, key: null });
 
   useEffect(() => {
     if (status === 'unauthenticated') {
@@ -44,15 +51,24 @@ export default function ReportPage() {
     }
   }, [session]);
 
-  const handleFileChange = (e) => {
+  // Object URLs hold the blob alive until revoked.
+  useEffect(() => {
+    return () => {
+      if (preview) URL.revokeObjectURL(preview);
+    };
+  }, [preview]);
+
+  const handleFileChange = async (e) => {
     const selectedFile = e.target.files?.[0];
     if (selectedFile) {
-      setFile(selectedFile);
-      const reader = new FileReader();
-      reader.onloadend = () => {
-        setPreview(reader.result);
-      };
-      reader.readAsDataURL(selectedFile);
+      setProcessing(true);
+      try {
+        const resized = await downscaleImage(selectedFile);
+        setFile(resized);
+        setPreview(URL.createObjectURL(resized));
+      } finally {
+        setProcessing(false);
+      }
     }
   };
 
@@ -61,34 +77,31 @@ export default function ReportPage() {
     setLoading(true);
 
     try {
-      let imageUrl = null;
+      // A resubmit of the same fields and photo reuses the key and the
+      // already uploaded image, so a retry never creates a second item.
+      const fields = JSON.stringify(formData);
+      if (submission.current.fields !== fields || submission.current.file !== file) {
+        submission.current = { fields, file, imageUrl: null, key: uuidv4() };
+      }
 
       // Upload image if present
-      if (file) {
-        const uploadFormData = new FormData();
-        uploadFormData.append('file', file);
-
-        const uploadRes = await fetch('/api/upload', {
-          method: 'POST',
-          body: uploadFormData,
-        });
-
-        if (!uploadRes.ok) {
-          throw new Error('Failed to upload image');
-        }
-
-        const uploadData = await uploadRes.json();
-        imageUrl = uploadData.url;
+      if (file && !submission.current.imageUrl) {
+        submission.current.imageUrl = await uploadResumable(file);
       }
 
       // Create item
+      const payload = JSON.stringify({
+        ...formData,
+        image: submission.current.imageUrl,
+      });
+
       const res = await fetch('/api/items', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          ...formData,
-          image: imageUrl,
-        }),
+        headers: {
+          'Content-Type': 'application/json',
+          'Idempotency-Key': submission.current.key,
+        },
+        body: payload,
       });
 
       if (!res.ok) {
@@ -294,8 +307,12 @@ export default function ReportPage() {
                         type="file"
                         accept="image/*"
                         onChange={handleFileChange}
+                        disabled={processing}
                         className="mt-4"
                       />
+                      {processing && (
+                        <p className="text-sm text-gray-400 mt-2">Optimizing image...</p>
+                      )}
                     </div>
                   )}
                 </div>
@@ -304,7 +321,7 @@ export default function ReportPage() {
               {/* Submit Button */}
               <Button
                 type="submit"
-                disabled={loading}
+                disabled={loading || processing}
                 className="w-full bg-gradient-to-r from-cyan-500 to-emerald-500 hover:from-cyan-600 hover:to-emerald-600 text-white py-6 text-lg"
               >
                 {loading ? 'Submitting...' : 'Submit Report'}
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Lost & Found Backend API Testing Suite - SDK Version
+Runs the backend checks through the async lostfound_client package
+"""
+
+import asyncio
+import os
+
+from lostfound_client import APIError, AuthenticationError, ItemInput, LostFoundClient
+
+# Configuration
+BASE_URL = os.environ.get("LOSTFOUND_BASE_URL", "https://recoverhub-4.preview.emergentagent.com")
+
+# Test data
+ADMIN_EMAIL = "admin@lostandfound.com"
+ADMIN_PASSWORD = "admin123456"
+ADMIN_NAME = "Admin User"
+
+REGULAR_EMAIL = "john.doe@example.com"
+REGULAR_PASSWORD = "password123"
+REGULAR_NAME = "John Doe"
+
+# 1x1 transparent PNG
+PNG_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+class LostFoundSDKTester:
+    def __init__(self):
+        self.admin = None
+        self.regular = None
+        self.test_item_id = None
+        self.uploaded_file_url = None
+
+    def log_test(self, test_name, success, message=""):
+        status = "✅ PASS" if success else "❌ FAIL"
+        print(f"{status} {test_name}")
+        if message:
+            print(f"   {message}")
+        print()
+
+    async def test_user_registration(self):
+        """Test 1: User Registration (existing users are fine)"""
+        print("=== Testing User Registration ===")
+        async with LostFoundClient(BASE_URL) as client:
+            for email, password, name in (
+                (REGULAR_EMAIL, REGULAR_PASSWORD, REGULAR_NAME),
+                (ADMIN_EMAIL, ADMIN_PASSWORD, ADMIN_NAME),
+            ):
+                try:
+                    user = await client.register(email, password, name)
+                    self.log_test(f"Register {email}", True, f"User created with role: {user.role}")
+                except APIError as e:
+                    self.log_test(f"Register {email}", e.status_code == 400, f"{e.status_code}: {e.message}")
+
+    async def test_nextauth_login(self):
+        """Test 2: NextAuth login for both roles"""
+        print("=== Testing NextAuth Login ===")
+        self.regular = LostFoundClient(BASE_URL, REGULAR_EMAIL, REGULAR_PASSWORD)
+        self.admin = LostFoundClient(BASE_URL, ADMIN_EMAIL, ADMIN_PASSWORD)
+
+        for label, client in (("Regular", self.regular), ("Admin", self.admin)):
+            try:
+                user = await client.login()
+                self.log_test(f"{label} User Login", True, f"Logged in as {user.email} ({user.role})")
+            except AuthenticationError as e:
+                self.log_test(f"{label} User Login", False, str(e))
+
+        async with LostFoundClient(BASE_URL) as anonymous:
+            try:
+                await anonymous.login(REGULAR_EMAIL, "wrong-password")
+                self.log_test("Invalid Credentials Rejected", False, "Login unexpectedly succeeded")
+            except AuthenticationError:
+                self.log_test("Invalid Credentials Rejected", True)
+
+    async def test_file_upload(self):
+        """Test 3: File upload"""
+        print("=== Testing File Upload ===")
+        try:
+            self.uploaded_file_url = await self.regular.upload(PNG_BYTES, "test.png", "image/png")
+            self.log_test("File Upload", self.uploaded_file_url.startswith("/uploads/"), self.uploaded_file_url)
+        except APIError as e:
+            self.log_test("File Upload", False, str(e))
+
+    async def test_create_item(self):
+        """Test 4: Item creation, including concurrent and idempotent creates"""
+        print("=== Testing Item Creation ===")
+        item = ItemInput(
+            title="Lost iPhone 14",
+            description="Black iPhone 14 with cracked screen protector",
+            category="Electronics",
+            status="lost",
+            location="Central Library",
+            date="2024-01-15",
+            image=self.uploaded_file_url,
+        )
+        try:
+            created = await self.regular.create_item(item)
+            self.test_item_id = created.id
+            self.log_test("Create Item", True, f"Item created with ID: {created.id}")
+        except APIError as e:
+            self.log_test("Create Item", False, str(e))
+
+        try:
+            first, second = await asyncio.gather(
+                self.regular.create_item(item, idempotency_key="sdk-tester-duplicate"),
+                self.regular.create_item(item, idempotency_key="sdk-tester-duplicate"),
+            )
+            self.log_test("Idempotent Create", first.id == second.id, f"IDs: {first.id}, {second.id}")
+            await self.regular.delete_item(first.id)
+        except APIError as e:
+            self.log_test("Idempotent Create", False, str(e))
+
+        try:
+            await self.regular.create_item({"title": "Incomplete"})
+            self.log_test("Create Item (Missing Fields)", False, "Expected 400")
+        except APIError as e:
+            self.log_test("Create Item (Missing Fields)", e.status_code == 400, f"Status: {e.status_code}")
+
+    async def test_get_items_with_filters(self):
+        """Test 5: Listing with filters and pagination"""
+        print("=== Testing Get Items With Filters ===")
+        checks = {
+            "Search": {"search": "iPhone"},
+            "Category": {"category": "Electronics"},
+            "Status": {"status": "lost"},
+            "Location": {"location": "Central Library"},
+        }
+        results = await asyncio.gather(
+            *(self.regular.list_items(limit=50, **filters) for filters in checks.values()),
+            return_exceptions=True,
+        )
+        for (label, filters), result in zip(checks.items(), results):
+            if isinstance(result, Exception):
+                self.log_test(f"Filter by {label}", False, str(result))
+                continue
+            field, value = next(iter(filters.items()))
+            ok = all(field == "search" or getattr(item, field) == value for item in result.items)
+            self.log_test(f"Filter by {label}", ok, f"{len(result.items)} items")
+
+        count = 0
+        async for _ in self.regular.iter_items(page_size=10):
+            count += 1
+        self.log_test("Paginated Iteration", count > 0, f"{count} items across pages")
+
+    async def test_get_single_item(self):
+        """Test 6: Single item and 404"""
+        print("=== Testing Get Single Item ===")
+        if self.test_item_id:
+            try:
+                item = await self.regular.get_item(self.test_item_id)
+                self.log_test("Get Single Item", item.id == self.test_item_id, item.title)
+            except APIError as e:
+                self.log_test("Get Single Item", False, str(e))
+        try:
+            await self.regular.get_item("non-existent-id")
+            self.log_test("Get Non-existent Item", False, "Expected 404")
+        except APIError as e:
+            self.log_test("Get Non-existent Item", e.status_code == 404, f"Status: {e.status_code}")
+
+    async def test_update_item(self):
+        """Test 7: Owner update and admin verification"""
+        print("=== Testing Update Item ===")
+        if not self.test_item_id:
+            self.log_test("Update Item", False, "No test item available")
+            return
+        try:
+            updated = await self.regular.update_item(self.test_item_id, description="Updated description")
+            self.log_test("Update Item (Owner)", updated.description == "Updated description")
+        except APIError as e:
+            self.log_test("Update Item (Owner)", False, str(e))
+        try:
+            verified = await self.admin.verify_item(self.test_item_id)
+            self.log_test("Verify Item (Admin)", verified.verified)
+        except APIError as e:
+            self.log_test("Verify Item (Admin)", False, str(e))
+
+    async def test_delete_item(self):
+        """Test 8: Delete"""
+        print("=== Testing Delete Item ===")
+        if not self.test_item_id:
+            self.log_test("Delete Item", False, "No test item available")
+            return
+        try:
+            await self.regular.delete_item(self.test_item_id)
+        except APIError as e:
+            self.log_test("Delete Item", False, str(e))
+            return
+        try:
+            await self.regular.get_item(self.test_item_id)
+            self.log_test("Delete Item", False, "Item still exists")
+        except APIError as e:
+            self.log_test("Delete Item", e.status_code == 404)
+
+    async def run_all_tests(self):
+        """Run all backend API tests in priority order"""
+        print("🚀 Starting Lost & Found Backend API Tests (SDK)")
+        print("=" * 60)
+        try:
+            await self.test_user_registration()
+            await self.test_nextauth_login()
+            await self.test_file_upload()
+            await self.test_create_item()
+            await self.test_get_items_with_filters()
+            await self.test_get_single_item()
+            await self.test_update_item()
+            await self.test_delete_item()
+        finally:
+            for client in (self.regular, self.admin):
+                if client:
+                    await client.close()
+        print("=" * 60)
+        print("🏁 Backend API Testing Complete")
+
+
+if __name__ == "__main__":
+    asyncio.run(LostFoundSDKTester().run_all_tests())
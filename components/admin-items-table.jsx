@@ -0,0 +1,116 @@
+'use client';
+
+import { useEffect } from 'react';
+import Link from 'next/link';
+import { CheckCircle, XCircle, Trash2 } from 'lucide-react';
+import { Button } from '@/components/ui/button';
+import { Badge } from '@/components/ui/badge';
+import {
+  Table,
+  TableBody,
+  TableCell,
+  TableHead,
+  TableHeader,
+  TableRow,
+} from '@/components/ui/table';
+import { useWindowVirtualizer } from '@/hooks/use-window-virtualizer';
+
+const ROW_HEIGHT_ESTIMATE = 57;
+
+// Virtualized admin table, loaded on demand by the admin dashboard. Asks for
+// the next page once the last few loaded rows are on screen.
+export default function AdminItemsTable({ items, hasMore, loading, loadMore, handleVerify, handleDelete }) {
+  const { containerRef, virtualRows, paddingTop, paddingBottom, endIndex, measureRow } = useWindowVirtualizer({
+    count: items.length,
+    estimateSize: ROW_HEIGHT_ESTIMATE,
+  });
+
+  useEffect(() => {
+    if (hasMore && !loading && items.length > 0 && endIndex >= items.length - 5) {
+      loadMore();
+    }
+  }, [endIndex, items.length, hasMore, loading, loadMore]);
+
+  return (
+    <div ref={containerRef} className="overflow-x-auto">
+      <Table>
+        <TableHeader>
+          <TableRow className="border-white/10 hover:bg-white/5">
+            <TableHead className="text-gray-300">Title</TableHead>
+            <TableHead className="text-gray-300">Status</TableHead>
+            <TableHead className="text-gray-300">Category</TableHead>
+            <TableHead className="text-gray-300">Location</TableHead>
+            <TableHead className="text-gray-300">Posted By</TableHead>
+            <TableHead className="text-gray-300">Verified</TableHead>
+            <TableHead className="text-gray-300">Actions</TableHead>
+          </TableRow>
+        </TableHeader>
+        <TableBody>
+          {paddingTop > 0 && (
+            <tr aria-hidden="true" style={{ height: paddingTop }} />
+          )}
+          {virtualRows.map(({ index }) => {
+            const item = items[index];
+            return (
+              <TableRow
+                key={item.id}
+                ref={measureRow(index)}
+                className="border-white/10 hover:bg-white/5"
+              >
+                <TableCell className="text-white font-medium">
+                  <Link href={`/item/${item.id}`} className="hover:text-cyan-400">
+                    {item.title}
+                  </Link>
+                </TableCell>
+                <TableCell>
+                  <Badge
+                    variant="outline"
+                    className={`${
+                      item.status === 'Lost'
+                        ? 'border-red-500 text-red-400'
+                        : 'border-emerald-500 text-emerald-400'
+                    }`}
+                  >
+                    {item.status}
+                  </Badge>
+                </TableCell>
+                <TableCell className="text-gray-300">{item.category}</TableCell>
+                <TableCell className="text-gray-300">{item.location}</TableCell>
+                <TableCell className="text-gray-300">{item.userName}</TableCell>
+                <TableCell>
+                  {item.verified ? (
+                    <CheckCircle className="w-5 h-5 text-emerald-400" />
+                  ) : (
+                    <XCircle className="w-5 h-5 text-gray-600" />
+                  )}
+                </TableCell>
+                <TableCell>
+                  <div className="flex gap-2">
+                    <Button
+                      size="sm"
+                      variant="outline"
+                      onClick={() => handleVerify(item.id, item.verified)}
+                      className="border-cyan-500 text-cyan-400 hover:bg-cyan-500 hover:text-white"
+                    >
+                      {item.verified ? 'Unverify' : 'Verify'}
+                    </Button>
+                    <Button
+                      size="sm"
+                      variant="destructive"
+                      onClick={() => handleDelete(item.id)}
+                    >
+                      <Trash2 className="w-4 h-4" />
+                    </Button>
+                  </div>
+                </TableCell>
+              </TableRow>
+            );
+          })}
+          {paddingBottom > 0 && (
+            <tr aria-hidden="true" style={{ height: paddingBottom }} />
+          )}
+        </TableBody>
+      </Table>
+    </div>
+  );
+}
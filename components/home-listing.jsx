@@ -0,0 +1,223 @@
+'use client';
+
+import { useEffect, useMemo, useState } from 'react';
+import { useSession } from 'next-auth/react';
+import { Search, Filter, Package, BookmarkPlus } from 'lucide-react';
+import { Button } from '@/components/ui/button';
+import { Input } from '@/components/ui/input';
+import Link from 'next/link';
+import dynamic from 'next/dynamic';
+import { useRouter } from 'next/navigation';
+import { toast } from 'sonner';
+import { ItemCard } from '@/components/item-card';
+import { DEFAULT_PAGE_SIZE } from '@/lib/items';
+import { usePaginatedItems } from '@/hooks/use-paginated-items';
+import { useWindowVirtualizer } from '@/hooks/use-window-virtualizer';
+
+// The filter panel pulls in Radix Select; keep it out of the initial bundle.
+const ItemFilters = dynamic(() => import('@/components/item-filters'), {
+  loading: () => (
+    <div className="mb-8 p-6 rounded-2xl bg-white/5 backdrop-blur-md border border-white/10 h-24 animate-pulse" />
+  ),
+});
+const ROW_HEIGHT_ESTIMATE = 480;
+
+// Starts at the desktop layout so the server-rendered grid matches the
+// first client render; narrower screens adjust after mount.
+function useGridColumns() {
+  const [columns, setColumns] = useState(3);
+
+  useEffect(() => {
+    const update = () => {
+      setColumns(window.innerWidth >= 1024 ? 3 : window.innerWidth >= 768 ? 2 : 1);
+    };
+    update();
+    window.addEventListener('resize', update);
+    return () => window.removeEventListener('resize', update);
+  }, []);
+
+  return columns;
+}
+
+export function HomeListing({ heading, initialData }) {
+  const { data: session } = useSession();
+  const router = useRouter();
+  const [searchQuery, setSearchQuery] = useState('');
+  const [showFilters, setShowFilters] = useState(false);
+  const [filters, setFilters] = useState({
+    category: 'all',
+    status: 'all',
+    location: 'all'
+  });
+
+  const { items, facets, loading, hasMore, loadMore, refresh } = usePaginatedItems(
+    { search: searchQuery, ...filters },
+    { pageSize: DEFAULT_PAGE_SIZE, facets: true, initialData }
+  );
+
+  // Only the grid rows in view are mounted; the next page loads as the last
+  // rows scroll into view.
+  const columns = useGridColumns();
+  const rows = useMemo(() => {
+    const result = [];
+    for (let i = 0; i < items.length; i += columns) result.push(items.slice(i, i + columns));
+    return result;
+  }, [items, columns]);
+
+  const { containerRef, virtualRows, paddingTop, paddingBottom, endIndex, measureRow } = useWindowVirtualizer({
+    count: rows.length,
+    estimateSize: ROW_HEIGHT_ESTIMATE,
+  });
+
+  useEffect(() => {
+    if (hasMore && !loading && rows.length > 0 && endIndex >= rows.length - 1) {
+      loadMore();
+    }
+  }, [endIndex, rows.length, hasMore, loading, loadMore]);
+
+  const handleSearch = (e) => {
+    e.preventDefault();
+    refresh();
+  };
+
+  const handleSaveSearch = async () => {
+    try {
+      const res = await fetch('/api/saved-searches', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ search: searchQuery, ...filters })
+      });
+      const data = await res.json();
+
+      if (!res.ok) {
+        throw new Error(data.error || 'Failed to save search');
+      }
+
+      toast.success("Search saved. You'll be notified when a matching item is posted.");
+    } catch (error) {
+      toast.error(error.message);
+    }
+  };
+
+  return (
+    <>
+      {/* Hero Section */}
+      <section className="pt-32 pb-20 px-6">
+        <div className="container mx-auto text-center">
+          {heading}
+
+          {/* Search Bar */}
+          <form onSubmit={handleSearch} className="max-w-2xl mx-auto mb-8">
+            <div className="relative">
+              <Search className="absolute left-4 top-1/2 transform -translate-y-1/2 text-gray-400 w-5 h-5" />
+              <Input
+                type="text"
+                placeholder="Search for lost items..."
+                value={searchQuery}
+                onChange={(e) => setSearchQuery(e.target.value)}
+                className="w-full pl-12 pr-4 py-6 bg-white/5 backdrop-blur-md border-white/10 text-white placeholder:text-gray-500 rounded-2xl focus:border-cyan-500 focus:ring-cyan-500"
+              />
+            </div>
+          </form>
+
+          {/* Action Buttons */}
+          {session ? (
+            <div className="flex flex-wrap gap-4 justify-center">
+              <Button
+                onClick={() => router.push('/report?type=lost')}
+                size="lg"
+                className="bg-transparent border-2 border-cyan-500 text-cyan-400 hover:bg-cyan-500 hover:text-white px-8 py-6 text-lg rounded-xl transition-all"
+              >
+                Report Lost Item
+              </Button>
+              <Button
+                onClick={() => router.push('/report?type=found')}
+                size="lg"
+                className="bg-gradient-to-r from-cyan-500 to-emerald-500 hover:from-cyan-600 hover:to-emerald-600 text-white px-8 py-6 text-lg rounded-xl transition-all"
+              >
+                Report Found Item
+              </Button>
+            </div>
+          ) : (
+            <p className="text-gray-400">
+              <Link href="/login" className="text-cyan-400 hover:underline">
+                Login
+              </Link>{' '}
+              to report items
+            </p>
+          )}
+        </div>
+      </section>
+
+      {/* Filters and Listings */}
+      <section className="px-6 pb-20">
+        <div className="container mx-auto">
+          <div className="flex items-center justify-between mb-8">
+            <h2 className="text-3xl font-bold text-white">Recent Listings</h2>
+            <div className="flex items-center gap-2">
+              {session && (
+                <Button
+                  onClick={handleSaveSearch}
+                  variant="outline"
+                  className="border-white/20 text-white hover:bg-white/10"
+                >
+                  <BookmarkPlus className="w-4 h-4 mr-2" />
+                  Save Search
+                </Button>
+              )}
+              <Button
+                onClick={() => setShowFilters(!showFilters)}
+                variant="outline"
+                className="border-white/20 text-white hover:bg-white/10"
+              >
+                <Filter className="w-4 h-4 mr-2" />
+                Filters
+              </Button>
+            </div>
+          </div>
+
+          {/* Filter Panel */}
+          {showFilters && (
+            <ItemFilters filters={filters} setFilters={setFilters} facets={facets} />
+          )}
+
+          {/* Items Grid */}
+          {loading && items.length === 0 ? (
+            <div className="text-center py-20">
+              <div className="inline-block animate-spin rounded-full h-12 w-12 border-4 border-cyan-500 border-t-transparent"></div>
+              <p className="text-gray-400 mt-4">Loading items...</p>
+            </div>
+          ) : items.length === 0 ? (
+            <div className="text-center py-20">
+              <Package className="w-16 h-16 text-gray-600 mx-auto mb-4" />
+              <p className="text-gray-400 text-lg">No items found</p>
+            </div>
+          ) : (
+            <div ref={containerRef} style={{ paddingTop, paddingBottom }}>
+              {virtualRows.map(({ index }) => (
+                <div
+                  key={index}
+                  ref={measureRow(index)}
+                  className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6 pb-6"
+                >
+                  {rows[index].map((item) => (
+                    <ItemCard
+                      key={item.id}
+                      item={item}
+                      onClick={() => router.push(`/item/${item.id}`)}
+                    />
+                  ))}
+                </div>
+              ))}
+              {loading && (
+                <div className="text-center py-6">
+                  <div className="inline-block animate-spin rounded-full h-8 w-8 border-4 border-cyan-500 border-t-transparent"></div>
+                </div>
+              )}
+            </div>
+          )}
+        </div>
+      </section>
+    </>
+  );
+}
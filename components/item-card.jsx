@@ -0,0 +1,71 @@
+'use client';
+
+import { useState } from 'react';
+import { MapPin, Calendar, Package } from 'lucide-react';
+import { Card, CardContent, CardFooter, CardHeader, CardTitle } from '@/components/ui/card';
+import { Badge } from '@/components/ui/badge';
+import Image from 'next/image';
+
+export function ItemCard({ item, onClick }) {
+  const [imageLoaded, setImageLoaded] = useState(false);
+
+  return (
+    <Card
+      className="bg-white/5 backdrop-blur-md border-white/10 hover:border-cyan-500/50 transition-all duration-300 hover:shadow-lg hover:shadow-cyan-500/20 cursor-pointer"
+      onClick={onClick}
+    >
+      <CardHeader>
+        <div className="flex items-start justify-between">
+          <CardTitle className="text-white text-xl">{item.title}</CardTitle>
+          <Badge
+            variant="outline"
+            className={`${
+              item.status === 'Lost'
+                ? 'border-red-500 text-red-400'
+                : 'border-emerald-500 text-emerald-400'
+            }`}
+          >
+            {item.status}
+          </Badge>
+        </div>
+      </CardHeader>
+      <CardContent>
+        {item.image && (
+          <div className="relative w-full h-48 mb-4 rounded-lg overflow-hidden bg-white/5">
+            {!imageLoaded && <div className="absolute inset-0 animate-pulse bg-white/10" />}
+            <Image
+              src={item.image}
+              alt={item.title}
+              fill
+              loading="lazy"
+              onLoad={() => setImageLoaded(true)}
+              className={`object-cover transition-opacity duration-300 ${imageLoaded ? 'opacity-100' : 'opacity-0'}`}
+            />
+          </div>
+        )}
+        <p className="text-gray-400 text-sm mb-4 line-clamp-2">{item.description}</p>
+        <div className="space-y-2">
+          <div className="flex items-center text-sm text-gray-400">
+            <MapPin className="w-4 h-4 mr-2 text-cyan-400" />
+            {item.location}
+          </div>
+          <div className="flex items-center text-sm text-gray-400">
+            <Calendar className="w-4 h-4 mr-2 text-cyan-400" />
+            {new Date(item.date).toLocaleDateString()}
+          </div>
+          <div className="flex items-center text-sm text-gray-400">
+            <Package className="w-4 h-4 mr-2 text-cyan-400" />
+            {item.category}
+          </div>
+        </div>
+      </CardContent>
+      {item.verified && (
+        <CardFooter>
+          <Badge className="bg-emerald-500/20 text-emerald-400 border-emerald-500">
+            Verified
+          </Badge>
+        </CardFooter>
+      )}
+    </Card>
+  );
+}
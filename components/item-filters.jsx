@@ -0,0 +1,60 @@
+'use client';
+
+import { Input } from '@/components/ui/input';
+import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
+
+const CATEGORIES = ['Electronics', 'Documents', 'Accessories', 'Clothing', 'Keys', 'Pets', 'Other'];
+
+// Loaded on demand from the home page the first time the filters are opened.
+export default function ItemFilters({ filters, setFilters, facets }) {
+  const facetLabel = (field, value) => {
+    const bucket = facets[field]?.find((b) => b.value === value);
+    return bucket ? `${value} (${bucket.count})` : value;
+  };
+
+  return (
+    <div className="mb-8 p-6 rounded-2xl bg-white/5 backdrop-blur-md border border-white/10">
+      <div className="grid grid-cols-1 md:grid-cols-3 gap-4">
+        <div>
+          <label className="block text-sm text-gray-400 mb-2">Status</label>
+          <Select value={filters.status} onValueChange={(value) => setFilters({ ...filters, status: value })}>
+            <SelectTrigger className="bg-white/5 border-white/10 text-white">
+              <SelectValue />
+            </SelectTrigger>
+            <SelectContent>
+              <SelectItem value="all">All</SelectItem>
+              <SelectItem value="Lost">{facetLabel('status', 'Lost')}</SelectItem>
+              <SelectItem value="Found">{facetLabel('status', 'Found')}</SelectItem>
+            </SelectContent>
+          </Select>
+        </div>
+        <div>
+          <label className="block text-sm text-gray-400 mb-2">Category</label>
+          <Select value={filters.category} onValueChange={(value) => setFilters({ ...filters, category: value })}>
+            <SelectTrigger className="bg-white/5 border-white/10 text-white">
+              <SelectValue />
+            </SelectTrigger>
+            <SelectContent>
+              <SelectItem value="all">All Categories</SelectItem>
+              {CATEGORIES.map((category) => (
+                <SelectItem key={category} value={category}>
+                  {facetLabel('category', category)}
+                </SelectItem>
+              ))}
+            </SelectContent>
+          </Select>
+        </div>
+        <div>
+          <label className="block text-sm text-gray-400 mb-2">Location</label>
+          <Input
+            type="text"
+            placeholder="Enter location"
+            value={filters.location === 'all' ? '' : filters.location}
+            onChange={(e) => setFilters({ ...filters, location: e.target.value || 'all' })}
+            className="bg-white/5 border-white/10 text-white placeholder:text-gray-500"
+          />
+        </div>
+      </div>
+    </div>
+  );
+}
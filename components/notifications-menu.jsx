@@ -0,0 +1,129 @@
+'use client';
+
+import { useCallback, useEffect, useState } from 'react';
+import Link from 'next/link';
+import { Bell } from 'lucide-react';
+import { Button } from '@/components/ui/button';
+import { Popover, PopoverContent, PopoverTrigger } from '@/components/ui/popover';
+
+const POLL_INTERVAL_MS = 60000;
+
+// Bell with the unread count from the counter endpoint; the inbox itself is
+// only fetched when the menu is opened.
+export function NotificationsMenu() {
+  const [unread, setUnread] = useState(0);
+  const [open, setOpen] = useState(false);
+  const [notifications, setNotifications] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loading, setLoading] = useState(false);
+
+  const fetchUnread = useCallback(async () => {
+    try {
+      const res = await fetch('/api/notifications/unread');
+      if (res.ok) setUnread((await res.json()).unread);
+    } catch (error) {
+      console.error('Error fetching unread count:', error);
+    }
+  }, []);
+
+  useEffect(() => {
+    fetchUnread();
+    const interval = setInterval(() => {
+      if (document.visibilityState === 'visible') fetchUnread();
+    }, POLL_INTERVAL_MS);
+    return () => clearInterval(interval);
+  }, [fetchUnread]);
+
+  const loadPage = async (cursor) => {
+    setLoading(true);
+    try {
+      const params = new URLSearchParams({ limit: '10' });
+      if (cursor) params.set('cursor', cursor);
+      const res = await fetch(`/api/notifications?${params}`);
+      const data = await res.json();
+      setNotifications((prev) => (cursor ? [...prev, ...data.notifications] : data.notifications));
+      setNextCursor(data.nextCursor);
+    } catch (error) {
+      console.error('Error fetching notifications:', error);
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  const handleOpenChange = (value) => {
+    setOpen(value);
+    if (value) loadPage(null);
+  };
+
+  const markAllRead = async () => {
+    try {
+      const res = await fetch('/api/notifications/read', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ all: true })
+      });
+      if (res.ok) {
+        setUnread(0);
+        setNotifications((prev) => prev.map((notification) => ({ ...notification, read: true })));
+      }
+    } catch (error) {
+      console.error('Error marking notifications read:', error);
+    }
+  };
+
+  return (
+    <Popover open={open} onOpenChange={handleOpenChange}>
+      <PopoverTrigger asChild>
+        <button className="relative text-gray-300 hover:text-white transition" aria-label="Notifications">
+          <Bell className="w-5 h-5" />
+          {unread > 0 && (
+            <span className="absolute -top-2 -right-2 min-w-[1.25rem] h-5 px-1 rounded-full bg-cyan-500 text-white text-xs flex items-center justify-center">
+              {unread > 99 ? '99+' : unread}
+            </span>
+          )}
+        </button>
+      </PopoverTrigger>
+      <PopoverContent align="end" className="w-80 p-0 bg-gray-900 border-white/10 text-white">
+        <div className="flex items-center justify-between px-4 py-3 border-b border-white/10">
+          <span className="font-semibold">Notifications</span>
+          {unread > 0 && (
+            <button onClick={markAllRead} className="text-xs text-cyan-400 hover:underline">
+              Mark all read
+            </button>
+          )}
+        </div>
+        <div className="max-h-96 overflow-y-auto">
+          {notifications.length === 0 && !loading ? (
+            <p className="px-4 py-6 text-sm text-gray-400 text-center">No notifications yet</p>
+          ) : (
+            notifications.map((notification) => (
+              <Link
+                key={notification.id}
+                href={`/item/${notification.itemId}`}
+                onClick={() => setOpen(false)}
+                className={`block px-4 py-3 border-b border-white/5 hover:bg-white/5 ${notification.read ? '' : 'bg-cyan-500/10'}`}
+              >
+                <p className="text-sm font-medium">{notification.title}</p>
+                <p className="text-xs text-gray-400 mt-1">{notification.message}</p>
+                <p className="text-xs text-gray-500 mt-1">{new Date(notification.createdAt).toLocaleString()}</p>
+              </Link>
+            ))
+          )}
+          {nextCursor && (
+            <div className="p-2 text-center">
+              <Button
+                onClick={() => loadPage(nextCursor)}
+                disabled={loading}
+                variant="ghost"
+                size="sm"
+                className="text-cyan-400 hover:text-white"
+              >
+                {loading ? 'Loading...' : 'Load more'}
+              </Button>
+            </div>
+          )}
+        </div>
+      </PopoverContent>
+    </Popover>
+  );
+}
@@ -0,0 +1,71 @@
+'use client';
+
+import { useSession } from 'next-auth/react';
+import { useRouter } from 'next/navigation';
+import Link from 'next/link';
+import { Package } from 'lucide-react';
+import { Button } from '@/components/ui/button';
+import { NotificationsMenu } from '@/components/notifications-menu';
+
+export function SiteNav() {
+  const { data: session } = useSession();
+  const router = useRouter();
+
+  return (
+    <nav className="fixed top-0 left-0 right-0 z-50 backdrop-blur-md bg-black/30 border-b border-white/10">
+      <div className="container mx-auto px-6 py-4 flex items-center justify-between">
+        <Link href="/" className="flex items-center space-x-2">
+          <Package className="w-8 h-8 text-cyan-400" />
+          <span className="text-2xl font-bold text-white">Lost & Found</span>
+        </Link>
+        <div className="flex items-center space-x-6">
+          <Link href="/" className="text-gray-300 hover:text-white transition">
+            Home
+          </Link>
+          {session && (
+            <Link href="/report" className="text-gray-300 hover:text-white transition">
+              Report
+            </Link>
+          )}
+          {session?.user?.role === 'admin' && (
+            <Link href="/admin" className="text-gray-300 hover:text-white transition">
+              Admin
+            </Link>
+          )}
+          {session ? (
+            <div className="flex items-center space-x-4">
+              <NotificationsMenu />
+              <span className="text-sm text-gray-300">{session.user.name}</span>
+              <Button
+                onClick={() => router.push('/api/auth/signout')}
+                variant="outline"
+                size="sm"
+                className="border-cyan-500 text-cyan-400 hover:bg-cyan-500 hover:text-white"
+              >
+                Logout
+              </Button>
+            </div>
+          ) : (
+            <div className="flex items-center space-x-2">
+              <Button
+                onClick={() => router.push('/login')}
+                variant="ghost"
+                size="sm"
+                className="text-gray-300 hover:text-white"
+              >
+                Login
+              </Button>
+              <Button
+                onClick={() => router.push('/register')}
+                size="sm"
+                className="bg-cyan-500 hover:bg-cyan-600 text-white"
+              >
+                Sign Up
+              </Button>
+            </div>
+          )}
+        </div>
+      </div>
+    </nav>
+  );
+}
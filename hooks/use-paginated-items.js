@@ -0,0 +1,71 @@
+import * as React from "react"
+
+// Page-by-page loading of `GET /api/items`. Changing `params` starts over
+// from the first page; stale responses from earlier params are ignored.
+// `initialData` (e.g. a server-rendered first page) stands in for the first
+// fetch of the initial params.
+
+export function usePaginatedItems(params, { pageSize = 24, facets = false, enabled = true, initialData } = {}) {
+  const [items, setItems] = React.useState(initialData?.items || [])
+  const [facetCounts, setFacetCounts] = React.useState(initialData?.facets || {})
+  const [page, setPage] = React.useState(initialData ? 1 : 0)
+  const [hasMore, setHasMore] = React.useState(initialData ? Boolean(initialData.hasMore) : true)
+  const [loading, setLoading] = React.useState(false)
+  const requestId = React.useRef(0)
+  const loadingRef = React.useRef(false)
+  const key = JSON.stringify(params)
+  const initialKey = React.useRef(initialData ? key : null)
+
+  const fetchPage = React.useCallback(async (pageNumber, replace) => {
+    const id = ++requestId.current
+    loadingRef.current = true
+    setLoading(true)
+
+    try {
+      const query = new URLSearchParams()
+      Object.entries(JSON.parse(key)).forEach(([name, value]) => {
+        if (value !== undefined && value !== null && value !== "" && value !== "all") {
+          query.append(name, value)
+        }
+      })
+      query.append("limit", String(pageSize))
+      query.append("page", String(pageNumber))
+      if (facets && pageNumber === 1) query.append("facets", "true")
+
+      const res = await fetch(`/api/items?${query.toString()}`)
+      const data = await res.json()
+      if (id !== requestId.current) return
+
+      setItems((prev) => (replace ? data.items || [] : prev.concat(data.items || [])))
+      if (data.facets) setFacetCounts(data.facets)
+      setHasMore(Boolean(data.hasMore))
+      setPage(pageNumber)
+    } catch (error) {
+      console.error("Failed to fetch items:", error)
+      if (id === requestId.current) setHasMore(false)
+    } finally {
+      if (id === requestId.current) {
+        loadingRef.current = false
+        setLoading(false)
+      }
+    }
+  }, [key, pageSize, facets])
+
+  const refresh = React.useCallback(() => fetchPage(1, true), [fetchPage])
+
+  React.useEffect(() => {
+    if (!enabled) return
+    if (initialKey.current === key) {
+      initialKey.current = null
+      return
+    }
+    initialKey.current = null
+    refresh()
+  }, [refresh, enabled, key])
+
+  const loadMore = React.useCallback(() => {
+    if (!loadingRef.current && hasMore) fetchPage(page + 1, false)
+  }, [fetchPage, hasMore, page])
+
+  return { items, setItems, facets: facetCounts, loading, hasMore, loadMore, refresh }
+}
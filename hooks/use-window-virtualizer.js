@@ -0,0 +1,132 @@
+import * as React from "react"
+
+// Window-scroll virtualization for lists whose rows have variable height.
+// Only rows inside the viewport (plus `overscan`) are rendered; the space of
+// the others is kept with top/bottom padding. Row heights start from
+// `estimateSize` and are replaced by measured heights as rows mount.
+
+export function useWindowVirtualizer({ count, estimateSize, overscan = 3, initialHeight = 1200 }) {
+  const containerRef = React.useRef(null)
+  const sizes = React.useRef(new Map())
+  const observers = React.useRef(new Map())
+  const refCallbacks = React.useRef(new Map())
+  // `initialHeight` sizes the first (and server-side) render before the
+  // real viewport can be measured.
+  const [viewport, setViewport] = React.useState({ top: 0, height: initialHeight })
+  const [measureVersion, setMeasureVersion] = React.useState(0)
+
+  const measureViewport = React.useCallback(() => {
+    const container = containerRef.current
+    if (!container) return
+    const top = -container.getBoundingClientRect().top
+    setViewport((prev) =>
+      prev.top === top && prev.height === window.innerHeight
+        ? prev
+        : { top, height: window.innerHeight }
+    )
+  }, [])
+
+  React.useEffect(() => {
+    let frame = null
+    const schedule = () => {
+      if (frame === null) {
+        frame = requestAnimationFrame(() => {
+          frame = null
+          measureViewport()
+        })
+      }
+    }
+
+    window.addEventListener("scroll", schedule, { passive: true })
+    window.addEventListener("resize", schedule)
+    return () => {
+      window.removeEventListener("scroll", schedule)
+      window.removeEventListener("resize", schedule)
+      if (frame !== null) cancelAnimationFrame(frame)
+    }
+  }, [measureViewport])
+
+  // The container may mount after the first render (e.g. once data arrives).
+  React.useEffect(() => {
+    measureViewport()
+  }, [count, measureViewport])
+
+  React.useEffect(() => {
+    const current = observers.current
+    return () => {
+      current.forEach((observer) => observer.disconnect())
+      current.clear()
+    }
+  }, [])
+
+  const offsets = React.useMemo(() => {
+    const result = new Array(count + 1)
+    result[0] = 0
+    for (let i = 0; i < count; i++) {
+      result[i + 1] = result[i] + (sizes.current.get(i) ?? estimateSize)
+    }
+    return result
+    // measureVersion invalidates the offsets when a row is re-measured
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [count, estimateSize, measureVersion])
+
+  const totalSize = offsets[count]
+
+  // Binary search for the first row whose bottom edge is below the viewport top.
+  let start = 0
+  let end = count
+  {
+    let lo = 0
+    let hi = count
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1
+      if (offsets[mid + 1] <= viewport.top) lo = mid + 1
+      else hi = mid
+    }
+    start = Math.max(0, lo - overscan)
+    let last = lo
+    while (last < count && offsets[last] < viewport.top + viewport.height) last++
+    end = Math.min(count, last + overscan)
+  }
+
+  const virtualRows = []
+  for (let index = start; index < end; index++) {
+    virtualRows.push({ index, start: offsets[index] })
+  }
+
+  // Ref callbacks are cached per index so re-renders don't re-observe rows.
+  const measureRow = React.useCallback((index) => {
+    if (refCallbacks.current.has(index)) return refCallbacks.current.get(index)
+
+    const callback = (element) => {
+      const previous = observers.current.get(index)
+      if (previous) {
+        previous.disconnect()
+        observers.current.delete(index)
+      }
+      if (!element || typeof ResizeObserver === "undefined") return
+
+      const observer = new ResizeObserver(([entry]) => {
+        const height = entry.borderBoxSize?.[0]?.blockSize ?? entry.target.getBoundingClientRect().height
+        if (height > 0 && sizes.current.get(index) !== height) {
+          sizes.current.set(index, height)
+          setMeasureVersion((v) => v + 1)
+        }
+      })
+      observer.observe(element)
+      observers.current.set(index, observer)
+    }
+    refCallbacks.current.set(index, callback)
+    return callback
+  }, [])
+
+  return {
+    containerRef,
+    virtualRows,
+    totalSize,
+    paddingTop: virtualRows.length ? virtualRows[0].start : 0,
+    paddingBottom: virtualRows.length ? totalSize - offsets[end] : totalSize,
+    endIndex: end,
+    measureRow,
+  }
+}
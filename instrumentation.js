@@ -0,0 +1,15 @@
+// Runs once when the Node.js server boots: starts the process metrics
+// collectors and the readiness warmup instead of waiting for the first
+// request or readiness probe.
+export async function register() {
+  if (process.env.NEXT_RUNTIME !== 'nodejs') return;
+
+  const { startHttpMetrics, startRuntimeMetrics } = await import('./lib/metrics');
+  startHttpMetrics();
+  startRuntimeMetrics();
+
+  if (process.env.WARMUP_ON_BOOT !== 'false') {
+    const { startWarmup } = await import('./lib/readiness');
+    startWarmup();
+  }
+}
@@ -0,0 +1,164 @@
+import { counter, gauge, getPoolStats } from './metrics';
+
+// Admission control for API routes. Each route class has its own in-flight
+// limit, and under event-loop lag or Mongo pool queueing the least important
+// classes are shed first, so cheap reads keep flowing while new logins and
+// uploads back off. Rejections are immediate 429 (class at capacity) or 503
+// (process under pressure) responses with Retry-After, never queued work.
+//
+// Pressure is the larger of event-loop lag / ADMISSION_LAG_MS and Mongo
+// wait-queue depth / ADMISSION_POOL_QUEUE. A class is shed once pressure
+// reaches its factor: new sessions (auth) and uploads at 1, writes at 1.5,
+// reads and in-progress work (e.g. resuming an upload) only at 2.
+
+const LAG_THRESHOLD_MS = parseFloat(process.env.ADMISSION_LAG_MS || '200');
+const POOL_QUEUE_THRESHOLD = parseInt(process.env.ADMISSION_POOL_QUEUE || '50', 10);
+const RETRY_AFTER_SECONDS = parseInt(process.env.ADMISSION_RETRY_AFTER_S || '2', 10);
+const LAG_SAMPLE_MS = 100;
+
+const limit = (name, fallback) => parseInt(process.env[`ADMISSION_MAX_${name}`] || String(fallback), 10);
+
+export const ROUTE_CLASSES = {
+  auth: { maxInFlight: limit('AUTH', 16), shedAt: 1 },
+  upload: { maxInFlight: limit('UPLOAD', 16), shedAt: 1 },
+  write: { maxInFlight: limit('WRITE', 64), shedAt: 1.5 },
+  read: { maxInFlight: limit('READ', 256), shedAt: 2 }
+};
+
+const DISABLED = process.env.ADMISSION_CONTROL === 'off';
+
+if (!global._admission) {
+  global._admission = {
+    inFlight: Object.fromEntries(Object.keys(ROUTE_CLASSES).map((name) => [name, 0])),
+    lagMs: 0,
+    sampler: null
+  };
+}
+
+const state = global._admission;
+
+// Timer drift sampled every 100ms and smoothed, so a single slow tick does
+// not shed traffic but sustained blocking does within a few hundred ms.
+function startLagSampler() {
+  if (state.sampler) return;
+  let expected = Date.now() + LAG_SAMPLE_MS;
+  state.sampler = setInterval(() => {
+    const now = Date.now();
+    const lag = Math.max(0, now - expected);
+    expected = now + LAG_SAMPLE_MS;
+    state.lagMs = state.lagMs * 0.7 + lag * 0.3;
+  }, LAG_SAMPLE_MS);
+  state.sampler.unref();
+
+  gauge('admission_in_flight', 'Requests admitted and running, by route class', () =>
+    Object.entries(state.inFlight).map(([routeClass, value]) => ({ labels: { class: routeClass }, value }))
+  );
+  gauge('admission_pressure', 'Admission pressure (1 = shedding auth and uploads)', () => [
+    { labels: {}, value: currentPressure() }
+  ]);
+}
+
+export function currentPressure() {
+  const { waitQueue } = getPoolStats();
+  return Math.max(state.lagMs / LAG_THRESHOLD_MS, waitQueue / POOL_QUEUE_THRESHOLD);
+}
+
+function reject(status, routeClass, reason, retryAfter) {
+  counter('admission_rejected_total', 'Requests rejected by admission control').inc({ class: routeClass, reason });
+  return new Response(
+    JSON.stringify({ error: status === 429 ? 'Too many requests' : 'Service busy, retry shortly' }),
+    {
+      status,
+      headers: {
+        'Content-Type': 'application/json',
+        'Retry-After': String(retryAfter)
+      }
+    }
+  );
+}
+
+// Returns { response } when the request must be rejected, otherwise
+// { release } to call when it finishes. `inProgress` lifts work that
+// continues an existing session to read priority.
+export function admit(routeClass, { inProgress = false } = {}) {
+  if (DISABLED) return { release: () => {} };
+  startLagSampler();
+
+  const config = ROUTE_CLASSES[routeClass];
+  const pressure = currentPressure();
+  const shedAt = inProgress ? ROUTE_CLASSES.read.shedAt : config.shedAt;
+
+  if (pressure >= shedAt) {
+    return { response: reject(503, routeClass, 'pressure', Math.ceil(RETRY_AFTER_SECONDS * pressure)) };
+  }
+  if (state.inFlight[routeClass] >= config.maxInFlight) {
+    return { response: reject(429, routeClass, 'concurrency', RETRY_AFTER_SECONDS) };
+  }
+
+  state.inFlight[routeClass] += 1;
+  let released = false;
+  return {
+    release: () => {
+      if (released) return;
+      released = true;
+      state.inFlight[routeClass] -= 1;
+    }
+  };
+}
+
+// Passes a response body through unchanged and calls `release` once it has
+// been fully read, failed or been cancelled by the client.
+function releaseWhenDone(body, release) {
+  const reader = body.getReader();
+  return new ReadableStream({
+    async pull(controller) {
+      try {
+        const { done, value } = await reader.read();
+        if (done) {
+          release();
+          controller.close();
+        } else {
+          controller.enqueue(value);
+        }
+      } catch (error) {
+        release();
+        controller.error(error);
+      }
+    },
+    cancel(reason) {
+      release();
+      return reader.cancel(reason);
+    }
+  });
+}
+
+// Wraps a route handler with admission for `routeClass`. `options.inProgress`
+// may be a function of the request. The slot is held until the response body
+// is sent, so streamed listings count against the cap for their whole run.
+export function withAdmission(routeClass, handler, options = {}) {
+  return async function admitted(request, context) {
+    const inProgress = typeof options.inProgress === 'function'
+      ? options.inProgress(request)
+      : Boolean(options.inProgress);
+    const { response, release } = admit(routeClass, { inProgress });
+    if (response) return response;
+
+    let result;
+    try {
+      result = await handler(request, context);
+    } catch (error) {
+      release();
+      throw error;
+    }
+
+    if (!result?.body) {
+      release();
+      return result;
+    }
+    return new Response(releaseWhenDone(result.body, release), {
+      status: result.status,
+      statusText: result.statusText,
+      headers: result.headers
+    });
+  };
+}
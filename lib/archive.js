@@ -0,0 +1,125 @@
+import { getDb } from './mongodb';
+import { invalidateFacets } from './facets';
+
+// Hot/cold tiering for items. Items older than the configured age, and
+// items their owner marked resolved, move in batches from `items` to
+// `items_archive` so the hot collection and its indexes stay small. Reads
+// reach the archive only when asked to (`includeArchived=true`), on a miss by
+// id, or for the admin export; updates and deletes by id follow the item to
+// whichever collection holds it.
+
+export const ARCHIVE_COLLECTION = 'items_archive';
+
+const ARCHIVE_AFTER_DAYS = parseFloat(process.env.ARCHIVE_AFTER_DAYS || '180');
+const ARCHIVE_BATCH_SIZE = parseInt(process.env.ARCHIVE_BATCH_SIZE || '500', 10);
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+let indexesPromise;
+
+export function ensureArchiveIndexes(db) {
+  if (!indexesPromise) {
+    indexesPromise = Promise.all([
+      db.collection('items').createIndex({ createdAt: -1 }, { name: 'items_recent' }),
+      db.collection('items').createIndex(
+        { resolved: 1 },
+        { name: 'items_resolved', partialFilterExpression: { resolved: true } }
+      ),
+      db.collection(ARCHIVE_COLLECTION).createIndex({ id: 1 }, { name: 'archive_id', unique: true }),
+      db.collection(ARCHIVE_COLLECTION).createIndex({ createdAt: -1 }, { name: 'archive_recent' })
+    ]).catch((error) => {
+      indexesPromise = null;
+      throw error;
+    });
+  }
+  return indexesPromise;
+}
+
+export function archiveCriteria(maxAgeDays = ARCHIVE_AFTER_DAYS) {
+  const cutoff = new Date(Date.now() - maxAgeDays * DAY_MS).toISOString();
+  // Each branch has its own index (`items_recent`, and the partial
+  // `items_resolved`), so the $or is answered by an index union.
+  return { $or: [{ createdAt: { $lt: cutoff } }, { resolved: true }] };
+}
+
+// Copies a batch into the archive before deleting it from the hot collection.
+// Re-running after a crash is safe: already-archived ids are skipped by the
+// unique index and only documents that made it into the archive are removed.
+export async function archiveItems({ maxAgeDays = ARCHIVE_AFTER_DAYS, batchSize = ARCHIVE_BATCH_SIZE, dryRun = false } = {}) {
+  const db = await getDb();
+  await ensureArchiveIndexes(db);
+
+  const criteria = archiveCriteria(maxAgeDays);
+  const report = { archived: 0, batches: 0, dryRun };
+
+  if (dryRun) {
+    report.archived = await db.collection('items').countDocuments(criteria);
+    return report;
+  }
+
+  for (;;) {
+    const batch = await db.collection('items')
+      .find(criteria, { projection: { features: 0 } })
+      .sort({ createdAt: 1 })
+      .limit(batchSize)
+      .toArray();
+
+    if (batch.length === 0) break;
+
+    const archivedAt = new Date().toISOString();
+    try {
+      await db.collection(ARCHIVE_COLLECTION).insertMany(
+        batch.map((item) => ({ ...item, archived: true, archivedAt })),
+        { ordered: false }
+      );
+    } catch (error) {
+      const duplicatesOnly = [].concat(error.writeErrors || []).every((e) => e.code === 11000);
+      if (!error.writeErrors || !duplicatesOnly) throw error;
+    }
+
+    const ids = batch.map((item) => item.id);
+    const stored = await db.collection(ARCHIVE_COLLECTION)
+      .find({ id: { $in: ids } }, { projection: { _id: 0, id: 1 } })
+      .toArray();
+    const result = await db.collection('items').deleteMany({ id: { $in: stored.map((item) => item.id) } });
+
+    report.archived += result.deletedCount;
+    report.batches += 1;
+    if (batch.length < batchSize || result.deletedCount === 0) break;
+  }
+
+  if (report.archived > 0) invalidateFacets();
+  return report;
+}
+
+// `$unionWith` keeps hot and archived items in one sorted cursor, so the
+// listing, pagination and streaming paths work unchanged. With a limit, each
+// side is sorted by its own index and cut to `skip + limit` before the
+// merge, so only that many documents per side are sorted in memory.
+export function findWithArchive(db, query, { projection, sort, skip, limit, session }) {
+  const window = limit ? [{ $sort: sort }, { $limit: (skip || 0) + limit }] : [];
+  const pipeline = [
+    { $match: query },
+    ...window,
+    { $unionWith: { coll: ARCHIVE_COLLECTION, pipeline: [{ $match: query }, ...window] } },
+    { $sort: sort }
+  ];
+  if (skip) pipeline.push({ $skip: skip });
+  if (limit) pipeline.push({ $limit: limit });
+  if (projection) pipeline.push({ $project: projection });
+  // An unbounded listing (e.g. a full stream) may exceed the in-memory sort limit.
+  return db.collection('items').aggregate(pipeline, { session, allowDiskUse: !limit });
+}
+
+// The collection currently holding an item, hot first, for writes by id.
+export async function locateItem(db, id) {
+  const item = await db.collection('items').findOne({ id });
+  if (item) return { item, collection: db.collection('items') };
+  const archived = await db.collection(ARCHIVE_COLLECTION).findOne({ id });
+  if (archived) return { item: archived, collection: db.collection(ARCHIVE_COLLECTION) };
+  return { item: null, collection: null };
+}
+
+export async function findArchivedItem(id, projection = {}) {
+  const db = await getDb();
+  return await db.collection(ARCHIVE_COLLECTION).findOne({ id }, { projection });
+}
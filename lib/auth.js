@@ -1,6 +1,6 @@
 import bcrypt from 'bcryptjs';
 import { v4 as uuidv4 } from 'uuid';
-import { getDb } from './mongodb';
+import { getPrimaryDb } from './mongodb';
 
 export async function hashPassword(password) {
   return await bcrypt.hash(password, 12);
@@ -11,7 +11,7 @@ export async function verifyPassword(password, hashedPassword) {
 }
 
 export async function createUser(email, password, name) {
-  const db = await getDb();
+  const db = await getPrimaryDb();
   const existingUser = await db.collection('users').findOne({ email });
   
   if (existingUser) {
@@ -38,12 +38,12 @@ export async function createUser(email, password, name) {
 }
 
 export async function getUserByEmail(email) {
-  const db = await getDb();
+  const db = await getPrimaryDb();
   return await db.collection('users').findOne({ email });
 }
 
 export async function getUserById(id) {
-  const db = await getDb();
+  const db = await getPrimaryDb();
   const user = await db.collection('users').findOne({ id });
   if (user) {
     const { password, ...userWithoutPassword } = user;
@@ -0,0 +1,68 @@
+import { Timestamp } from 'mongodb';
+import clientPromise, { getDb, getReadDb } from './mongodb';
+
+// Read-your-own-writes on top of secondary reads. A write runs in a
+// causally consistent session and its operationTime is handed back to the
+// browser in a short-lived cookie. Reads carrying that cookie start a causal
+// session advanced to the same time, so whichever member serves them waits
+// until it has replicated the user's write. Standalone servers report no
+// operationTime, so no cookie is set and reads behave as before.
+
+export const WRITE_TOKEN_COOKIE = 'lf_write_ts';
+const READ_YOUR_WRITES_SECONDS = parseInt(process.env.READ_YOUR_WRITES_SECONDS || '120', 10);
+
+export function formatWriteToken(operationTime) {
+  return operationTime ? `${operationTime.t}.${operationTime.i}` : null;
+}
+
+export function parseWriteToken(token) {
+  const match = /^(\d+)\.(\d+)$/.exec(token || '');
+  return match ? new Timestamp({ t: Number(match[1]), i: Number(match[2]) }) : null;
+}
+
+export function writeTokenFrom(request) {
+  return request.cookies.get(WRITE_TOKEN_COOKIE)?.value;
+}
+
+// Runs `fn(db, session)` against the read-preference database. The session is
+// only created when the caller holds a write token.
+export async function withReadSession(token, fn) {
+  const db = await getReadDb();
+  const operationTime = parseWriteToken(token);
+  if (!operationTime) return await fn(db, undefined);
+
+  const client = await clientPromise;
+  const session = client.startSession({ causalConsistency: true });
+  try {
+    session.advanceOperationTime(operationTime);
+    return await fn(db, session);
+  } finally {
+    await session.endSession();
+  }
+}
+
+// Runs `fn(db, session)` on the primary and returns its result with the
+// token to hand back through `rememberWrite`.
+export async function withWriteSession(fn) {
+  const db = await getDb();
+  const client = await clientPromise;
+  const session = client.startSession({ causalConsistency: true });
+  try {
+    const result = await fn(db, session);
+    return { result, token: formatWriteToken(session.operationTime) };
+  } finally {
+    await session.endSession();
+  }
+}
+
+export function rememberWrite(response, token) {
+  if (token) {
+    response.cookies.set(WRITE_TOKEN_COOKIE, token, {
+      httpOnly: true,
+      sameSite: 'lax',
+      path: '/',
+      maxAge: READ_YOUR_WRITES_SECONDS
+    });
+  }
+  return response;
+}
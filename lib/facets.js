@@ -0,0 +1,69 @@
+import { getDb } from './mongodb';
+import { FACET_FIELDS, buildItemQuery, filtersCacheKey } from './items';
+
+// Facet counts for the home page filters, computed with a single `$facet`
+// aggregation and cached per filter context. Item writes bump the cache
+// generation; the TTL bounds staleness for writes made by other instances.
+
+const CACHE_TTL_MS = parseInt(process.env.FACETS_CACHE_TTL_MS || '30000', 10);
+const CACHE_MAX_ENTRIES = 500;
+const MAX_BUCKETS = 50;
+
+const cache = new Map();
+let generation = 0;
+
+export function invalidateFacets() {
+  generation += 1;
+  cache.clear();
+}
+
+function sharedMatch(filters) {
+  // The text search applies to every facet; the field filters are applied per
+  // facet so each one counts the alternatives to its own selection.
+  return filters.search ? { $or: buildItemQuery({ search: filters.search }).$or } : {};
+}
+
+function facetPipeline(filters, field) {
+  const match = buildItemQuery({ ...filters, search: null }, { omit: field });
+  return [
+    { $match: match },
+    { $group: { _id: `$${field}`, count: { $sum: 1 } } },
+    { $sort: { count: -1, _id: 1 } },
+    { $limit: MAX_BUCKETS }
+  ];
+}
+
+async function computeFacets(filters) {
+  const db = await getDb();
+  const facet = {};
+  for (const field of FACET_FIELDS) facet[field] = facetPipeline(filters, field);
+
+  const [result] = await db.collection('items')
+    .aggregate([{ $match: sharedMatch(filters) }, { $facet: facet }])
+    .toArray();
+
+  const facets = {};
+  for (const field of FACET_FIELDS) {
+    facets[field] = (result?.[field] || [])
+      .filter((bucket) => bucket._id !== null && bucket._id !== undefined && bucket._id !== '')
+      .map((bucket) => ({ value: bucket._id, count: bucket.count }));
+  }
+  return facets;
+}
+
+export async function getFacets(filters) {
+  const key = filtersCacheKey(filters);
+  const cached = cache.get(key);
+  if (cached && cached.generation === generation && cached.expiresAt > Date.now()) {
+    return cached.promise;
+  }
+
+  const startedAt = generation;
+  const promise = computeFacets(filters);
+  if (cache.size >= CACHE_MAX_ENTRIES) cache.delete(cache.keys().next().value);
+  cache.set(key, { promise, generation: startedAt, expiresAt: Date.now() + CACHE_TTL_MS });
+  promise.catch(() => {
+    if (cache.get(key)?.promise === promise) cache.delete(key);
+  });
+  return promise;
+}
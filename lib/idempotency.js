@@ -0,0 +1,195 @@
+import { createHash, randomUUID } from 'crypto';
+import { NextResponse } from 'next/server';
+import { getDb } from './mongodb';
+import { rememberWrite, WRITE_TOKEN_COOKIE } from './consistency';
+
+// `Idempotency-Key` support for create endpoints. The first request with a
+// key claims a record in `idempotency_keys`; its response is stored there and
+// replayed for any retry with the same key (per user and endpoint) until the
+// record expires. A duplicate that arrives while the first one is still
+// running waits for it. Server errors release the key so the client can retry.
+// The owner renews its lock while the handler runs, so a slow request is
+// never taken over; a replay also restores the write-token cookie, so a
+// retried create reads its own write like the original response would.
+
+export const IDEMPOTENCY_HEADER = 'idempotency-key';
+
+const TTL_HOURS = parseFloat(process.env.IDEMPOTENCY_TTL_HOURS || '24');
+const LOCK_MS = parseInt(process.env.IDEMPOTENCY_LOCK_MS || '60000', 10);
+const WAIT_TIMEOUT_MS = parseInt(process.env.IDEMPOTENCY_WAIT_MS || '30000', 10);
+const RENEW_INTERVAL_MS = LOCK_MS / 3;
+const POLL_INTERVAL_MS = 200;
+const MAX_KEY_LENGTH = 255;
+
+const inflight = new Map();
+let indexesPromise;
+
+function ensureIdempotencyIndexes(db) {
+  if (!indexesPromise) {
+    indexesPromise = db.collection('idempotency_keys')
+      .createIndex({ expiresAt: 1 }, { name: 'idempotency_ttl', expireAfterSeconds: 0 })
+      .catch((error) => {
+        indexesPromise = null;
+        throw error;
+      });
+  }
+  return indexesPromise;
+}
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+function fingerprintOf(value) {
+  return createHash('sha256').update(JSON.stringify(value ?? null)).digest('hex');
+}
+
+function replay(stored) {
+  const response = NextResponse.json(stored.body, {
+    status: stored.status,
+    headers: { 'Idempotent-Replayed': 'true' }
+  });
+  return rememberWrite(response, stored.writeToken);
+}
+
+function conflict(message, status = 409) {
+  return NextResponse.json({ error: message }, { status });
+}
+
+async function claim(collection, id, fingerprint, owner) {
+  const now = Date.now();
+  try {
+    await collection.insertOne({
+      _id: id,
+      state: 'pending',
+      fingerprint,
+      owner,
+      lockedUntil: new Date(now + LOCK_MS),
+      expiresAt: new Date(now + TTL_HOURS * 60 * 60 * 1000)
+    });
+    return { claimed: true };
+  } catch (error) {
+    if (error.code !== 11000) throw error;
+  }
+
+  // Take over a pending record whose owner died without finishing.
+  const stale = await collection.findOneAndUpdate(
+    { _id: id, state: 'pending', lockedUntil: { $lt: new Date(now) } },
+    { $set: { owner, lockedUntil: new Date(now + LOCK_MS) } },
+    { returnDocument: 'after' }
+  );
+  if (stale) return { claimed: true, record: stale };
+
+  return { claimed: false, record: await collection.findOne({ _id: id }) };
+}
+
+// Extends the lock while the handler runs; stops once another request has
+// taken the record over.
+function holdLock(collection, id, owner) {
+  const timer = setInterval(async () => {
+    try {
+      const { matchedCount } = await collection.updateOne(
+        { _id: id, state: 'pending', owner },
+        { $set: { lockedUntil: new Date(Date.now() + LOCK_MS) } }
+      );
+      if (matchedCount === 0) clearInterval(timer);
+    } catch (error) {
+      console.error('Idempotency lock renewal error:', error);
+    }
+  }, RENEW_INTERVAL_MS);
+  timer.unref?.();
+  return () => clearInterval(timer);
+}
+
+async function stored(response) {
+  return {
+    status: response.status,
+    body: await response.clone().json(),
+    writeToken: response.cookies?.get(WRITE_TOKEN_COOKIE)?.value ?? null
+  };
+}
+
+async function execute(collection, id, owner, handler) {
+  const release = holdLock(collection, id, owner);
+  let response;
+  try {
+    response = await handler();
+  } catch (error) {
+    await collection.deleteOne({ _id: id, owner });
+    throw error;
+  } finally {
+    release();
+  }
+
+  if (response.status >= 500) {
+    await collection.deleteOne({ _id: id, owner });
+    return response;
+  }
+
+  await collection.updateOne(
+    { _id: id, owner },
+    { $set: { state: 'done', response: await stored(response) }, $unset: { lockedUntil: '' } }
+  );
+  return response;
+}
+
+// Runs `handler()` at most once per (scope, userId, Idempotency-Key).
+// `fingerprint` describes the request payload; reusing a key with a
+// different payload is rejected with 422. Requests without the header run
+// the handler directly.
+export async function withIdempotency(request, { scope, userId, fingerprint }, handler) {
+  const key = request.headers.get(IDEMPOTENCY_HEADER);
+  if (!key) return await handler();
+
+  if (key.length > MAX_KEY_LENGTH) {
+    return conflict(`Idempotency-Key must be at most ${MAX_KEY_LENGTH} characters`, 400);
+  }
+
+  const id = `${scope}:${userId}:${key}`;
+  const hash = fingerprintOf(fingerprint);
+
+  // Duplicates within this process share the in-flight execution directly.
+  if (inflight.has(id)) {
+    const stored = await inflight.get(id);
+    if (stored && stored.fingerprint === hash) return replay(stored);
+  }
+
+  const db = await getDb();
+  await ensureIdempotencyIndexes(db);
+  const collection = db.collection('idempotency_keys');
+
+  // Retry the claim until this request owns the key or the first request has
+  // stored its response; give up with 409 after the wait timeout.
+  const deadline = Date.now() + WAIT_TIMEOUT_MS;
+  const owner = randomUUID();
+  let claimed;
+  let record;
+  for (;;) {
+    ({ claimed, record } = await claim(collection, id, hash, owner));
+    if (claimed || record?.state === 'done') break;
+    if (Date.now() >= deadline) {
+      const response = conflict('A request with this Idempotency-Key is still in progress');
+      response.headers.set('Retry-After', String(Math.ceil(LOCK_MS / 1000)));
+      return response;
+    }
+    await sleep(POLL_INTERVAL_MS);
+  }
+
+  if (record && record.fingerprint !== hash) {
+    if (claimed) await collection.deleteOne({ _id: id, state: 'pending', owner });
+    return conflict('Idempotency-Key was already used with a different request', 422);
+  }
+
+  if (!claimed) return replay(record.response);
+
+  let resolveInflight;
+  inflight.set(id, new Promise((resolve) => { resolveInflight = resolve; }));
+  try {
+    const response = await execute(collection, id, owner, handler);
+    resolveInflight(response.status < 500 ? { fingerprint: hash, ...await stored(response) } : null);
+    return response;
+  } catch (error) {
+    resolveInflight(null);
+    throw error;
+  } finally {
+    inflight.delete(id);
+  }
+}
@@ -0,0 +1,96 @@
+// Client-side image downscaling for the report form. Work happens in a Web
+// Worker with OffscreenCanvas where available, falling back to a main-thread
+// canvas. Any failure (e.g. an undecodable format) returns the original file.
+
+export const MAX_IMAGE_DIMENSION = parseInt(process.env.NEXT_PUBLIC_UPLOAD_MAX_DIMENSION || '1600', 10);
+export const IMAGE_QUALITY = parseFloat(process.env.NEXT_PUBLIC_UPLOAD_QUALITY || '0.82');
+
+const WORKER_TIMEOUT_MS = 30000;
+
+let worker;
+let workerFailed = false;
+let nextId = 0;
+const pending = new Map();
+
+// A worker that fails to load or crashes never answers, so every pending
+// job is rejected (the caller then keeps the original file) and later calls
+// resize on the main thread instead.
+function failWorker(error) {
+  workerFailed = true;
+  worker?.terminate();
+  worker = null;
+  for (const request of pending.values()) request.reject(error);
+  pending.clear();
+}
+
+function getWorker() {
+  if (!worker) {
+    worker = new Worker(new URL('./imageResize.worker.js', import.meta.url));
+    worker.onmessage = ({ data }) => {
+      const request = pending.get(data.id);
+      if (!request) return;
+      pending.delete(data.id);
+      if (data.error) request.reject(new Error(data.error));
+      else request.resolve(data.blob);
+    };
+    worker.onerror = (event) => {
+      event.preventDefault?.();
+      failWorker(new Error(event.message || 'Image worker failed'));
+    };
+    worker.onmessageerror = () => failWorker(new Error('Image worker message could not be read'));
+  }
+  return worker;
+}
+
+function resizeInWorker(file, maxDimension, quality) {
+  return new Promise((resolve, reject) => {
+    const id = nextId++;
+    const timer = setTimeout(() => {
+      if (pending.delete(id)) reject(new Error('Image worker timed out'));
+    }, WORKER_TIMEOUT_MS);
+    const settle = (fn) => (value) => {
+      clearTimeout(timer);
+      fn(value);
+    };
+    pending.set(id, { resolve: settle(resolve), reject: settle(reject) });
+    getWorker().postMessage({ id, file, maxDimension, quality });
+  });
+}
+
+async function resizeOnMainThread(file, maxDimension, quality) {
+  const bitmap = await createImageBitmap(file, { imageOrientation: 'from-image' });
+  const scale = Math.min(1, maxDimension / Math.max(bitmap.width, bitmap.height));
+  const canvas = document.createElement('canvas');
+  canvas.width = Math.round(bitmap.width * scale);
+  canvas.height = Math.round(bitmap.height * scale);
+
+  const ctx = canvas.getContext('2d');
+  ctx.fillStyle = '#fff';
+  ctx.fillRect(0, 0, canvas.width, canvas.height);
+  ctx.drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+  bitmap.close();
+
+  return await new Promise((resolve, reject) => {
+    canvas.toBlob(
+      (blob) => (blob ? resolve(blob) : reject(new Error('Failed to encode image'))),
+      'image/jpeg',
+      quality
+    );
+  });
+}
+
+export async function downscaleImage(file, { maxDimension = MAX_IMAGE_DIMENSION, quality = IMAGE_QUALITY } = {}) {
+  if (typeof createImageBitmap !== 'function') return file;
+
+  try {
+    const blob = !workerFailed && typeof Worker !== 'undefined' && typeof OffscreenCanvas !== 'undefined'
+      ? await resizeInWorker(file, maxDimension, quality)
+      : await resizeOnMainThread(file, maxDimension, quality);
+
+    const name = `${(file.name || 'image').replace(/\.[^.]+$/, '')}.jpg`;
+    return new File([blob], name, { type: 'image/jpeg', lastModified: Date.now() });
+  } catch (error) {
+    console.error('Image downscale error:', error);
+    return file;
+  }
+}
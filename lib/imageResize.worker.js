@@ -0,0 +1,26 @@
+// Decodes, downscales and re-encodes an image off the main thread. Drawing
+// to a canvas and re-encoding drops all EXIF metadata.
+
+self.onmessage = async (event) => {
+  const { id, file, maxDimension, quality } = event.data;
+
+  try {
+    const bitmap = await createImageBitmap(file, { imageOrientation: 'from-image' });
+    const scale = Math.min(1, maxDimension / Math.max(bitmap.width, bitmap.height));
+    const width = Math.round(bitmap.width * scale);
+    const height = Math.round(bitmap.height * scale);
+
+    const canvas = new OffscreenCanvas(width, height);
+    const ctx = canvas.getContext('2d');
+    // JPEG has no alpha channel; flatten transparent images onto white.
+    ctx.fillStyle = '#fff';
+    ctx.fillRect(0, 0, width, height);
+    ctx.drawImage(bitmap, 0, 0, width, height);
+    bitmap.close();
+
+    const blob = await canvas.convertToBlob({ type: 'image/jpeg', quality });
+    self.postMessage({ id, blob });
+  } catch (error) {
+    self.postMessage({ id, error: error.message || 'Failed to process image' });
+  }
+};
@@ -0,0 +1,186 @@
+import { getDb } from './mongodb';
+import { buildItem, missingItemFields } from './items';
+import { invalidateFacets } from './facets';
+import { enqueueIndexItem } from './matching';
+import { enqueueSavedSearchMatch } from './savedSearches';
+
+// Bulk item import from a streamed NDJSON or CSV request body. Rows are
+// parsed incrementally, validated like `POST /api/items` and written with
+// unordered `insertMany` batches, so one bad row never blocks the others.
+// Each inserted item then goes through the same post-insert steps as a
+// single report: facets are invalidated per batch, and matching and
+// saved-search alerts are queued.
+
+const BATCH_SIZE = parseInt(process.env.IMPORT_BATCH_SIZE || '1000', 10);
+const MAX_REPORTED_ERRORS = 1000;
+
+function isPlainObject(value) {
+  return value !== null && typeof value === 'object' && !Array.isArray(value);
+}
+
+async function* decodeChunks(stream) {
+  const decoder = new TextDecoder();
+  for await (const chunk of stream) {
+    yield decoder.decode(chunk, { stream: true });
+  }
+  const rest = decoder.decode();
+  if (rest) yield rest;
+}
+
+async function* ndjsonRows(text) {
+  let buffer = '';
+  for await (const chunk of text) {
+    buffer += chunk;
+    let newline;
+    while ((newline = buffer.indexOf('\n')) >= 0) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      if (line) yield line;
+    }
+  }
+  if (buffer.trim()) yield buffer.trim();
+}
+
+// Minimal RFC 4180 parser: quoted fields may contain commas, escaped quotes
+// and newlines, and may span chunk boundaries.
+async function* csvRecords(text) {
+  let field = '';
+  let record = [];
+  let quoted = false;
+  let pendingQuote = false;
+
+  for await (const chunk of text) {
+    for (const char of chunk) {
+      if (quoted) {
+        if (pendingQuote) {
+          pendingQuote = false;
+          if (char === '"') {
+            field += '"';
+            continue;
+          }
+          quoted = false;
+        } else if (char === '"') {
+          pendingQuote = true;
+          continue;
+        } else {
+          field += char;
+          continue;
+        }
+      }
+
+      if (char === '"' && field === '') {
+        quoted = true;
+      } else if (char === ',') {
+        record.push(field);
+        field = '';
+      } else if (char === '\n') {
+        record.push(field.endsWith('\r') ? field.slice(0, -1) : field);
+        if (record.length > 1 || record[0] !== '') yield record;
+        record = [];
+        field = '';
+      } else {
+        field += char;
+      }
+    }
+  }
+
+  if (field !== '' || record.length > 0) {
+    record.push(field);
+    yield record;
+  }
+}
+
+async function* parseRows(stream, format) {
+  const text = decodeChunks(stream);
+
+  if (format === 'csv') {
+    let header = null;
+    for await (const record of csvRecords(text)) {
+      if (!header) {
+        header = record.map((name) => name.trim());
+        continue;
+      }
+      const row = {};
+      header.forEach((name, i) => {
+        if (record[i] !== undefined && record[i] !== '') row[name] = record[i];
+      });
+      yield { row };
+    }
+    return;
+  }
+
+  for await (const line of ndjsonRows(text)) {
+    let row;
+    try {
+      row = JSON.parse(line);
+    } catch {
+      yield { error: 'Invalid JSON' };
+      continue;
+    }
+    // `null`, numbers, strings and arrays are valid JSON but not items.
+    yield isPlainObject(row) ? { row } : { error: 'Row must be a JSON object' };
+  }
+}
+
+export async function importItems(stream, format, user) {
+  const db = await getDb();
+  const report = { received: 0, inserted: 0, failed: 0, errors: [] };
+  let batch = [];
+  let batchRows = [];
+
+  const fail = (row, error) => {
+    report.failed += 1;
+    if (report.errors.length < MAX_REPORTED_ERRORS) report.errors.push({ row, error });
+  };
+
+  const flush = async () => {
+    if (batch.length === 0) return;
+    const failedAt = new Set();
+    try {
+      const result = await db.collection('items').insertMany(batch, { ordered: false });
+      report.inserted += result.insertedCount;
+    } catch (error) {
+      if (!error.writeErrors && !error.result) throw error;
+      report.inserted += error.result?.insertedCount ?? error.insertedCount ?? 0;
+      const writeErrors = [].concat(error.writeErrors || []);
+      for (const writeError of writeErrors) {
+        failedAt.add(writeError.index);
+        fail(batchRows[writeError.index], writeError.errmsg || 'Write failed');
+      }
+    }
+
+    const inserted = batch.filter((item, i) => !failedAt.has(i));
+    if (inserted.length > 0) {
+      invalidateFacets();
+      for (const item of inserted) {
+        enqueueSavedSearchMatch(item);
+        enqueueIndexItem(item);
+      }
+    }
+    batch = [];
+    batchRows = [];
+  };
+
+  for await (const { row, error } of parseRows(stream, format)) {
+    report.received += 1;
+    const rowNumber = report.received;
+
+    if (error) {
+      fail(rowNumber, error);
+      continue;
+    }
+
+    const missing = missingItemFields(row);
+    if (missing.length > 0) {
+      fail(rowNumber, `Missing required fields: ${missing.join(', ')}`);
+      continue;
+    }
+
+    batch.push(buildItem(row, user));
+    batchRows.push(rowNumber);
+    if (batch.length >= BATCH_SIZE) await flush();
+  }
+  await flush();
+
+  return report;
+}
@@ -0,0 +1,89 @@
+import { v4 as uuidv4 } from 'uuid';
+
+// Shared item helpers: parsing of the `GET /api/items` search/filter
+// parameters so every read path builds the same Mongo query, and the
+// validation/shape of new items used by both single and bulk creation.
+
+export const FACET_FIELDS = ['category', 'location', 'status', 'verified'];
+
+export const DEFAULT_PAGE_SIZE = 24;
+export const MAX_PAGE_SIZE = 100;
+
+export function parseItemFilters(searchParams) {
+  const value = (name) => {
+    const raw = searchParams.get(name);
+    return raw && raw !== 'all' ? raw : null;
+  };
+
+  return {
+    search: searchParams.get('search') || null,
+    category: value('category'),
+    location: value('location'),
+    status: value('status'),
+    verified: searchParams.get('verified') === 'true' ? true : null
+  };
+}
+
+// `omit` leaves one filter out, which is what a facet needs to count the
+// alternatives to its own current selection.
+export function buildItemQuery(filters, { omit } = {}) {
+  const query = {};
+
+  if (filters.search) {
+    query.$or = [
+      { title: { $regex: filters.search, $options: 'i' } },
+      { description: { $regex: filters.search, $options: 'i' } },
+      { location: { $regex: filters.search, $options: 'i' } },
+      { category: { $regex: filters.search, $options: 'i' } }
+    ];
+  }
+
+  for (const field of FACET_FIELDS) {
+    if (field !== omit && filters[field] !== null && filters[field] !== undefined) {
+      query[field] = filters[field];
+    }
+  }
+
+  return query;
+}
+
+// Pagination is opt-in: without `limit` the endpoint keeps returning everything.
+export function parsePagination(searchParams) {
+  const limitParam = searchParams.get('limit');
+  if (!limitParam) return null;
+
+  const limit = Math.min(Math.max(parseInt(limitParam, 10) || DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE);
+  const page = Math.max(parseInt(searchParams.get('page') || '1', 10) || 1, 1);
+  return { limit, page, skip: (page - 1) * limit };
+}
+
+export function filtersCacheKey(filters) {
+  return JSON.stringify(['search', ...FACET_FIELDS].map((field) => filters[field] ?? null));
+}
+
+export const REQUIRED_ITEM_FIELDS = ['title', 'description', 'category', 'status', 'location', 'date'];
+
+export function missingItemFields(body) {
+  return REQUIRED_ITEM_FIELDS.filter((field) => !body[field]);
+}
+
+export function buildItem(body, user) {
+  const { title, description, category, status, location, date, image, contactInfo } = body;
+  return {
+    id: uuidv4(),
+    title,
+    description,
+    category,
+    status,
+    location,
+    date,
+    image: image || null,
+    contactInfo: contactInfo || user.email,
+    userId: user.id,
+    userName: user.name,
+    userEmail: user.email,
+    verified: false,
+    resolved: false,
+    createdAt: new Date().toISOString()
+  };
+}
@@ -0,0 +1,28 @@
+import { getFacets } from './facets';
+import { buildItemQuery } from './items';
+import { withReadSession } from './consistency';
+
+// First page of the home listing for server rendering. Documents are
+// projected to plain JSON-safe fields so they can be passed to client
+// components as props. `writeToken` is the caller's read-your-own-writes
+// cookie (see lib/consistency.js).
+
+export async function fetchItemsPage(filters, { page = 1, limit, writeToken }) {
+  const [docs, facets] = await Promise.all([
+    withReadSession(writeToken, (db, session) =>
+      db.collection('items')
+        .find(buildItemQuery(filters), { projection: { _id: 0, features: 0 }, session })
+        .sort({ createdAt: -1 })
+        .skip((page - 1) * limit)
+        .limit(limit + 1)
+        .toArray()
+    ),
+    getFacets(filters)
+  ]);
+
+  return {
+    items: docs.slice(0, limit),
+    hasMore: docs.length > limit,
+    facets
+  };
+}
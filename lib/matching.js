@@ -0,0 +1,336 @@
+import { getDb } from './mongodb';
+import { notifyMatches } from './notifications';
+import { onShutdown } from './shutdown';
+
+// Lost <-> Found matching. Every item carries a compact feature vector
+// (top TF-IDF terms plus category/location/day) and a small set of index keys.
+// A new report only scores the opposite-status items that share a key and fall
+// inside the date window, so the work per report stays bounded. The
+// category alone is only used as a key for items without usable terms, since
+// it would otherwise pull in the whole category.
+
+const TOP_K = parseInt(process.env.MATCH_TOP_K || '5', 10);
+const CANDIDATE_LIMIT = parseInt(process.env.MATCH_CANDIDATE_LIMIT || '200', 10);
+const DATE_WINDOW_DAYS = parseInt(process.env.MATCH_DATE_WINDOW_DAYS || '60', 10);
+const MIN_SCORE = parseFloat(process.env.MATCH_MIN_SCORE || '0.15');
+const BACKFILL_BATCH_SIZE = parseInt(process.env.MATCH_BACKFILL_BATCH_SIZE || '100', 10);
+const QUEUE_MAX = parseInt(process.env.MATCH_QUEUE_MAX || '10000', 10);
+
+const MAX_TERMS = 16;
+const MAX_KEY_TERMS = 8;
+const DAY_MS = 24 * 60 * 60 * 1000;
+const DOC_COUNT_KEY = '__docs';
+
+const STOPWORDS = new Set([
+  'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have',
+  'i', 'in', 'is', 'it', 'its', 'my', 'near', 'of', 'on', 'or', 'our', 'that',
+  'the', 'this', 'to', 'was', 'were', 'with', 'lost', 'found', 'item', 'please'
+]);
+
+let indexesPromise;
+
+export function ensureMatchingIndexes(db) {
+  if (!indexesPromise) {
+    indexesPromise = Promise.all([
+      db.collection('items').createIndex(
+        { 'features.side': 1, 'features.keys': 1, 'features.day': 1 },
+        { name: 'matching_candidates' }
+      ),
+      db.collection('items').createIndex({ 'matches.id': 1 }, { name: 'matching_backrefs' }),
+    ]).catch((error) => {
+      indexesPromise = null;
+      throw error;
+    });
+  }
+  return indexesPromise;
+}
+
+export function tokenize(text) {
+  return (text || '')
+    .toLowerCase()
+    .split(/[^a-z0-9]+/)
+    .filter((token) => token.length > 1 && !STOPWORDS.has(token))
+    .map((token) => (token.length > 3 && token.endsWith('s') ? token.slice(0, -1) : token));
+}
+
+function oppositeSide(status) {
+  return (status || '').toLowerCase() === 'lost' ? 'found' : 'lost';
+}
+
+function toDay(date) {
+  const time = new Date(date).getTime();
+  return Number.isNaN(time) ? null : Math.floor(time / DAY_MS);
+}
+
+function termCounts(item) {
+  const counts = new Map();
+  // Titles are short and descriptive, so they count double.
+  for (const token of tokenize(item.title)) counts.set(token, (counts.get(token) || 0) + 2);
+  for (const token of tokenize(item.description)) counts.set(token, (counts.get(token) || 0) + 1);
+  return counts;
+}
+
+async function loadDocumentFrequencies(db, terms) {
+  const ids = [DOC_COUNT_KEY, ...terms];
+  const rows = await db.collection('match_stats').find({ _id: { $in: ids } }).toArray();
+  const df = new Map(rows.map((row) => [row._id, row.n]));
+  return { docs: df.get(DOC_COUNT_KEY) || 0, df };
+}
+
+// Applies document-frequency changes: +1 for each term an item gained, -1
+// for each it lost, and `docs` (+1 new item, -1 deleted, 0 edited).
+async function updateDocumentFrequencies(db, { added = [], removed = [], docs = 0 }) {
+  const deltas = new Map();
+  for (const term of added) deltas.set(term, (deltas.get(term) || 0) + 1);
+  for (const term of removed) deltas.set(term, (deltas.get(term) || 0) - 1);
+  if (docs) deltas.set(DOC_COUNT_KEY, docs);
+
+  const ops = [...deltas]
+    .filter(([, n]) => n !== 0)
+    .map(([term, n]) => ({
+      updateOne: { filter: { _id: term }, update: { $inc: { n } }, upsert: true }
+    }));
+  if (ops.length > 0) await db.collection('match_stats').bulkWrite(ops, { ordered: false });
+}
+
+// Every term an item contributed to the document frequencies. Tokenizing is
+// deterministic, so this can be recomputed from the stored text.
+function countedTerms(item) {
+  return [...termCounts(item).keys()];
+}
+
+export async function buildFeatures(db, item) {
+  const counts = termCounts(item);
+  const allTerms = [...counts.keys()];
+  const { docs, df } = await loadDocumentFrequencies(db, allTerms);
+
+  const total = [...counts.values()].reduce((sum, n) => sum + n, 0) || 1;
+  const weighted = allTerms.map((term) => {
+    const idf = Math.log((docs + 1) / ((df.get(term) || 0) + 1)) + 1;
+    return { t: term, w: (counts.get(term) / total) * idf };
+  });
+  weighted.sort((a, b) => b.w - a.w);
+
+  const terms = weighted.slice(0, MAX_TERMS);
+  const norm = Math.sqrt(terms.reduce((sum, { w }) => sum + w * w, 0)) || 1;
+  for (const term of terms) term.w = term.w / norm;
+
+  const category = (item.category || '').toLowerCase();
+  const termKeys = terms.slice(0, MAX_KEY_TERMS).map(({ t }) => `t:${t}`);
+  const keys = termKeys.length > 0 ? termKeys : [`c:${category}`];
+
+  return {
+    features: {
+      side: (item.status || '').toLowerCase(),
+      category,
+      location: [...new Set(tokenize(item.location))],
+      day: toDay(item.date),
+      terms,
+      keys
+    },
+    allTerms
+  };
+}
+
+function cosine(a, b) {
+  const weights = new Map(a.map(({ t, w }) => [t, w]));
+  let dot = 0;
+  for (const { t, w } of b) {
+    if (weights.has(t)) dot += weights.get(t) * w;
+  }
+  return dot;
+}
+
+function jaccard(a, b) {
+  if (!a.length || !b.length) return 0;
+  const set = new Set(a);
+  const shared = b.filter((token) => set.has(token)).length;
+  return shared / (set.size + b.length - shared);
+}
+
+export function scoreMatch(a, b) {
+  const text = cosine(a.terms, b.terms);
+  const category = a.category && a.category === b.category ? 1 : 0;
+  const location = jaccard(a.location, b.location);
+  const proximity = a.day != null && b.day != null ? Math.exp(-Math.abs(a.day - b.day) / 14) : 0;
+  return 0.6 * text + 0.2 * category + 0.1 * location + 0.1 * proximity;
+}
+
+// Postings are read key by key in the order of the new item's term weights
+// (the heaviest, most distinctive terms first), each query capped at the
+// remaining budget. When a common term has more postings than the limit,
+// the candidates sharing the item's strongest terms are the ones scored.
+async function findCandidates(db, features) {
+  const base = { 'features.side': oppositeSide(features.side) };
+  if (features.day != null) {
+    base['features.day'] = {
+      $gte: features.day - DATE_WINDOW_DAYS,
+      $lte: features.day + DATE_WINDOW_DAYS
+    };
+  }
+
+  const candidates = [];
+  const seen = [];
+  for (const key of features.keys) {
+    const remaining = CANDIDATE_LIMIT - candidates.length;
+    if (remaining <= 0) break;
+
+    const batch = await db.collection('items')
+      .find(
+        { ...base, 'features.keys': key, id: { $nin: seen } },
+        { projection: { _id: 0, id: 1, title: 1, status: 1, features: 1 } }
+      )
+      .limit(remaining)
+      .toArray();
+
+    for (const candidate of batch) {
+      candidates.push(candidate);
+      seen.push(candidate.id);
+    }
+  }
+  return candidates;
+}
+
+// Computes features for a freshly inserted item, scores it against indexed
+// candidates of the opposite status and stores the top-K matches on both sides.
+// `recordTerms: false` skips the document-frequency update for items whose
+// terms were already accounted for (edits).
+export async function indexItem(item, { recordTerms = true } = {}) {
+  const db = await getDb();
+  await ensureMatchingIndexes(db);
+
+  const { features, allTerms } = await buildFeatures(db, item);
+  const wasCounted = Boolean(item.features);
+  const candidates = await findCandidates(db, features);
+
+  const matches = candidates
+    .map((candidate) => ({
+      id: candidate.id,
+      title: candidate.title,
+      status: candidate.status,
+      score: Number(scoreMatch(features, candidate.features).toFixed(4))
+    }))
+    .filter((match) => match.score >= MIN_SCORE)
+    .sort((a, b) => b.score - a.score)
+    .slice(0, TOP_K);
+
+  await db.collection('items').updateOne(
+    { id: item.id },
+    { $set: { features, matches } }
+  );
+
+  if (matches.length > 0) {
+    await db.collection('items').bulkWrite(
+      matches.map((match) => ({
+        updateOne: {
+          filter: { id: match.id },
+          update: {
+            $push: {
+              matches: {
+                $each: [{ id: item.id, title: item.title, status: item.status, score: match.score }],
+                $sort: { score: -1 },
+                $slice: TOP_K
+              }
+            }
+          }
+        }
+      })),
+      { ordered: false }
+    );
+  }
+
+  if (recordTerms && !wasCounted) await updateDocumentFrequencies(db, { added: allTerms, docs: 1 });
+  return matches;
+}
+
+// Re-scores an edited item: its old back-references are dropped before the
+// new features and matches are stored, and the document frequencies move
+// from the terms of `previous` to those of `item`.
+export async function reindexItem(previous, item) {
+  const db = await getDb();
+  await removeItemMatches(item.id);
+  const matches = await indexItem(item, { recordTerms: false });
+  if (previous.features) {
+    await updateDocumentFrequencies(db, { added: countedTerms(item), removed: countedTerms(previous) });
+  } else {
+    await updateDocumentFrequencies(db, { added: countedTerms(item), docs: 1 });
+  }
+  return matches;
+}
+
+// Indexes items created before matching existed (no `features` yet), one
+// batch per call in `_id` order. `nextCursor` resumes after the last item
+// looked at, so items that failed are not retried forever; it is null once
+// the backfill has reached the end.
+export async function backfillMatching({ batchSize = BACKFILL_BATCH_SIZE, after = null } = {}) {
+  const db = await getDb();
+  const query = { features: { $exists: false } };
+  if (after) query._id = { $gt: after };
+
+  const batch = await db.collection('items')
+    .find(query)
+    .sort({ _id: 1 })
+    .limit(batchSize)
+    .toArray();
+
+  const report = { indexed: 0, failed: 0, nextCursor: null };
+  for (const { _id, ...item } of batch) {
+    try {
+      await indexItem(item);
+      report.indexed += 1;
+    } catch (error) {
+      console.error('Match backfill error:', error);
+      report.failed += 1;
+    }
+  }
+  if (batch.length === batchSize) report.nextCursor = batch[batch.length - 1]._id.toHexString();
+  return report;
+}
+
+// Removes a deleted item from matching: back-references from the items it
+// was matched with, and its terms from the document frequencies.
+export async function unindexItem(item) {
+  await removeItemMatches(item.id);
+  if (item.features) {
+    const db = await getDb();
+    await updateDocumentFrequencies(db, { removed: countedTerms(item), docs: -1 });
+  }
+}
+
+// Drops back-references to a deleted item from the items it was matched with.
+export async function removeItemMatches(id) {
+  const db = await getDb();
+  await db.collection('items').updateMany(
+    { 'matches.id': id },
+    { $pull: { matches: { id } } }
+  );
+}
+
+const queue = [];
+let draining = null;
+
+async function drain() {
+  while (queue.length > 0) {
+    const item = queue.shift();
+    try {
+      const matches = await indexItem(item);
+      await notifyMatches(item, matches);
+    } catch (error) {
+      console.error('Match indexing error:', error);
+    }
+  }
+  draining = null;
+}
+
+// Indexes and notifies matches for items created in bulk, one at a time
+// after the response. Items beyond the queue cap keep no `features` and are
+// picked up by the backfill instead.
+export function enqueueIndexItem(item) {
+  if (queue.length >= QUEUE_MAX) return;
+  queue.push(item);
+  if (!draining) {
+    draining = new Promise((resolve) => setImmediate(resolve)).then(drain);
+  }
+}
+
+onShutdown(() => draining);
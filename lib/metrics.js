@@ -0,0 +1,288 @@
+import diagnosticsChannel from 'diagnostics_channel';
+import { monitorEventLoopDelay, performance, PerformanceObserver } from 'perf_hooks';
+import v8 from 'v8';
+
+// Process metrics in the Prometheus text exposition format, served by
+// /api/metrics. Collectors are plain objects in a registry kept on `global`,
+// because instrumentation.js, route handlers and lib modules are bundled
+// separately but must record into the same series.
+//
+// HTTP request counts and latency come from the `http.server.*` diagnostics
+// channels, so every route is measured without wrapping handlers. Paths are
+// reduced to route patterns (ids become `[id]`) to keep label cardinality
+// bounded.
+
+const LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+const GC_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1];
+const MAX_ROUTES = 200;
+const LAG_WINDOW_MS = 10000;
+const ID_SEGMENT = /^(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{24}|\d+)(?:\.\w+)?$/i;
+
+if (!global._metrics) {
+  global._metrics = { collectors: new Map(), routes: new Set(), started: { runtime: false, http: false } };
+}
+
+const registry = global._metrics;
+
+function labelKey(labels) {
+  return JSON.stringify(labels || {});
+}
+
+function escapeLabel(value) {
+  return String(value).replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"');
+}
+
+function formatLabels(labels, extra) {
+  const entries = Object.entries({ ...labels, ...extra });
+  if (entries.length === 0) return '';
+  return `{${entries.map(([name, value]) => `${name}="${escapeLabel(value)}"`).join(',')}}`;
+}
+
+function register(name, create) {
+  if (!registry.collectors.has(name)) registry.collectors.set(name, create());
+  return registry.collectors.get(name);
+}
+
+export function counter(name, help) {
+  return register(name, () => {
+    const values = new Map();
+    return {
+      inc(labels = {}, n = 1) {
+        const key = labelKey(labels);
+        const entry = values.get(key) || { labels, value: 0 };
+        entry.value += n;
+        values.set(key, entry);
+      },
+      render() {
+        const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} counter`];
+        for (const { labels, value } of values.values()) lines.push(`${name}${formatLabels(labels)} ${value}`);
+        return lines;
+      }
+    };
+  });
+}
+
+// `collect()` (optional) returns [{ labels, value }] at scrape time.
+export function gauge(name, help, collect) {
+  return register(name, () => {
+    const values = new Map();
+    return {
+      set(labels = {}, value) {
+        values.set(labelKey(labels), { labels, value });
+      },
+      inc(labels = {}, n = 1) {
+        const key = labelKey(labels);
+        const entry = values.get(key) || { labels, value: 0 };
+        entry.value += n;
+        values.set(key, entry);
+      },
+      dec(labels = {}, n = 1) {
+        this.inc(labels, -n);
+      },
+      render() {
+        const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} gauge`];
+        const samples = collect ? collect() : [...values.values()];
+        for (const { labels, value } of samples) lines.push(`${name}${formatLabels(labels)} ${value}`);
+        return lines;
+      }
+    };
+  });
+}
+
+export function histogram(name, help, buckets = LATENCY_BUCKETS) {
+  return register(name, () => {
+    const series = new Map();
+    return {
+      observe(labels = {}, value) {
+        const key = labelKey(labels);
+        let entry = series.get(key);
+        if (!entry) {
+          entry = { labels, counts: new Array(buckets.length).fill(0), sum: 0, count: 0 };
+          series.set(key, entry);
+        }
+        for (let i = 0; i < buckets.length; i++) {
+          if (value <= buckets[i]) entry.counts[i] += 1;
+        }
+        entry.sum += value;
+        entry.count += 1;
+      },
+      render() {
+        const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} histogram`];
+        for (const { labels, counts, sum, count } of series.values()) {
+          buckets.forEach((bound, i) => lines.push(`${name}_bucket${formatLabels(labels, { le: bound })} ${counts[i]}`));
+          lines.push(`${name}_bucket${formatLabels(labels, { le: '+Inf' })} ${count}`);
+          lines.push(`${name}_sum${formatLabels(labels)} ${sum}`);
+          lines.push(`${name}_count${formatLabels(labels)} ${count}`);
+        }
+        return lines;
+      }
+    };
+  });
+}
+
+export function routeLabel(url) {
+  const pathname = (url || '/').split('?')[0];
+  if (!pathname.startsWith('/api/')) {
+    return pathname.startsWith('/_next/') ? '/_next' : 'page';
+  }
+  const route = pathname
+    .split('/')
+    .map((segment) => (ID_SEGMENT.test(segment) ? '[id]' : segment))
+    .join('/');
+
+  if (registry.routes.has(route)) return route;
+  if (registry.routes.size >= MAX_ROUTES) return 'other';
+  registry.routes.add(route);
+  return route;
+}
+
+// Subscribes to the HTTP server diagnostics channels once per process.
+export function startHttpMetrics() {
+  if (registry.started.http) return;
+  registry.started.http = true;
+
+  const requests = counter('http_requests_total', 'HTTP requests by route, method and status');
+  const duration = histogram('http_request_duration_seconds', 'HTTP request latency by route and method');
+  const inFlight = gauge('http_requests_in_flight', 'HTTP requests currently being served');
+  const startTimes = new WeakMap();
+
+  diagnosticsChannel.subscribe('http.server.request.start', ({ request }) => {
+    startTimes.set(request, performance.now());
+    inFlight.inc();
+  });
+
+  diagnosticsChannel.subscribe('http.server.response.finish', ({ request, response }) => {
+    const startedAt = startTimes.get(request);
+    if (startedAt === undefined) return;
+    startTimes.delete(request);
+    inFlight.dec();
+
+    const route = routeLabel(request.url);
+    requests.inc({ route, method: request.method, status: response.statusCode });
+    duration.observe({ route, method: request.method }, (performance.now() - startedAt) / 1000);
+  });
+}
+
+// Event-loop delay and utilization, heap/RSS and GC pauses.
+export function startRuntimeMetrics() {
+  if (registry.started.runtime) return;
+  registry.started.runtime = true;
+
+  // Delay percentiles cover a rolling window rather than "since the last
+  // scrape", so they stay meaningful for in-process readers too.
+  const loopDelay = monitorEventLoopDelay({ resolution: 10 });
+  loopDelay.enable();
+  registry.loopDelay = loopDelay;
+  setInterval(() => loopDelay.reset(), LAG_WINDOW_MS).unref();
+
+  let lastElu = performance.eventLoopUtilization();
+  gauge('nodejs_eventloop_utilization', 'Event-loop utilization since the previous scrape (0-1)', () => {
+    const current = performance.eventLoopUtilization();
+    const delta = performance.eventLoopUtilization(current, lastElu);
+    lastElu = current;
+    return [{ labels: {}, value: delta.utilization }];
+  });
+
+  gauge('nodejs_eventloop_lag_seconds', `Event-loop delay percentiles over the last ${LAG_WINDOW_MS / 1000}s`, () => {
+    const samples = [50, 90, 99].map((p) => ({
+      labels: { quantile: p / 100 },
+      value: loopDelay.percentile(p) / 1e9
+    }));
+    samples.push({ labels: { quantile: 'max' }, value: loopDelay.max / 1e9 });
+    return samples;
+  });
+
+  gauge('nodejs_memory_bytes', 'Process memory usage by type', () => {
+    const usage = process.memoryUsage();
+    return ['rss', 'heapTotal', 'heapUsed', 'external', 'arrayBuffers'].map((type) => ({
+      labels: { type },
+      value: usage[type]
+    }));
+  });
+
+  gauge('nodejs_heap_size_limit_bytes', 'V8 heap size limit (--max-old-space-size)', () => [
+    { labels: {}, value: v8.getHeapStatistics().heap_size_limit }
+  ]);
+
+  gauge('nodejs_heap_space_used_bytes', 'V8 heap space usage by space', () =>
+    v8.getHeapSpaceStatistics().map((space) => ({
+      labels: { space: space.space_name },
+      value: space.space_used_size
+    }))
+  );
+
+  const gcDuration = histogram('nodejs_gc_duration_seconds', 'Garbage collection pauses by kind', GC_BUCKETS);
+  const GC_KINDS = { 1: 'minor', 2: 'major', 4: 'incremental', 8: 'weakcb', 15: 'all' };
+  const observer = new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+      gcDuration.observe({ kind: GC_KINDS[entry.detail?.kind] || 'other' }, entry.duration / 1000);
+    }
+  });
+  observer.observe({ entryTypes: ['gc'] });
+
+  gauge('process_uptime_seconds', 'Process uptime', () => [{ labels: {}, value: process.uptime() }]);
+}
+
+// p99 event-loop delay over the current window, in milliseconds.
+export function eventLoopLagMs() {
+  return registry.loopDelay ? registry.loopDelay.percentile(99) / 1e6 : 0;
+}
+
+// Mongo connection pool state from the driver's CMAP events.
+export function trackMongoPool(client) {
+  if (!registry.pool) {
+    registry.pool = { connections: 0, checkedOut: 0, waitQueue: 0 };
+    const pool = registry.pool;
+    gauge('mongodb_pool_connections', 'Mongo connections by state', () => [
+      { labels: { state: 'open' }, value: pool.connections },
+      { labels: { state: 'checked_out' }, value: pool.checkedOut },
+      { labels: { state: 'wait_queue' }, value: pool.waitQueue }
+    ]);
+  }
+
+  const pool = registry.pool;
+  const checkoutFailures = counter('mongodb_pool_checkout_failures_total', 'Failed Mongo connection checkouts by reason');
+  const waitTimes = new Map();
+  const checkoutWait = histogram('mongodb_pool_checkout_wait_seconds', 'Time spent waiting for a pooled Mongo connection');
+
+  client.on('connectionCreated', () => { pool.connections += 1; });
+  client.on('connectionClosed', () => { pool.connections = Math.max(0, pool.connections - 1); });
+  client.on('connectionCheckOutStarted', (event) => {
+    pool.waitQueue += 1;
+    const queue = waitTimes.get(event.address) || [];
+    queue.push(performance.now());
+    waitTimes.set(event.address, queue);
+  });
+  const checkoutDone = (event) => {
+    pool.waitQueue = Math.max(0, pool.waitQueue - 1);
+    const startedAt = waitTimes.get(event.address)?.shift();
+    if (startedAt !== undefined) checkoutWait.observe({}, (performance.now() - startedAt) / 1000);
+  };
+  client.on('connectionCheckedOut', (event) => {
+    checkoutDone(event);
+    pool.checkedOut += 1;
+  });
+  client.on('connectionCheckOutFailed', (event) => {
+    checkoutDone(event);
+    checkoutFailures.inc({ reason: event.reason });
+  });
+  client.on('connectionCheckedIn', () => { pool.checkedOut = Math.max(0, pool.checkedOut - 1); });
+}
+
+export function getPoolStats() {
+  return registry.pool || { connections: 0, checkedOut: 0, waitQueue: 0 };
+}
+
+export function renderMetrics() {
+  const lines = [];
+  for (const collector of registry.collectors.values()) lines.push(...collector.render());
+  return `${lines.join('\n')}\n`;
+}
+
+// Upload bytes received and held in memory or not yet flushed to disk.
+// Pass a positive count when bytes arrive and the negative count once they
+// are written.
+export function trackUploadBytes(bytes) {
+  gauge('upload_bytes_in_flight', 'Upload bytes received but not yet written to disk').inc({}, bytes);
+  if (bytes > 0) counter('upload_bytes_total', 'Upload bytes received').inc({}, bytes);
+}
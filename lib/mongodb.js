@@ -1,11 +1,17 @@
-import { MongoClient } from 'mongodb';
+import { MongoClient, ReadPreference } from 'mongodb';
+import { trackMongoPool } from './metrics';
 
 if (!process.env.MONGO_URL) {
   throw new Error('Please add your Mongo URI to .env');
 }
 
 const uri = process.env.MONGO_URL;
-const options = {};
+// Pool bounds per process. The cluster launcher divides MONGO_POOL_BUDGET
+// across its workers and passes each one its share here.
+const options = {
+  maxPoolSize: parseInt(process.env.MONGO_MAX_POOL_SIZE || '100', 10),
+  minPoolSize: parseInt(process.env.MONGO_MIN_POOL_SIZE || '0', 10)
+};
 
 let client;
 let clientPromise;
@@ -13,17 +19,43 @@ let clientPromise;
 if (process.env.NODE_ENV === 'development') {
   if (!global._mongoClientPromise) {
     client = new MongoClient(uri, options);
+    trackMongoPool(client);
     global._mongoClientPromise = client.connect();
   }
   clientPromise = global._mongoClientPromise;
 } else {
   client = new MongoClient(uri, options);
+  trackMongoPool(client);
   clientPromise = client.connect();
 }
 
 export default clientPromise;
 
+const DB_NAME = process.env.DB_NAME || 'lostandfound';
+
+// Browsing reads (list, search, detail) may be served by secondaries.
+// MONGO_MAX_STALENESS_SECONDS must be at least 90 when set.
+const READ_PREFERENCE = process.env.MONGO_READ_PREFERENCE || 'secondaryPreferred';
+const MAX_STALENESS_SECONDS = parseInt(process.env.MONGO_MAX_STALENESS_SECONDS || '0', 10);
+
+const readPreference = READ_PREFERENCE === ReadPreference.PRIMARY
+  ? ReadPreference.primary
+  : new ReadPreference(READ_PREFERENCE, undefined, MAX_STALENESS_SECONDS > 0 ? { maxStalenessSeconds: MAX_STALENESS_SECONDS } : {});
+
 export async function getDb() {
   const client = await clientPromise;
-  return client.db(process.env.DB_NAME || 'lostandfound');
+  return client.db(DB_NAME);
+}
+
+// Database handle for reads that tolerate replication lag.
+export async function getReadDb() {
+  const client = await clientPromise;
+  return client.db(DB_NAME, { readPreference });
+}
+
+// Database handle pinned to the primary regardless of the connection string's
+// read preference, for lookups that must see the latest write (auth).
+export async function getPrimaryDb() {
+  const client = await clientPromise;
+  return client.db(DB_NAME, { readPreference: ReadPreference.primary });
 }
@@ -0,0 +1,200 @@
+import { ObjectId } from 'mongodb';
+import { v4 as uuidv4 } from 'uuid';
+import { getDb } from './mongodb';
+import { getWriteBuffer } from './writeBuffer';
+
+// Per-user notification inbox. Notifications are queued in a write buffer,
+// so a burst of events (e.g. an admin verifying many items) is persisted
+// with one `insertMany` plus one counter `bulkWrite` per flush instead of
+// a pair of writes per recipient. Unread counts live in
+// `notification_counters` and are read by key, never counted.
+
+export const NOTIFICATION_TYPES = ['item_verified', 'item_updated', 'item_matched', 'saved_search'];
+
+const DEFAULT_LIMIT = 20;
+const MAX_LIMIT = 100;
+
+let indexesPromise;
+
+function ensureNotificationIndexes(db) {
+  if (!indexesPromise) {
+    indexesPromise = Promise.all([
+      db.collection('notifications').createIndex({ userId: 1, _id: -1 }, { name: 'notifications_inbox' }),
+      db.collection('notifications').createIndex({ userId: 1, read: 1 }, { name: 'notifications_unread' })
+    ]).catch((error) => {
+      indexesPromise = null;
+      throw error;
+    });
+  }
+  return indexesPromise;
+}
+
+// Counts only the notifications this flush inserted. Duplicates were stored
+// by an earlier flush whose outcome was lost, so it is unknown whether they
+// were counted; those users' counters are recomputed from the inbox instead.
+async function incrementUnread(inserted, duplicates = []) {
+  const recount = new Set(duplicates.map(({ userId }) => userId));
+  const counts = new Map();
+  for (const { userId } of inserted) {
+    if (!recount.has(userId)) counts.set(userId, (counts.get(userId) || 0) + 1);
+  }
+
+  const db = await getDb();
+  const unread = await Promise.all([...recount].map(async (userId) => [
+    userId,
+    await db.collection('notifications').countDocuments({ userId, read: false })
+  ]));
+
+  await db.collection('notification_counters').bulkWrite(
+    [
+      ...[...counts].map(([userId, n]) => ({
+        updateOne: { filter: { _id: userId }, update: { $inc: { unread: n } }, upsert: true }
+      })),
+      ...unread.map(([userId, n]) => ({
+        updateOne: { filter: { _id: userId }, update: { $set: { unread: n } }, upsert: true }
+      }))
+    ],
+    { ordered: false }
+  );
+}
+
+function notificationBuffer() {
+  return getWriteBuffer(
+    'notifications',
+    async () => {
+      const db = await getDb();
+      await ensureNotificationIndexes(db);
+      return db.collection('notifications');
+    },
+    {
+      maxSize: parseInt(process.env.NOTIFICATION_BUFFER_MAX_SIZE || '500', 10),
+      maxDelayMs: parseInt(process.env.NOTIFICATION_BUFFER_FLUSH_MS || '500', 10),
+      onFlush: incrementUnread
+    }
+  );
+}
+
+// Queues one notification per event. `_id` is assigned here so inbox order
+// follows event time rather than flush time.
+export function notify(events) {
+  const buffer = notificationBuffer();
+  const createdAt = new Date().toISOString();
+  for (const { userId, type, itemId, title, message } of [].concat(events)) {
+    if (!userId) continue;
+    buffer.push({
+      _id: new ObjectId(),
+      id: uuidv4(),
+      userId,
+      type,
+      itemId,
+      title,
+      message,
+      read: false,
+      createdAt
+    });
+  }
+}
+
+// Notifications for a PUT on an item, addressed to its owner unless the
+// owner made the change.
+export function notifyItemUpdated(item, updates, actor) {
+  if (!item.userId || item.userId === actor.id) return;
+
+  if (updates.verified === true && !item.verified) {
+    notify({
+      userId: item.userId,
+      type: 'item_verified',
+      itemId: item.id,
+      title: 'Your item was verified',
+      message: `"${item.title}" was verified by an admin.`
+    });
+  } else {
+    notify({
+      userId: item.userId,
+      type: 'item_updated',
+      itemId: item.id,
+      title: 'Your item was updated',
+      message: `"${item.title}" was updated by ${actor.name || 'an admin'}.`
+    });
+  }
+}
+
+// Tells the owners of previously reported items that a new report matches them.
+export async function notifyMatches(item, matches) {
+  if (!matches?.length) return;
+
+  const db = await getDb();
+  const owners = await db.collection('items')
+    .find({ id: { $in: matches.map((match) => match.id) } }, { projection: { _id: 0, id: 1, userId: 1, title: 1 } })
+    .toArray();
+
+  notify(owners
+    .filter((owner) => owner.userId && owner.userId !== item.userId)
+    .map((owner) => ({
+      userId: owner.userId,
+      type: 'item_matched',
+      itemId: owner.id,
+      title: 'Possible match for your item',
+      message: `A ${item.status} report "${item.title}" may match "${owner.title}".`
+    })));
+}
+
+export function parseInboxParams(searchParams) {
+  const limit = parseInt(searchParams.get('limit') || String(DEFAULT_LIMIT), 10);
+  const cursor = searchParams.get('cursor');
+  return {
+    limit: Math.min(Math.max(Number.isNaN(limit) ? DEFAULT_LIMIT : limit, 1), MAX_LIMIT),
+    cursor: cursor && ObjectId.isValid(cursor) ? new ObjectId(cursor) : null,
+    unreadOnly: searchParams.get('unread') === 'true'
+  };
+}
+
+// Newest first, keyset-paginated on `_id`: `nextCursor` is the `_id` of the
+// last notification returned.
+export async function listNotifications(userId, { limit = DEFAULT_LIMIT, cursor = null, unreadOnly = false } = {}) {
+  const db = await getDb();
+  await ensureNotificationIndexes(db);
+
+  const query = { userId };
+  if (cursor) query._id = { $lt: cursor };
+  if (unreadOnly) query.read = false;
+
+  const docs = await db.collection('notifications')
+    .find(query, { projection: { userId: 0 } })
+    .sort({ _id: -1 })
+    .limit(limit + 1)
+    .toArray();
+
+  const page = docs.slice(0, limit);
+  return {
+    notifications: page.map(({ _id, ...notification }) => notification),
+    nextCursor: docs.length > limit ? page[page.length - 1]._id.toHexString() : null
+  };
+}
+
+export async function getUnreadCount(userId) {
+  const db = await getDb();
+  const counter = await db.collection('notification_counters').findOne({ _id: userId });
+  return Math.max(counter?.unread || 0, 0);
+}
+
+// Marks the given notification ids (or all of them) read and lowers the
+// counter by the number actually changed.
+export async function markRead(userId, { ids, all = false } = {}) {
+  const db = await getDb();
+
+  // Marking all read still only subtracts what it changed: notifications
+  // inserted while it runs stay counted as unread.
+  const filter = all ? { userId, read: false } : { userId, id: { $in: ids || [] }, read: false };
+  const { modifiedCount } = await db.collection('notifications').updateMany(
+    filter,
+    { $set: { read: true } }
+  );
+  if (modifiedCount > 0) {
+    await db.collection('notification_counters').updateOne(
+      { _id: userId },
+      [{ $set: { unread: { $max: [{ $subtract: [{ $ifNull: ['$unread', 0] }, modifiedCount] }, 0] } } }]
+    );
+  }
+  return await getUnreadCount(userId);
+}
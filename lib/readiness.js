@@ -0,0 +1,143 @@
+import { encode } from 'next-auth/jwt';
+import clientPromise, { getDb } from './mongodb';
+import { ensureMatchingIndexes } from './matching';
+import { ensureArchiveIndexes } from './archive';
+import { ensureStatusIndexes } from './statusRollups';
+import { ensureSessionIndexes } from './resumableUploads';
+
+// Boot-time warmup and readiness state. An instance reports ready only after
+// the Mongo pool is connected, indexes are verified and the configured warmup
+// requests (list, detail, session decode) have been served once, which
+// compiles routes and fills caches before real traffic arrives.
+// State lives on `global` because instrumentation and route handlers are
+// bundled separately.
+
+const WARMUP_REQUESTS = (process.env.WARMUP_REQUESTS || 'list,detail,session')
+  .split(',')
+  .map((name) => name.trim())
+  .filter(Boolean);
+const WARMUP_BASE_URL = process.env.WARMUP_BASE_URL || `http://127.0.0.1:${process.env.PORT || 3000}`;
+const WARMUP_ATTEMPTS = parseInt(process.env.WARMUP_ATTEMPTS || '30', 10);
+const WARMUP_RETRY_MS = 1000;
+
+if (!global._readiness) {
+  global._readiness = {
+    ready: false,
+    startedAt: new Date().toISOString(),
+    readyAt: null,
+    checks: { mongo: 'pending', indexes: 'pending', warmup: 'pending' },
+    error: null,
+    promise: null
+  };
+}
+
+const state = global._readiness;
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// IndexOptionsConflict / IndexKeySpecsConflict: an index on the same key
+// already exists (e.g. created by hand as `email_1`), which is all we need.
+const INDEX_EXISTS_CODES = new Set([85, 86]);
+
+async function ensureIndex(collection, keys) {
+  try {
+    await collection.createIndex(keys);
+  } catch (error) {
+    if (!INDEX_EXISTS_CODES.has(error.code)) throw error;
+  }
+}
+
+async function ensureCoreIndexes(db) {
+  await Promise.all([
+    ensureIndex(db.collection('items'), { id: 1 }),
+    ensureIndex(db.collection('users'), { email: 1 }),
+    ensureIndex(db.collection('users'), { id: 1 })
+  ]);
+}
+
+async function warmupRequest(path, headers = {}) {
+  const res = await fetch(`${WARMUP_BASE_URL}${path}`, {
+    headers: { 'x-warmup': '1', ...headers },
+    cache: 'no-store'
+  });
+  // Drain the body so the full handler (including serialization) runs.
+  const body = await res.text();
+  if (res.status >= 500) throw new Error(`Warmup ${path} returned ${res.status}`);
+  return body;
+}
+
+const WARMUPS = {
+  list: () => warmupRequest('/api/items?limit=24&facets=true'),
+  detail: async () => {
+    const db = await getDb();
+    const item = await db.collection('items').findOne({}, { projection: { _id: 0, id: 1 } });
+    // An unknown id still exercises the route (404) on an empty catalog.
+    await warmupRequest(`/api/items/${item?.id || 'warmup'}`);
+  },
+  // A signed throwaway token, so the session route actually decodes a JWT.
+  // next-auth picks the `__Secure-` cookie name for https deployments.
+  session: async () => {
+    const secret = process.env.NEXTAUTH_SECRET;
+    if (!secret) return warmupRequest('/api/auth/session');
+    const token = await encode({ token: { sub: 'warmup', name: 'warmup' }, secret, maxAge: 60 });
+    await warmupRequest('/api/auth/session', {
+      cookie: `next-auth.session-token=${token}; __Secure-next-auth.session-token=${token}`
+    });
+  }
+};
+
+async function runWarmups() {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      for (const name of WARMUP_REQUESTS) {
+        if (WARMUPS[name]) await WARMUPS[name]();
+      }
+      return;
+    } catch (error) {
+      // The HTTP server may not be listening yet during boot.
+      if (attempt >= WARMUP_ATTEMPTS) throw error;
+      await sleep(WARMUP_RETRY_MS);
+    }
+  }
+}
+
+async function warmup() {
+  const client = await clientPromise;
+  await client.db('admin').command({ ping: 1 });
+  state.checks.mongo = 'ok';
+
+  const db = await getDb();
+  await Promise.all([
+    ensureCoreIndexes(db),
+    ensureMatchingIndexes(db),
+    ensureArchiveIndexes(db),
+    ensureStatusIndexes(db),
+    ensureSessionIndexes(db)
+  ]);
+  state.checks.indexes = 'ok';
+
+  await runWarmups();
+  state.checks.warmup = 'ok';
+
+  state.ready = true;
+  state.readyAt = new Date().toISOString();
+}
+
+export function startWarmup() {
+  if (!state.promise) {
+    state.promise = warmup().catch((error) => {
+      console.error('Warmup error:', error);
+      state.error = error.message;
+      for (const [check, value] of Object.entries(state.checks)) {
+        if (value === 'pending') state.checks[check] = 'failed';
+      }
+      // Allow the next readiness probe to retry.
+      state.promise = null;
+    });
+  }
+  return state.promise;
+}
+
+export function getReadiness() {
+  const { promise, ...rest } = state;
+  return rest;
+}
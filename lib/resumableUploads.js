@@ -0,0 +1,286 @@
+import { createWriteStream } from 'fs';
+import { copyFile, mkdir, opendir, rename, stat, truncate, unlink, writeFile } from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { pipeline } from 'stream/promises';
+import { v4 as uuidv4 } from 'uuid';
+import { getDb } from './mongodb';
+import { trackUploadBytes } from './metrics';
+import { UPLOAD_DIR, uploadUrl } from './uploads';
+
+// Resumable (tus-style) uploads. A session records the expected length and
+// the committed offset; each PATCH appends a byte range to a temp file at
+// that offset, and the final range moves the file into public/uploads.
+// Sessions expire after an idle period via a TTL index; orphaned temp files
+// are swept opportunistically.
+
+export const TUS_VERSION = '1.0.0';
+
+const TMP_DIR = process.env.UPLOAD_TMP_DIR || path.join(os.tmpdir(), 'lostfound-uploads');
+const MAX_UPLOAD_BYTES = parseInt(process.env.UPLOAD_MAX_BYTES || String(20 * 1024 * 1024), 10);
+const SESSION_IDLE_MS = parseInt(process.env.UPLOAD_SESSION_IDLE_MS || String(24 * 60 * 60 * 1000), 10);
+const PATCH_LEASE_MS = 60 * 1000;
+const LEASE_RENEW_MS = PATCH_LEASE_MS / 3;
+const SWEEP_INTERVAL_MS = 10 * 60 * 1000;
+
+export class UploadError extends Error {
+  constructor(message, status) {
+    super(message);
+    this.status = status;
+  }
+}
+
+let indexesPromise;
+let lastSweep = 0;
+
+export function ensureSessionIndexes(db) {
+  if (!indexesPromise) {
+    indexesPromise = Promise.all([
+      db.collection('upload_sessions').createIndex({ id: 1 }, { name: 'upload_session_id', unique: true }),
+      db.collection('upload_sessions').createIndex({ expiresAt: 1 }, { name: 'upload_session_ttl', expireAfterSeconds: 0 })
+    ]).catch((error) => {
+      indexesPromise = null;
+      throw error;
+    });
+  }
+  return indexesPromise;
+}
+
+function tempPath(id) {
+  return path.join(TMP_DIR, `${id}.part`);
+}
+
+function expiresAt() {
+  return new Date(Date.now() + SESSION_IDLE_MS);
+}
+
+// Temp files outlive their session documents once the TTL monitor removes
+// them, so stale `.part` files are cleaned up here.
+async function sweepExpiredTempFiles() {
+  if (Date.now() - lastSweep < SWEEP_INTERVAL_MS) return;
+  lastSweep = Date.now();
+
+  const cutoff = Date.now() - SESSION_IDLE_MS;
+  const dir = await opendir(TMP_DIR).catch(() => null);
+  if (!dir) return;
+
+  for await (const entry of dir) {
+    if (!entry.isFile() || !entry.name.endsWith('.part')) continue;
+    const filepath = path.join(TMP_DIR, entry.name);
+    const info = await stat(filepath).catch(() => null);
+    if (info && info.mtimeMs < cutoff) await unlink(filepath).catch(() => {});
+  }
+}
+
+export async function createUploadSession({ filename, length }, user) {
+  if (!Number.isInteger(length) || length <= 0) {
+    throw new UploadError('Upload-Length must be a positive integer', 400);
+  }
+  if (length > MAX_UPLOAD_BYTES) {
+    throw new UploadError('File too large', 413);
+  }
+
+  const db = await getDb();
+  await ensureSessionIndexes(db);
+  await mkdir(TMP_DIR, { recursive: true });
+  sweepExpiredTempFiles().catch((error) => console.error('Upload sweep error:', error));
+
+  const session = {
+    id: uuidv4(),
+    userId: user.id,
+    ext: path.extname(filename || '').toLowerCase().slice(0, 10),
+    length,
+    offset: 0,
+    url: null,
+    lockedUntil: null,
+    leaseToken: null,
+    createdAt: new Date().toISOString(),
+    expiresAt: expiresAt()
+  };
+
+  await writeFile(tempPath(session.id), '');
+  await db.collection('upload_sessions').insertOne(session);
+  return session;
+}
+
+export async function getUploadSession(id, user) {
+  const db = await getDb();
+  const session = await db.collection('upload_sessions').findOne({ id }, { projection: { _id: 0 } });
+  if (!session || session.expiresAt < new Date()) throw new UploadError('Upload not found', 404);
+  if (session.userId !== user.id) throw new UploadError('Forbidden', 403);
+  return session;
+}
+
+// Iterates a request body until `signal` aborts. A stalled client leaves
+// `next()` pending forever, so each read races the abort.
+async function* untilAborted(body, signal) {
+  const chunks = body[Symbol.asyncIterator]();
+  const aborted = new Promise((resolve, reject) => {
+    if (signal.aborted) reject(signal.reason);
+    signal.addEventListener('abort', () => reject(signal.reason), { once: true });
+  });
+  aborted.catch(() => {});
+
+  try {
+    for (;;) {
+      const { value, done } = await Promise.race([chunks.next(), aborted]);
+      if (done) return;
+      yield value;
+    }
+  } finally {
+    // Not awaited: a stalled read would hold up the abort.
+    Promise.resolve(chunks.return?.()).catch(() => {});
+  }
+}
+
+// `progress.written` counts bytes handed to the file, so a dropped connection
+// can still commit what arrived before it.
+async function writeRange(filepath, offset, body, maxBytes, progress, signal) {
+  // Drop any bytes past the committed offset left by an interrupted PATCH.
+  await truncate(filepath, offset);
+
+  const out = createWriteStream(filepath, { flags: 'r+', start: offset });
+
+  // pipeline() owns the write stream: a write error (e.g. ENOSPC) at any
+  // point rejects here instead of surfacing as an unhandled 'error' event,
+  // and success waits until the data is flushed and the file closed.
+  await pipeline(async function* () {
+    for await (const chunk of untilAborted(body, signal)) {
+      if (progress.written + chunk.byteLength > maxBytes) {
+        throw new UploadError('Upload exceeds declared length', 413);
+      }
+      progress.written += chunk.byteLength;
+      trackUploadBytes(chunk.byteLength);
+      try {
+        yield chunk;
+      } finally {
+        trackUploadBytes(-chunk.byteLength);
+      }
+    }
+  }, out, { signal });
+}
+
+// Keeps a PATCH's lease alive while it runs. The returned signal aborts once
+// the lease is lost: another request holds the session, the upload was
+// deleted, or renewals kept failing until the lease ran out.
+function holdLease(sessions, id, leaseToken) {
+  const controller = new AbortController();
+  let leaseEnds = Date.now() + PATCH_LEASE_MS;
+
+  const lost = (message) => controller.abort(new UploadError(message, 409));
+
+  const timer = setInterval(async () => {
+    const lockedUntil = new Date(Date.now() + PATCH_LEASE_MS);
+    try {
+      const result = await sessions.updateOne({ id, leaseToken }, { $set: { lockedUntil } });
+      if (result.matchedCount === 0) return lost('Upload lease lost');
+      leaseEnds = lockedUntil.getTime();
+    } catch (error) {
+      console.error('Upload lease renewal error:', error);
+      if (Date.now() >= leaseEnds) lost('Upload lease expired');
+    }
+  }, LEASE_RENEW_MS);
+  timer.unref?.();
+
+  return { signal: controller.signal, release: () => clearInterval(timer) };
+}
+
+// The temp dir and public/uploads may be on different filesystems (volumes,
+// containers), where rename() fails with EXDEV.
+async function moveFile(from, to) {
+  try {
+    await rename(from, to);
+  } catch (error) {
+    if (error.code !== 'EXDEV') throw error;
+    await copyFile(from, to);
+    await unlink(from);
+  }
+}
+
+// Appends one byte range. The client's Upload-Offset must equal the
+// committed offset, and a short lease prevents two PATCHes racing on the
+// same session. The lease is renewed while the body streams and every write
+// to the session is conditional on its token, so a PATCH that lost its lease
+// can never move the offset under the one that took over. A range that
+// reaches the declared length finalises the file.
+export async function appendToUpload(id, user, clientOffset, body) {
+  const db = await getDb();
+  const sessions = db.collection('upload_sessions');
+  const session = await getUploadSession(id, user);
+
+  if (session.url) throw new UploadError('Upload already completed', 409);
+  if (clientOffset !== session.offset) throw new UploadError('Upload-Offset mismatch', 409);
+
+  const now = new Date();
+  const leaseToken = uuidv4();
+  const claimed = await sessions.findOneAndUpdate(
+    {
+      id,
+      offset: clientOffset,
+      $or: [{ lockedUntil: null }, { lockedUntil: { $lt: now } }]
+    },
+    { $set: { lockedUntil: new Date(now.getTime() + PATCH_LEASE_MS), leaseToken } },
+    { returnDocument: 'after' }
+  );
+  if (!claimed) throw new UploadError('Upload is busy or offset changed', 409);
+
+  const lease = holdLease(sessions, id, leaseToken);
+  const progress = { written: 0 };
+  try {
+    try {
+      await writeRange(tempPath(id), clientOffset, body, session.length - clientOffset, progress, lease.signal);
+    } catch (error) {
+      if (lease.signal.aborted) throw lease.signal.reason;
+      // Keep the bytes that did reach the file so the client resumes from there.
+      const info = await stat(tempPath(id)).catch(() => null);
+      const onDisk = Math.max((info?.size ?? clientOffset) - clientOffset, 0);
+      const committed = error instanceof UploadError ? 0 : Math.min(progress.written, onDisk);
+      await sessions.updateOne(
+        { id, leaseToken },
+        { $set: { offset: clientOffset + committed, lockedUntil: null, leaseToken: null, expiresAt: expiresAt() } }
+      );
+      throw error;
+    }
+
+    const offset = clientOffset + progress.written;
+
+    let url = null;
+    let finalPath = null;
+    if (offset === session.length) {
+      const filename = `${uuidv4()}${session.ext}`;
+      finalPath = path.join(UPLOAD_DIR, filename);
+      try {
+        await mkdir(UPLOAD_DIR, { recursive: true });
+        await moveFile(tempPath(id), finalPath);
+      } catch (error) {
+        // Release the lease so the client can resend the final range.
+        await sessions.updateOne(
+          { id, leaseToken },
+          { $set: { offset: clientOffset, lockedUntil: null, leaseToken: null } }
+        );
+        throw error;
+      }
+      url = uploadUrl(filename);
+    }
+
+    const result = await sessions.updateOne(
+      { id, leaseToken },
+      { $set: { offset, url, lockedUntil: null, leaseToken: null, expiresAt: expiresAt() } }
+    );
+    if (result.matchedCount === 0) {
+      if (finalPath) await unlink(finalPath).catch(() => {});
+      throw new UploadError('Upload lease lost', 409);
+    }
+
+    return { offset, length: session.length, url };
+  } finally {
+    lease.release();
+  }
+}
+
+export async function abortUpload(id, user) {
+  const db = await getDb();
+  await getUploadSession(id, user);
+  await db.collection('upload_sessions').deleteOne({ id });
+  await unlink(tempPath(id)).catch(() => {});
+}
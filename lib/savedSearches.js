@@ -0,0 +1,242 @@
+import { v4 as uuidv4 } from 'uuid';
+import { getDb } from './mongodb';
+import { buildItemQuery } from './items';
+import { notify } from './notifications';
+import { onShutdown } from './shutdown';
+
+// Saved-search alerts. Each saved search is filed under a single anchor key
+// that every item it matches is guaranteed to carry: an equality filter
+// (location, category or status) when it has one, else a trigram of its
+// search text, which the listing matches as a case-insensitive substring.
+// Searches whose text is not a plain literal (regex syntax, non-ASCII or
+// under three characters) fall back to a catch-all anchor. A new item
+// looks up only the searches whose anchor appears among its own keys, then
+// checks the full filter on those candidates. Matching runs from an
+// in-process queue after the response is sent.
+
+export const ALERT_FIELDS = ['category', 'location', 'status'];
+
+const MAX_SAVED_SEARCHES = parseInt(process.env.MAX_SAVED_SEARCHES_PER_USER || '20', 10);
+const MATCH_BATCH_SIZE = 100;
+const ANY_ANCHOR = '*';
+const REGEX_SYNTAX = /[\\^$.|?*+()[\]{}]/;
+const COMMON_CHARS = 'etaoinshr ';
+const SEARCH_MATCH_TIMEOUT_MS = parseInt(process.env.SAVED_SEARCH_MATCH_TIMEOUT_MS || '200', 10);
+
+export class SavedSearchError extends Error {
+  constructor(message, status) {
+    super(message);
+    this.status = status;
+  }
+}
+
+let indexesPromise;
+
+function ensureSavedSearchIndexes(db) {
+  if (!indexesPromise) {
+    indexesPromise = Promise.all([
+      db.collection('saved_searches').createIndex({ anchor: 1 }, { name: 'saved_search_anchor' }),
+      db.collection('saved_searches').createIndex({ userId: 1, createdAt: -1 }, { name: 'saved_search_user' }),
+      reanchorWordSearches(db)
+    ]).catch((error) => {
+      indexesPromise = null;
+      throw error;
+    });
+  }
+  return indexesPromise;
+}
+
+// Searches saved with the old whole-word (`kw:`) anchors are refiled.
+async function reanchorWordSearches(db) {
+  const stale = await db.collection('saved_searches')
+    .find({ anchor: /^kw:/ }, { projection: { _id: 0, id: 1, filters: 1 } })
+    .toArray();
+  if (stale.length === 0) return;
+  await db.collection('saved_searches').bulkWrite(stale.map(({ id, filters }) => ({
+    updateOne: { filter: { id }, update: { $set: { anchor: anchorFor(filters) } } }
+  })));
+}
+
+function trigrams(text) {
+  const lower = (text || '').toLowerCase();
+  const grams = new Set();
+  for (let i = 0; i + 3 <= lower.length; i++) grams.add(lower.slice(i, i + 3));
+  return grams;
+}
+
+// The trigram made of the least common letters is likely the rarest.
+function rarestTrigram(text) {
+  const commonness = (gram) => [...gram].filter((char) => COMMON_CHARS.includes(char)).length;
+  return [...trigrams(text)].sort((a, b) => commonness(a) - commonness(b))[0];
+}
+
+function isPlainLiteral(text) {
+  return text.length >= 3 && /^[\x20-\x7e]+$/.test(text) && !REGEX_SYNTAX.test(text);
+}
+
+function anchorFor(filters) {
+  for (const field of ['location', 'category', 'status']) {
+    if (filters[field]) return `${field}:${filters[field]}`;
+  }
+  if (!filters.search) return null;
+  return isPlainLiteral(filters.search) ? `tri:${rarestTrigram(filters.search)}` : ANY_ANCHOR;
+}
+
+// Every key a saved search anchored on this item could be filed under.
+function itemKeys(item) {
+  const keys = new Set(ALERT_FIELDS.filter((field) => item[field]).map((field) => `${field}:${item[field]}`));
+  // The listing matches each field on its own, so trigrams never span two.
+  for (const field of ['title', 'description', 'location', 'category']) {
+    for (const gram of trigrams(item[field])) keys.add(`tri:${gram}`);
+  }
+  keys.add(ANY_ANCHOR);
+  return [...keys];
+}
+
+// Field filters are plain equality and are checked in process.
+function matchesFieldFilters(item, filters) {
+  const query = buildItemQuery({ ...filters, search: null });
+  return ALERT_FIELDS.every((field) => query[field] === undefined || item[field] === query[field]);
+}
+
+// The search text is a user-supplied regex, exactly as in `GET /api/items`,
+// so it is only ever evaluated by Mongo (bounded by maxTimeMS), never
+// compiled in the event loop. One query per distinct search text returns
+// the ids of the new items it matches.
+async function matchSearchTexts(db, items, searches) {
+  const ids = items.map((item) => item.id);
+  const matched = new Map();
+  await Promise.all([...new Set(searches)].map(async (search) => {
+    try {
+      const rows = await db.collection('items')
+        .find({ id: { $in: ids }, ...buildItemQuery({ search }) }, { projection: { _id: 0, id: 1 } })
+        .maxTimeMS(SEARCH_MATCH_TIMEOUT_MS)
+        .toArray();
+      matched.set(search, new Set(rows.map((row) => row.id)));
+    } catch {
+      // An invalid or runaway pattern matches nothing.
+      matched.set(search, new Set());
+    }
+  }));
+  return matched;
+}
+
+export function parseSavedSearch(body) {
+  const value = (name) => (body[name] && body[name] !== 'all' ? String(body[name]) : null);
+  return {
+    search: body.search ? String(body.search).trim() || null : null,
+    category: value('category'),
+    location: value('location'),
+    status: value('status')
+  };
+}
+
+export async function createSavedSearch(user, filters, name) {
+  const anchor = anchorFor(filters);
+  if (!anchor) throw new SavedSearchError('At least one filter is required', 400);
+
+  const db = await getDb();
+  await ensureSavedSearchIndexes(db);
+
+  const count = await db.collection('saved_searches').countDocuments({ userId: user.id });
+  if (count >= MAX_SAVED_SEARCHES) throw new SavedSearchError(`Limit of ${MAX_SAVED_SEARCHES} saved searches reached`, 409);
+
+  const savedSearch = {
+    id: uuidv4(),
+    userId: user.id,
+    name: name || filters.search || Object.values(filters).filter(Boolean).join(', '),
+    filters,
+    anchor,
+    createdAt: new Date().toISOString()
+  };
+  await db.collection('saved_searches').insertOne(savedSearch);
+
+  const { _id, ...result } = savedSearch;
+  return result;
+}
+
+export async function listSavedSearches(userId) {
+  const db = await getDb();
+  return await db.collection('saved_searches')
+    .find({ userId }, { projection: { _id: 0, anchor: 0 } })
+    .sort({ createdAt: -1 })
+    .toArray();
+}
+
+export async function deleteSavedSearch(userId, id) {
+  const db = await getDb();
+  const { deletedCount } = await db.collection('saved_searches').deleteOne({ id, userId });
+  return deletedCount > 0;
+}
+
+// Matches a batch of new items with one candidate lookup and sends one
+// notification per (user, item), however many of the user's searches match.
+export async function matchSavedSearches(items) {
+  const db = await getDb();
+  await ensureSavedSearchIndexes(db);
+
+  const keysByItem = items.map(itemKeys);
+  const candidates = await db.collection('saved_searches')
+    .find({ anchor: { $in: [...new Set(keysByItem.flat())] } }, { projection: { _id: 0 } })
+    .toArray();
+
+  const pairs = [];
+  items.forEach((item, index) => {
+    const keys = new Set(keysByItem[index]);
+    for (const savedSearch of candidates) {
+      if (savedSearch.userId === item.userId) continue;
+      if (keys.has(savedSearch.anchor) && matchesFieldFilters(item, savedSearch.filters)) {
+        pairs.push({ item, savedSearch });
+      }
+    }
+  });
+
+  const searches = pairs.map(({ savedSearch }) => savedSearch.filters.search).filter(Boolean);
+  const searchMatches = searches.length > 0 ? await matchSearchTexts(db, items, searches) : new Map();
+
+  const events = [];
+  const notified = new Set();
+  for (const { item, savedSearch } of pairs) {
+    const { search } = savedSearch.filters;
+    if (search && !searchMatches.get(search).has(item.id)) continue;
+
+    const key = `${item.id}:${savedSearch.userId}`;
+    if (notified.has(key)) continue;
+    notified.add(key);
+    events.push({
+      userId: savedSearch.userId,
+      type: 'saved_search',
+      itemId: item.id,
+      title: `New match for "${savedSearch.name}"`,
+      message: `A ${item.status} item "${item.title}" was reported at ${item.location}.`
+    });
+  }
+
+  notify(events);
+  return events.length;
+}
+
+const queue = [];
+let draining = null;
+
+async function drain() {
+  while (queue.length > 0) {
+    const batch = queue.splice(0, MATCH_BATCH_SIZE);
+    try {
+      await matchSavedSearches(batch);
+    } catch (error) {
+      console.error('Saved search matching error:', error);
+    }
+  }
+  draining = null;
+}
+
+// Queues a newly created item for alert matching without delaying the caller.
+export function enqueueSavedSearchMatch(item) {
+  queue.push(item);
+  if (!draining) {
+    draining = new Promise((resolve) => setImmediate(resolve)).then(drain);
+  }
+}
+
+onShutdown(() => draining);
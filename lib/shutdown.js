@@ -0,0 +1,34 @@
+// Graceful-shutdown hooks. Hooks run once on SIGTERM/SIGINT and the process
+// exits when they settle (or after the timeout). Next.js installs its own
+// signal handlers that exit immediately; run the server with
+// NEXT_MANUAL_SIG_HANDLE=true so these hooks get to finish.
+
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.SHUTDOWN_TIMEOUT_MS || '10000', 10);
+
+if (!global._shutdownHooks) {
+  global._shutdownHooks = new Set();
+  let shuttingDown = false;
+
+  const shutdown = async (signal) => {
+    if (shuttingDown) return;
+    shuttingDown = true;
+
+    const timeout = new Promise((resolve) => setTimeout(resolve, SHUTDOWN_TIMEOUT_MS).unref());
+    const hooks = [...global._shutdownHooks].map((hook) =>
+      Promise.resolve()
+        .then(() => hook(signal))
+        .catch((error) => console.error('Shutdown hook error:', error))
+    );
+
+    await Promise.race([Promise.all(hooks), timeout]);
+    process.exit(0);
+  };
+
+  process.once('SIGTERM', () => shutdown('SIGTERM'));
+  process.once('SIGINT', () => shutdown('SIGINT'));
+}
+
+export function onShutdown(hook) {
+  global._shutdownHooks.add(hook);
+  return () => global._shutdownHooks.delete(hook);
+}
@@ -0,0 +1,37 @@
+import { counter, gauge } from './metrics';
+
+// Single-flight: concurrent calls with the same key share one execution of
+// `fn` and receive the same result (or error). Nothing is cached; the key
+// is released as soon as the shared call settles, so later calls run fresh.
+
+if (!global._singleFlight) {
+  global._singleFlight = { inflight: new Map(), leaders: 0, followers: 0 };
+}
+
+const stats = global._singleFlight;
+const { inflight } = stats;
+
+const calls = counter('singleflight_calls_total', 'Single-flight calls by scope and role (leader ran the work, follower shared it)');
+gauge('singleflight_coalescing_ratio', 'Share of single-flight calls served by another in-flight call', () => [
+  { labels: {}, value: stats.leaders + stats.followers > 0 ? stats.followers / (stats.leaders + stats.followers) : 0 }
+]);
+
+export async function singleFlight(scope, key, fn) {
+  const id = `${scope}:${key}`;
+  const pending = inflight.get(id);
+  if (pending) {
+    stats.followers += 1;
+    calls.inc({ scope, role: 'follower' });
+    return await pending;
+  }
+
+  stats.leaders += 1;
+  calls.inc({ scope, role: 'leader' });
+  const promise = Promise.resolve().then(fn);
+  inflight.set(id, promise);
+  try {
+    return await promise;
+  } finally {
+    inflight.delete(id);
+  }
+}
@@ -0,0 +1,105 @@
+// Retention for `status_checks`: raw heartbeats expire through a TTL index on
+// `timestamp`, while per-client minute/hour counts are maintained
+// incrementally in `status_rollups` as buffered heartbeats are flushed.
+// Dashboards read the small rollup documents instead of raw records.
+
+const DAY_SECONDS = 24 * 60 * 60;
+const RAW_RETENTION_DAYS = parseFloat(process.env.STATUS_RETENTION_DAYS || '7');
+
+export const GRANULARITIES = {
+  minute: { ms: 60 * 1000, retentionDays: parseFloat(process.env.STATUS_MINUTE_ROLLUP_DAYS || '30') },
+  hour: { ms: 60 * 60 * 1000, retentionDays: parseFloat(process.env.STATUS_HOUR_ROLLUP_DAYS || '365') }
+};
+
+const MAX_ROLLUP_POINTS = 5000;
+
+let indexesPromise;
+
+// Creates the TTL index, or adjusts its expiry in place when the configured
+// retention changed since it was first created.
+async function ensureTtlIndex(db, collectionName, keyPattern, name, expireAfterSeconds) {
+  try {
+    await db.collection(collectionName).createIndex(keyPattern, { name, expireAfterSeconds });
+  } catch (error) {
+    if (error.codeName !== 'IndexOptionsConflict') throw error;
+    await db.command({ collMod: collectionName, index: { keyPattern, expireAfterSeconds } });
+  }
+}
+
+export function ensureStatusIndexes(db) {
+  if (!indexesPromise) {
+    indexesPromise = Promise.all([
+      ensureTtlIndex(db, 'status_checks', { timestamp: 1 }, 'status_ttl', Math.round(RAW_RETENTION_DAYS * DAY_SECONDS)),
+      db.collection('status_rollups').createIndex(
+        { client_name: 1, granularity: 1, bucket: 1 },
+        { name: 'status_rollups_lookup' }
+      ),
+      db.collection('status_rollups').createIndex(
+        { expiresAt: 1 },
+        { name: 'status_rollups_ttl', expireAfterSeconds: 0 }
+      )
+    ]).catch((error) => {
+      indexesPromise = null;
+      throw error;
+    });
+  }
+  return indexesPromise;
+}
+
+function bucketStart(timestamp, ms) {
+  return new Date(Math.floor(new Date(timestamp).getTime() / ms) * ms);
+}
+
+// Folds a flushed batch into one upsert per (client, granularity, bucket).
+export async function recordRollups(db, records) {
+  const counts = new Map();
+
+  for (const record of records) {
+    for (const [granularity, { ms }] of Object.entries(GRANULARITIES)) {
+      const timestamp = new Date(record.timestamp);
+      const bucket = bucketStart(timestamp, ms);
+      const key = `${record.client_name}|${granularity}|${bucket.toISOString()}`;
+      const entry = counts.get(key) || { client_name: record.client_name, granularity, bucket, count: 0, lastSeen: timestamp };
+      entry.count += 1;
+      if (timestamp > entry.lastSeen) entry.lastSeen = timestamp;
+      counts.set(key, entry);
+    }
+  }
+
+  if (counts.size === 0) return;
+
+  const ops = [...counts.entries()].map(([key, { client_name, granularity, bucket, count, lastSeen }]) => ({
+    updateOne: {
+      filter: { _id: key },
+      update: {
+        $inc: { count },
+        $max: { lastSeen },
+        $setOnInsert: {
+          client_name,
+          granularity,
+          bucket,
+          expiresAt: new Date(bucket.getTime() + GRANULARITIES[granularity].retentionDays * DAY_SECONDS * 1000)
+        }
+      },
+      upsert: true
+    }
+  }));
+
+  await db.collection('status_rollups').bulkWrite(ops, { ordered: false });
+}
+
+export async function queryRollups(db, { client, granularity = 'minute', from, to }) {
+  const query = { granularity };
+  if (client) query.client_name = client;
+  if (from || to) {
+    query.bucket = {};
+    if (from) query.bucket.$gte = from;
+    if (to) query.bucket.$lte = to;
+  }
+
+  return await db.collection('status_rollups')
+    .find(query, { projection: { _id: 0, expiresAt: 0 } })
+    .sort({ bucket: -1 })
+    .limit(MAX_ROLLUP_POINTS)
+    .toArray();
+}
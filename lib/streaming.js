@@ -0,0 +1,111 @@
+import { pipeline, Readable } from 'stream';
+import zlib from 'zlib';
+
+// Streams documents from a Mongo cursor as a JSON array, NDJSON or CSV without
+// materialising the result. The body is a pull-based Node stream piped
+// through gzip/brotli, so a slow client applies backpressure all the way
+// back to the cursor and memory stays bounded by the batch size.
+
+const BATCH_SIZE = parseInt(process.env.STREAM_BATCH_SIZE || '500', 10);
+const DOCS_PER_CHUNK = 100;
+const CLIENT_ABORTS = new Set(['ABORT_ERR', 'ERR_STREAM_PREMATURE_CLOSE']);
+
+export const STREAM_FORMATS = {
+  json: 'application/json; charset=utf-8',
+  ndjson: 'application/x-ndjson; charset=utf-8',
+  csv: 'text/csv; charset=utf-8'
+};
+
+// Text starting with = + - @ (or a tab/CR) is read as a formula by
+// spreadsheet apps, so it is prefixed with a quote to stay literal.
+function csvCell(value) {
+  if (value === null || value === undefined) return '';
+  let text = typeof value === 'object' ? JSON.stringify(value) : String(value);
+  if (typeof value === 'string' && /^[=+\-@\t\r]/.test(text)) text = `'${text}`;
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+function csvRow(values) {
+  return values.map(csvCell).join(',');
+}
+
+export function negotiateEncoding(request) {
+  const accepted = request.headers.get('accept-encoding') || '';
+  if (/\bbr\b/.test(accepted)) return 'br';
+  if (/\bgzip\b/.test(accepted)) return 'gzip';
+  return null;
+}
+
+// `?stream=json|ndjson` or an NDJSON `Accept` header opts into streaming.
+export function requestedStreamFormat(request, searchParams) {
+  const param = searchParams.get('stream');
+  if (param === 'json' || param === 'ndjson') return param;
+  if (param === 'true') return 'json';
+  if ((request.headers.get('accept') || '').includes('application/x-ndjson')) return 'ndjson';
+  return null;
+}
+
+async function* serialize(cursor, format, { key, columns, transform }) {
+  const lineBased = format !== 'json';
+  const separator = lineBased ? '\n' : ',';
+  const encode = format === 'csv'
+    ? (value) => csvRow(columns.map((column) => value[column]))
+    : (value) => JSON.stringify(value);
+  let first = true;
+  let chunk = [];
+
+  const flush = () => {
+    const lead = first || lineBased ? '' : separator;
+    const tail = lineBased ? '\n' : '';
+    const text = lead + chunk.join(separator) + tail;
+    first = false;
+    chunk = [];
+    return text;
+  };
+
+  if (format === 'json') yield `{${JSON.stringify(key)}:[`;
+  if (format === 'csv') yield csvRow(columns) + '\n';
+
+  try {
+    for await (const doc of cursor.batchSize(BATCH_SIZE)) {
+      const value = transform ? transform(doc) : doc;
+      if (value === undefined) continue;
+      chunk.push(encode(value));
+      if (chunk.length >= DOCS_PER_CHUNK) yield flush();
+    }
+    if (chunk.length > 0) yield flush();
+  } finally {
+    await cursor.close();
+  }
+
+  if (format === 'json') yield ']}';
+}
+
+function compress(source, encoding) {
+  if (!encoding) return source;
+  const compressor = encoding === 'br'
+    ? zlib.createBrotliCompress({ params: { [zlib.constants.BROTLI_PARAM_QUALITY]: 4 } })
+    : zlib.createGzip({ level: 6 });
+  // pipeline() tears down both ends together: a client abort destroys the
+  // compressor and the source, whose generator then closes the cursor.
+  pipeline(source, compressor, (error) => {
+    if (error && !CLIENT_ABORTS.has(error.code)) console.error('Stream error:', error);
+  });
+  return compressor;
+}
+
+export function streamCursor(request, cursor, { format = 'json', key = 'items', columns, transform, headers = {} } = {}) {
+  const encoding = negotiateEncoding(request);
+  const source = Readable.from(serialize(cursor, format, { key, columns, transform }), { objectMode: false });
+  const body = compress(source, encoding);
+
+  const responseHeaders = {
+    'Content-Type': STREAM_FORMATS[format],
+    'Cache-Control': 'no-store',
+    Vary: 'Accept-Encoding',
+    ...headers
+  };
+  if (encoding) responseHeaders['Content-Encoding'] = encoding;
+
+  return new Response(Readable.toWeb(body), { status: 200, headers: responseHeaders });
+}
@@ -0,0 +1,83 @@
+// Browser side of the resumable upload protocol. The file is sent in
+// fixed-size PATCH ranges; after a network error the client asks the server
+// for the committed offset and continues from there instead of restarting.
+
+const DEFAULT_CHUNK_SIZE = 512 * 1024;
+const DEFAULT_RETRIES = 8;
+// Another PATCH may hold the session's lease for up to a minute.
+const MAX_CONFLICTS = 12;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// Exponential backoff with full jitter, so clients retrying the same
+// session do not retry in lockstep.
+const backoff = (attempt) => Math.random() * Math.min(1000 * 2 ** attempt, 15000);
+
+async function readError(res, fallback) {
+  const data = await res.json().catch(() => ({}));
+  return new Error(data.error || fallback);
+}
+
+async function uploadStatus(location) {
+  const res = await fetch(location, { cache: 'no-store' });
+  if (!res.ok) throw new Error('Upload session expired');
+  return await res.json();
+}
+
+export async function uploadResumable(file, { chunkSize = DEFAULT_CHUNK_SIZE, retries = DEFAULT_RETRIES, onProgress } = {}) {
+  const createRes = await fetch('/api/upload/sessions', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', 'Upload-Length': String(file.size) },
+    body: JSON.stringify({ filename: file.name || 'upload', size: file.size }),
+  });
+  if (!createRes.ok) throw await readError(createRes, 'Failed to start upload');
+
+  const { location } = await createRes.json();
+  let offset = 0;
+  let failures = 0;
+  let conflicts = 0;
+
+  while (offset < file.size) {
+    try {
+      const res = await fetch(location, {
+        method: 'PATCH',
+        headers: {
+          'Content-Type': 'application/offset+octet-stream',
+          'Upload-Offset': String(offset),
+        },
+        body: file.slice(offset, offset + chunkSize),
+      });
+
+      if (res.status === 409) {
+        const status = await uploadStatus(location);
+        if (status.url) return status.url;
+        // A different committed offset just needs a resync; the same offset
+        // means another request holds the lease, so back off before retrying.
+        if (status.offset === offset) {
+          conflicts += 1;
+          if (conflicts > MAX_CONFLICTS) throw new Error('Upload is busy');
+          await sleep(backoff(conflicts - 1));
+        }
+        offset = status.offset;
+        continue;
+      }
+      if (!res.ok) throw await readError(res, 'Failed to upload image');
+
+      const data = await res.json();
+      offset = data.offset;
+      failures = 0;
+      conflicts = 0;
+      onProgress?.(offset / file.size);
+      if (data.url) return data.url;
+    } catch (error) {
+      failures += 1;
+      if (failures > retries) throw error;
+      await sleep(backoff(failures - 1));
+      const status = await uploadStatus(location).catch(() => null);
+      if (status?.url) return status.url;
+      if (status) offset = status.offset;
+    }
+  }
+
+  throw new Error('Upload did not complete');
+}
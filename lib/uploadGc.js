@@ -0,0 +1,85 @@
+import { opendir, stat, unlink } from 'fs/promises';
+import path from 'path';
+import { getDb } from './mongodb';
+import { ARCHIVE_COLLECTION } from './archive';
+import { UPLOAD_DIR, filenameFromUrl } from './uploads';
+
+// Garbage collection for public/uploads. Referenced filenames are collected
+// with one streaming projection per item collection. The directory is then
+// walked entry by entry, and unreferenced files older than the grace period
+// are deleted in small, paced batches.
+
+const GRACE_HOURS = parseFloat(process.env.UPLOAD_GC_GRACE_HOURS || '24');
+const DELETE_BATCH_SIZE = parseInt(process.env.UPLOAD_GC_BATCH_SIZE || '100', 10);
+const BATCH_PAUSE_MS = parseInt(process.env.UPLOAD_GC_BATCH_PAUSE_MS || '250', 10);
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+async function referencedFilenames(db) {
+  const referenced = new Set();
+  for (const collection of ['items', ARCHIVE_COLLECTION]) {
+    const cursor = db.collection(collection)
+      .find({ image: { $type: 'string' } }, { projection: { _id: 0, image: 1 } })
+      .batchSize(1000);
+    for await (const { image } of cursor) {
+      const filename = filenameFromUrl(image);
+      if (filename) referenced.add(filename);
+    }
+  }
+  return referenced;
+}
+
+export async function collectOrphanedUploads({ dryRun = true, graceHours = GRACE_HOURS } = {}) {
+  const db = await getDb();
+  const referenced = await referencedFilenames(db);
+  const cutoff = Date.now() - graceHours * 60 * 60 * 1000;
+  const report = { dryRun, scanned: 0, orphaned: 0, deleted: 0, reclaimedBytes: 0, errors: 0 };
+
+  let dir;
+  try {
+    dir = await opendir(UPLOAD_DIR);
+  } catch (error) {
+    if (error.code === 'ENOENT') return report;
+    throw error;
+  }
+
+  let batch = [];
+  const flush = async () => {
+    for (const { filepath, size } of batch) {
+      try {
+        await unlink(filepath);
+        report.deleted += 1;
+        report.reclaimedBytes += size;
+      } catch (error) {
+        if (error.code !== 'ENOENT') {
+          report.errors += 1;
+          console.error('Upload GC unlink error:', error);
+        }
+      }
+    }
+    batch = [];
+    await sleep(BATCH_PAUSE_MS);
+  };
+
+  for await (const entry of dir) {
+    if (!entry.isFile()) continue;
+    report.scanned += 1;
+    if (referenced.has(entry.name)) continue;
+
+    const filepath = path.join(UPLOAD_DIR, entry.name);
+    const info = await stat(filepath).catch(() => null);
+    if (!info || info.mtimeMs > cutoff) continue;
+
+    report.orphaned += 1;
+    if (dryRun) {
+      report.reclaimedBytes += info.size;
+      continue;
+    }
+
+    batch.push({ filepath, size: info.size });
+    if (batch.length >= DELETE_BATCH_SIZE) await flush();
+  }
+  if (batch.length > 0) await flush();
+
+  return report;
+}
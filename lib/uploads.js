@@ -0,0 +1,15 @@
+import path from 'path';
+
+// Uploaded images live under public/uploads and are served as /uploads/<file>.
+
+export const UPLOAD_DIR = path.join(process.cwd(), 'public', 'uploads');
+export const UPLOAD_URL_PREFIX = '/uploads/';
+
+export function uploadUrl(filename) {
+  return `${UPLOAD_URL_PREFIX}${filename}`;
+}
+
+export function filenameFromUrl(url) {
+  if (typeof url !== 'string' || !url.startsWith(UPLOAD_URL_PREFIX)) return null;
+  return path.basename(url.slice(UPLOAD_URL_PREFIX.length));
+}
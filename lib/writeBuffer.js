@@ -0,0 +1,177 @@
+import { MongoBulkWriteError } from 'mongodb';
+import { onShutdown } from './shutdown';
+
+// In-process write buffer: records accumulate in memory and are written with
+// a single `insertMany` when the buffer reaches `maxSize` or `maxDelayMs`
+// after the first pending record. An optional `onFlush(inserted, duplicates)`
+// runs after each write with the records it inserted and those found already
+// stored (e.g. to maintain rollups).
+// Buffers are registered on `global` so dev hot reloads reuse them, and are
+// flushed on graceful shutdown.
+//
+// A partially failed flush keeps what was written: duplicate-key errors mean
+// the record is already stored (by an earlier attempt whose outcome was
+// lost), so only records that failed for another reason are re-queued, at
+// most `maxAttempts` times.
+
+const DEFAULTS = {
+  maxSize: 500,
+  maxDelayMs: 1000,
+  maxPending: 10000,
+  maxAttempts: 5
+};
+
+const DUPLICATE_KEY = 11000;
+
+function createWriteBuffer(name, getCollection, options) {
+  const { maxSize, maxDelayMs, maxPending, maxAttempts, onFlush } = { ...DEFAULTS, ...options };
+  const attempts = new WeakMap();
+  let pending = [];
+  let timer = null;
+  let flushing = null;
+
+  const stats = {
+    name,
+    flushes: 0,
+    flushedRecords: 0,
+    failedFlushes: 0,
+    droppedRecords: 0,
+    lastFlushMs: 0,
+    maxFlushMs: 0,
+    totalFlushMs: 0
+  };
+
+  const schedule = () => {
+    if (!timer) {
+      timer = setTimeout(() => {
+        timer = null;
+        flush().catch(() => {});
+      }, maxDelayMs);
+      timer.unref?.();
+    }
+  };
+
+  async function flush() {
+    if (flushing) await flushing.catch(() => {});
+    if (timer) {
+      clearTimeout(timer);
+      timer = null;
+    }
+    if (pending.length === 0) return;
+
+    const records = pending;
+    pending = [];
+    const startedAt = Date.now();
+
+    const requeue = (failed) => {
+      const retry = failed.filter((record) => {
+        const count = (attempts.get(record) || 0) + 1;
+        attempts.set(record, count);
+        return count < maxAttempts;
+      });
+      stats.droppedRecords += failed.length - retry.length;
+
+      // Keep the records for the next attempt, dropping the oldest beyond the cap.
+      pending = retry.concat(pending);
+      if (pending.length > maxPending) {
+        stats.droppedRecords += pending.length - maxPending;
+        pending = pending.slice(pending.length - maxPending);
+      }
+      if (pending.length > 0) schedule();
+    };
+
+    const run = (async () => {
+      let inserted = records;
+      let duplicates = [];
+      let failure = null;
+      try {
+        const collection = await getCollection();
+        await collection.insertMany(records, { ordered: false });
+      } catch (error) {
+        failure = error;
+        if (error instanceof MongoBulkWriteError) {
+          const failedAt = new Set();
+          const retryAt = new Set();
+          for (const writeError of [].concat(error.writeErrors || [])) {
+            failedAt.add(writeError.index);
+            if (writeError.code !== DUPLICATE_KEY) retryAt.add(writeError.index);
+          }
+          inserted = records.filter((record, i) => !failedAt.has(i));
+          duplicates = records.filter((record, i) => failedAt.has(i) && !retryAt.has(i));
+          requeue(records.filter((record, i) => retryAt.has(i)));
+          if (retryAt.size === 0) failure = null;
+        } else {
+          inserted = [];
+          requeue(records);
+        }
+      } finally {
+        const elapsed = Date.now() - startedAt;
+        stats.lastFlushMs = elapsed;
+        stats.maxFlushMs = Math.max(stats.maxFlushMs, elapsed);
+        stats.totalFlushMs += elapsed;
+      }
+
+      if (failure) {
+        stats.failedFlushes += 1;
+        console.error(`Write buffer "${name}" flush error:`, failure);
+      } else {
+        stats.flushes += 1;
+      }
+      stats.flushedRecords += inserted.length;
+
+      // Inserted records are persisted, so a failing hook must not re-queue them.
+      if (onFlush && inserted.length + duplicates.length > 0) {
+        try {
+          await onFlush(inserted, duplicates);
+        } catch (error) {
+          console.error(`Write buffer "${name}" onFlush error:`, error);
+        }
+      }
+
+      if (failure) throw failure;
+    })();
+
+    flushing = run;
+    run.catch(() => {}).finally(() => {
+      if (flushing === run) flushing = null;
+    });
+    return run;
+  }
+
+  function push(record) {
+    pending.push(record);
+    if (pending.length >= maxSize) {
+      flush().catch(() => {});
+    } else {
+      schedule();
+    }
+  }
+
+  function getStats() {
+    return {
+      ...stats,
+      depth: pending.length,
+      flushing: Boolean(flushing),
+      avgFlushMs: stats.flushes + stats.failedFlushes > 0
+        ? stats.totalFlushMs / (stats.flushes + stats.failedFlushes)
+        : 0
+    };
+  }
+
+  return { push, flush, getStats };
+}
+
+export function getWriteBuffer(name, getCollection, options = {}) {
+  if (!global._writeBuffers) global._writeBuffers = new Map();
+
+  if (!global._writeBuffers.has(name)) {
+    const buffer = createWriteBuffer(name, getCollection, options);
+    global._writeBuffers.set(name, buffer);
+    onShutdown(() => buffer.flush());
+  }
+  return global._writeBuffers.get(name);
+}
+
+export function getWriteBufferStats() {
+  return [...(global._writeBuffers?.values() || [])].map((buffer) => buffer.getStats());
+}
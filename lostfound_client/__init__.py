@@ -0,0 +1,25 @@
+"""
+Python client for the Lost & Found API
+
+    async with LostFoundClient(BASE_URL, email=..., password=...) as client:
+        async for item in client.iter_items(status="Found"):
+            ...
+
+Requires httpx (`pip install -r requirements.txt`).
+"""
+
+from .client import LostFoundClient
+from .errors import APIError, AuthenticationError
+from .models import Item, ItemInput, ItemPage, Match, Notification, User
+
+__all__ = [
+    "LostFoundClient",
+    "APIError",
+    "AuthenticationError",
+    "Item",
+    "ItemInput",
+    "ItemPage",
+    "Match",
+    "Notification",
+    "User",
+]
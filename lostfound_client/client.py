@@ -0,0 +1,291 @@
+"""
+Async client for the Lost & Found API
+
+One `httpx.AsyncClient` per client instance keeps connections alive and
+pooled; a semaphore bounds how many requests are in flight at once. Login
+follows the NextAuth credentials flow (CSRF token, then the credentials
+callback) and is repeated automatically when the session expires.
+"""
+
+import asyncio
+import os
+import uuid
+
+import httpx
+
+from .errors import APIError, AuthenticationError
+from .models import Item, ItemInput, ItemPage, Notification, User
+
+RETRY_STATUSES = {429, 502, 503, 504}
+
+
+def _retry_after(response):
+    value = response.headers.get("retry-after")
+    return float(value) if value and value.isdigit() else None
+
+
+class LostFoundClient:
+    def __init__(
+        self,
+        base_url,
+        email=None,
+        password=None,
+        max_connections=20,
+        max_concurrency=10,
+        timeout=30.0,
+        retries=3,
+        transport=None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.email = email
+        self.password = password
+        self.retries = retries
+        self.user = None
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            follow_redirects=False,
+            transport=transport,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._login_lock = asyncio.Lock()
+        self._session_generation = 0
+
+    async def __aenter__(self):
+        if self.email and self.password:
+            await self.login()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        await self._http.aclose()
+
+    # --- transport -------------------------------------------------------
+
+    async def _send(self, method, path, **kwargs):
+        """Send one request, retrying 429/5xx-busy responses with backoff"""
+        delay = 0.5
+        for attempt in range(self.retries + 1):
+            async with self._semaphore:
+                try:
+                    response = await self._http.request(method, f"/api{path}", **kwargs)
+                except httpx.TransportError:
+                    if attempt == self.retries:
+                        raise
+                    response = None
+
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                return response
+            if attempt == self.retries:
+                return response
+
+            retry_after = _retry_after(response) if response is not None else None
+            await asyncio.sleep(retry_after if retry_after is not None else delay)
+            delay = min(delay * 2, 30.0)
+
+    async def request(self, method, path, auth=True, **kwargs):
+        """Send a request and return the decoded JSON body
+
+        With `auth`, a 401 triggers one re-login (when credentials are known)
+        and a retry of the original request.
+        """
+        generation = self._session_generation
+        response = await self._send(method, path, **kwargs)
+
+        if response.status_code == 401 and auth and self.email and self.password:
+            await self._relogin(generation)
+            response = await self._send(method, path, **kwargs)
+
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = None
+
+        if response.status_code >= 400:
+            message = payload.get("error") if isinstance(payload, dict) else response.text
+            error_class = AuthenticationError if response.status_code == 401 else APIError
+            raise error_class(
+                response.status_code,
+                message or response.reason_phrase,
+                payload,
+                retry_after=_retry_after(response),
+            )
+        return payload
+
+    # --- authentication --------------------------------------------------
+
+    async def register(self, email, password, name):
+        data = await self.request(
+            "POST",
+            "/auth/register",
+            auth=False,
+            json={"email": email, "password": password, "name": name},
+        )
+        return User.from_dict(data["user"])
+
+    async def login(self, email=None, password=None):
+        """Log in through the NextAuth credentials provider"""
+        self.email = email or self.email
+        self.password = password or self.password
+        if not (self.email and self.password):
+            raise AuthenticationError(401, "Email and password are required")
+
+        self._http.cookies.clear()
+        csrf = await self.request("GET", "/auth/csrf", auth=False)
+        response = await self._send(
+            "POST",
+            "/auth/callback/credentials",
+            data={
+                "email": self.email,
+                "password": self.password,
+                "csrfToken": csrf.get("csrfToken", ""),
+                "callbackUrl": f"{self.base_url}/",
+                "json": "true",
+            },
+        )
+        if response.status_code not in (200, 302):
+            raise AuthenticationError(response.status_code, "Login failed")
+
+        user = await self.session_user()
+        if user is None:
+            raise AuthenticationError(401, "Invalid credentials")
+
+        self.user = user
+        self._session_generation += 1
+        return user
+
+    async def _relogin(self, generation):
+        # Concurrent 401s share one login: only the first caller whose
+        # session is still the expired one logs in again.
+        async with self._login_lock:
+            if self._session_generation == generation:
+                await self.login()
+
+    async def session_user(self):
+        data = await self.request("GET", "/auth/session", auth=False)
+        if data and data.get("user"):
+            return User.from_dict(data["user"])
+        return None
+
+    # --- items -----------------------------------------------------------
+
+    @staticmethod
+    def _filter_params(search=None, category=None, location=None, status=None, verified=None):
+        params = {}
+        for name, value in (
+            ("search", search),
+            ("category", category),
+            ("location", location),
+            ("status", status),
+        ):
+            if value:
+                params[name] = value
+        if verified:
+            params["verified"] = "true"
+        return params
+
+    async def list_items(self, page=1, limit=24, facets=False, **filters):
+        params = self._filter_params(**filters)
+        params.update({"page": page, "limit": limit})
+        if facets:
+            params["facets"] = "true"
+
+        data = await self.request("GET", "/items", params=params)
+        return ItemPage(
+            items=[Item.from_dict(item) for item in data["items"]],
+            page=data.get("page", page),
+            limit=data.get("limit", limit),
+            has_more=data.get("hasMore", False),
+            facets=data.get("facets"),
+        )
+
+    async def iter_items(self, page_size=50, **filters):
+        """Yield every item matching the filters, one page at a time"""
+        page = 1
+        while True:
+            result = await self.list_items(page=page, limit=page_size, **filters)
+            for item in result.items:
+                yield item
+            if not result.has_more:
+                return
+            page += 1
+
+    async def get_item(self, item_id):
+        data = await self.request("GET", f"/items/{item_id}")
+        return Item.from_dict(data["item"])
+
+    async def create_item(self, item, idempotency_key=None):
+        """Create an item from an `ItemInput` or a dict
+
+        An Idempotency-Key is always sent (generated when not given), so the
+        transport retries cannot create duplicates.
+        """
+        body = item.to_dict() if isinstance(item, ItemInput) else dict(item)
+        data = await self.request(
+            "POST",
+            "/items",
+            json=body,
+            headers={"Idempotency-Key": idempotency_key or str(uuid.uuid4())},
+        )
+        return Item.from_dict(data["item"])
+
+    async def update_item(self, item_id, **fields):
+        data = await self.request("PUT", f"/items/{item_id}", json=fields)
+        return Item.from_dict(data["item"])
+
+    async def verify_item(self, item_id, verified=True):
+        return await self.update_item(item_id, verified=verified)
+
+    async def delete_item(self, item_id):
+        await self.request("DELETE", f"/items/{item_id}")
+
+    # --- uploads ---------------------------------------------------------
+
+    async def upload(self, file, filename=None, content_type="application/octet-stream", idempotency_key=None):
+        """Upload a file (path or bytes) and return its public URL"""
+        if isinstance(file, (str, os.PathLike)):
+            filename = filename or os.path.basename(file)
+            with open(file, "rb") as handle:
+                content = handle.read()
+        else:
+            content = file
+        data = await self.request(
+            "POST",
+            "/upload",
+            files={"file": (filename or "upload.bin", content, content_type)},
+            headers={"Idempotency-Key": idempotency_key or str(uuid.uuid4())},
+        )
+        return data["url"]
+
+    # --- notifications ---------------------------------------------------
+
+    async def unread_count(self):
+        data = await self.request("GET", "/notifications/unread")
+        return data["unread"]
+
+    async def iter_notifications(self, page_size=20, unread_only=False):
+        """Yield notifications newest first, following the inbox cursor"""
+        cursor = None
+        while True:
+            params = {"limit": page_size}
+            if cursor:
+                params["cursor"] = cursor
+            if unread_only:
+                params["unread"] = "true"
+            data = await self.request("GET", "/notifications", params=params)
+            for notification in data["notifications"]:
+                yield Notification.from_dict(notification)
+            cursor = data.get("nextCursor")
+            if not cursor:
+                return
+
+    async def mark_notifications_read(self, ids=None):
+        body = {"ids": list(ids)} if ids is not None else {"all": True}
+        data = await self.request("POST", "/notifications/read", json=body)
+        return data["unread"]
@@ -0,0 +1,18 @@
+"""
+Exceptions raised by the Lost & Found API client
+"""
+
+
+class APIError(Exception):
+    """Non-success response from the API"""
+
+    def __init__(self, status_code, message, payload=None, retry_after=None):
+        super().__init__(f"{status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+        self.payload = payload
+        self.retry_after = retry_after
+
+
+class AuthenticationError(APIError):
+    """Login failed, or a request needs a session the client cannot obtain"""
@@ -0,0 +1,297 @@
+"""
+Bulk ingestion of legacy catalog records
+
+    python -m lostfound_client.ingest records.csv --images ./photos \
+        --base-url https://... --email admin@... --password ... --concurrency 16
+
+Reads CSV, JSON (array) or NDJSON records. For each record it uploads the
+photo named in its `image` column (relative to --images) and creates the item.
+Completed records are checkpointed to --state, so an interrupted run resumes
+where it stopped. Both requests carry Idempotency-Keys derived from the
+record id, so a record that was in flight when the run died is not
+duplicated either.
+
+Concurrency adapts: a 429, 5xx or connection error halves the number of
+records in flight and pauses for Retry-After; a full round of successes
+raises it by one, up to --concurrency.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import mimetypes
+import os
+import sys
+import time
+
+import httpx
+
+from .client import LostFoundClient
+from .errors import APIError
+from .models import ItemInput
+
+THROTTLE_STATUSES = {429, 500, 502, 503, 504}
+ITEM_FIELDS = ("title", "description", "category", "status", "location", "date", "contactInfo")
+STATUSES = {"lost": "Lost", "found": "Found"}
+
+
+def normalize_status(value):
+    """Map a source status onto the API's Lost/Found values, defaulting to Found"""
+    text = str(value or "").strip()
+    return STATUSES.get(text.lower(), text) if text else "Found"
+
+
+def read_records(path):
+    """Yield records from a .csv, .json or .jsonl/.ndjson file"""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, newline="", encoding="utf-8") as handle:
+        if ext == ".csv":
+            yield from csv.DictReader(handle)
+        elif ext in (".jsonl", ".ndjson"):
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(handle)
+
+
+class Checkpoint:
+    """Record ids already ingested (and failures), persisted atomically"""
+
+    def __init__(self, path, flush_every=50):
+        self.path = path
+        self.flush_every = flush_every
+        self.done = {}
+        self.failed = {}
+        self._dirty = 0
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as handle:
+                state = json.load(handle)
+            self.done = state.get("done", {})
+            self.failed = state.get("failed", {})
+
+    def mark_done(self, record_id, item_id):
+        self.done[record_id] = item_id
+        self.failed.pop(record_id, None)
+        self._touch()
+
+    def mark_failed(self, record_id, message):
+        self.failed[record_id] = message
+        self._touch()
+
+    def _touch(self):
+        self._dirty += 1
+        if self._dirty >= self.flush_every:
+            self.save()
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"done": self.done, "failed": self.failed}, handle)
+        os.replace(tmp_path, self.path)
+        self._dirty = 0
+
+
+class AdaptiveLimiter:
+    """Additive-increase / multiplicative-decrease cap on work in flight"""
+
+    def __init__(self, max_limit):
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self.in_flight = 0
+        self.successes = 0
+        self.paused_until = 0.0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        delay = self.paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def success(self):
+        self.successes += 1
+        if self.successes >= self.limit and self.limit < self.max_limit:
+            self.limit += 1
+            self.successes = 0
+
+    def throttle(self, retry_after=None):
+        self.limit = max(1, self.limit // 2)
+        self.successes = 0
+        self.paused_until = max(self.paused_until, time.monotonic() + (retry_after or 1.0))
+
+
+class Ingestor:
+    def __init__(self, client, checkpoint, source, image_dir, concurrency, id_field, max_attempts):
+        self.client = client
+        self.source = source
+        self.checkpoint = checkpoint
+        self.image_dir = image_dir
+        self.limiter = AdaptiveLimiter(concurrency)
+        self.id_field = id_field
+        self.max_attempts = max_attempts
+        self.created = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def record_id(self, record, index):
+        return str(record.get(self.id_field) or f"row-{index}")
+
+    async def ingest_record(self, record_id, record):
+        image_url = None
+        image_name = record.get("image")
+        if image_name:
+            image_path = os.path.join(self.image_dir, image_name)
+            content_type = mimetypes.guess_type(image_path)[0] or "application/octet-stream"
+            image_url = await self.client.upload(
+                image_path,
+                content_type=content_type,
+                idempotency_key=f"ingest-image:{self.source}:{record_id}",
+            )
+
+        fields = {name: record.get(name) or None for name in ITEM_FIELDS}
+        fields["status"] = normalize_status(fields["status"])
+        item = await self.client.create_item(
+            ItemInput(**fields, image=image_url),
+            idempotency_key=f"ingest:{self.source}:{record_id}",
+        )
+        return item.id
+
+    async def process(self, record_id, record):
+        for attempt in range(1, self.max_attempts + 1):
+            async with self.limiter:
+                try:
+                    item_id = await self.ingest_record(record_id, record)
+                except APIError as e:
+                    if e.status_code in THROTTLE_STATUSES and attempt < self.max_attempts:
+                        self.limiter.throttle(e.retry_after)
+                        continue
+                    self.failed += 1
+                    self.checkpoint.mark_failed(record_id, str(e))
+                    return
+                except (httpx.TransportError, OSError) as e:
+                    if isinstance(e, httpx.TransportError) and attempt < self.max_attempts:
+                        self.limiter.throttle()
+                        continue
+                    self.failed += 1
+                    self.checkpoint.mark_failed(record_id, f"{type(e).__name__}: {e}")
+                    return
+
+            self.limiter.success()
+            self.created += 1
+            self.checkpoint.mark_done(record_id, item_id)
+            return
+
+    async def report(self, interval):
+        started = time.monotonic()
+        last_count, last_time = 0, started
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            rate = (self.created - last_count) / (now - last_time)
+            overall = self.created / (now - started)
+            print(
+                f"created={self.created} failed={self.failed} skipped={self.skipped} "
+                f"rate={rate:.1f}/s avg={overall:.1f}/s concurrency={self.limiter.limit}",
+                flush=True,
+            )
+            last_count, last_time = self.created, now
+
+    async def run(self, records, report_interval):
+        queue = asyncio.Queue(maxsize=self.limiter.max_limit * 2)
+
+        async def worker():
+            while True:
+                entry = await queue.get()
+                try:
+                    if entry is None:
+                        return
+                    await self.process(*entry)
+                except Exception as e:
+                    # A worker that died here would leave the producer
+                    # blocked on a full queue, so any row error is recorded.
+                    record_id = entry[0]
+                    self.failed += 1
+                    self.checkpoint.mark_failed(record_id, f"{type(e).__name__}: {e}")
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.limiter.max_limit)]
+        reporter = asyncio.create_task(self.report(report_interval))
+        try:
+            for index, record in enumerate(records, start=1):
+                record_id = self.record_id(record, index)
+                if record_id in self.checkpoint.done:
+                    self.skipped += 1
+                    continue
+                await queue.put((record_id, record))
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            reporter.cancel()
+            self.checkpoint.save()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Bulk-load legacy catalog records into Lost & Found")
+    parser.add_argument("records", help="CSV, JSON or NDJSON file of records")
+    parser.add_argument("--images", default=".", help="directory the records' image names are relative to")
+    parser.add_argument("--base-url", default=os.environ.get("LOSTFOUND_BASE_URL", "http://localhost:3000"))
+    parser.add_argument("--email", default=os.environ.get("LOSTFOUND_EMAIL"))
+    parser.add_argument("--password", default=os.environ.get("LOSTFOUND_PASSWORD"))
+    parser.add_argument("--concurrency", type=int, default=16, help="maximum records in flight")
+    parser.add_argument("--state", default="ingest-state.json", help="checkpoint file")
+    parser.add_argument("--id-field", default="id", help="record field that identifies a record")
+    parser.add_argument("--max-attempts", type=int, default=5, help="attempts per record on throttling")
+    parser.add_argument("--report-interval", type=float, default=5.0, help="seconds between progress lines")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+    if not (args.email and args.password):
+        print("--email and --password (or LOSTFOUND_EMAIL/LOSTFOUND_PASSWORD) are required", file=sys.stderr)
+        return 2
+
+    checkpoint = Checkpoint(args.state)
+    # Throttling is handled here, so the client itself does not retry.
+    async with LostFoundClient(
+        args.base_url,
+        args.email,
+        args.password,
+        max_connections=args.concurrency * 2,
+        max_concurrency=args.concurrency * 2,
+        retries=0,
+    ) as client:
+        ingestor = Ingestor(
+            client,
+            checkpoint,
+            os.path.basename(args.records),
+            args.images,
+            args.concurrency,
+            args.id_field,
+            args.max_attempts,
+        )
+        started = time.monotonic()
+        await ingestor.run(read_records(args.records), args.report_interval)
+        elapsed = time.monotonic() - started
+
+    print(
+        f"Done: created={ingestor.created} failed={ingestor.failed} skipped={ingestor.skipped} "
+        f"in {elapsed:.0f}s ({ingestor.created / max(elapsed, 1e-9):.1f} items/s); state in {args.state}"
+    )
+    return 1 if ingestor.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,114 @@
+"""
+Typed models for Lost & Found API resources
+
+Each model keeps the documented fields as attributes and any other field the
+API returns in `extra`, so newer server fields never break parsing.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+
+def _split(cls, data):
+    known = {f.name for f in fields(cls) if f.name != "extra"}
+    values = {key: value for key, value in data.items() if key in known}
+    extra = {key: value for key, value in data.items() if key not in known and key != "_id"}
+    return values, extra
+
+
+@dataclass
+class User:
+    id: str
+    email: str
+    name: Optional[str] = None
+    role: str = "user"
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data):
+        values, extra = _split(cls, data)
+        return cls(**values, extra=extra)
+
+    @property
+    def is_admin(self):
+        return self.role == "admin"
+
+
+@dataclass
+class Match:
+    id: str
+    title: str
+    status: str
+    score: float
+
+
+@dataclass
+class Item:
+    id: str
+    title: str
+    description: str
+    category: str
+    status: str
+    location: str
+    date: str
+    image: Optional[str] = None
+    contactInfo: Optional[str] = None
+    userId: Optional[str] = None
+    userName: Optional[str] = None
+    verified: bool = False
+    createdAt: Optional[str] = None
+    updatedAt: Optional[str] = None
+    matches: List[Match] = field(default_factory=list)
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data):
+        values, extra = _split(cls, data)
+        values["matches"] = [
+            Match(match["id"], match.get("title", ""), match.get("status", ""), match.get("score", 0.0))
+            for match in values.get("matches") or []
+        ]
+        return cls(**values, extra=extra)
+
+
+@dataclass
+class ItemInput:
+    """Fields accepted by `POST /api/items`"""
+
+    title: str
+    description: str
+    category: str
+    status: str
+    location: str
+    date: str
+    image: Optional[str] = None
+    contactInfo: Optional[str] = None
+
+    def to_dict(self):
+        return {f.name: getattr(self, f.name) for f in fields(self) if getattr(self, f.name) is not None}
+
+
+@dataclass
+class ItemPage:
+    items: List[Item]
+    page: int
+    limit: int
+    has_more: bool
+    facets: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class Notification:
+    id: str
+    type: str
+    title: str
+    message: str
+    read: bool = False
+    itemId: Optional[str] = None
+    createdAt: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data):
+        values, extra = _split(cls, data)
+        return cls(**values, extra=extra)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Lost & Found metrics scraper
+Polls /api/metrics during a load run and records every scrape as one NDJSON
+line, so latency can be lined up against event-loop lag, heap and Mongo pool
+pressure afterwards.
+
+    python metrics_scraper.py --out run.ndjson -- python backend_test_sdk.py
+
+Without a command it scrapes until interrupted (Ctrl+C).
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+import requests
+
+BASE_URL = os.environ.get("LOSTFOUND_BASE_URL", "https://recoverhub-4.preview.emergentagent.com")
+SAMPLE_LINE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{.*\})?\s+(\S+)$")
+LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def parse_metrics(text, keep_buckets=False):
+    """Parse Prometheus text format into {series: value}"""
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        match = SAMPLE_LINE.match(line)
+        if not match:
+            continue
+        name, labels, value = match.groups()
+        if name.endswith("_bucket") and not keep_buckets:
+            continue
+        samples[f"{name}{labels or ''}"] = float(value)
+    return samples
+
+
+def parse_buckets(text):
+    """Histogram buckets as {(name, labels without le): [(le, count), ...]}"""
+    buckets = {}
+    for line in text.splitlines():
+        match = SAMPLE_LINE.match(line)
+        if not match or not match.group(1).endswith("_bucket"):
+            continue
+        name, labels, value = match.groups()
+        pairs = dict(LABEL.findall(labels or ""))
+        le = pairs.pop("le")
+        key = (name[: -len("_bucket")], tuple(sorted(pairs.items())))
+        buckets.setdefault(key, []).append((float("inf") if le == "+Inf" else float(le), float(value)))
+    return buckets
+
+
+def quantile(bucket_deltas, q):
+    """Upper bucket bound containing quantile q of the observations"""
+    total = bucket_deltas[-1][1] if bucket_deltas else 0
+    if total <= 0:
+        return None
+    for bound, count in bucket_deltas:
+        if count >= q * total:
+            return bound
+    return None
+
+
+class MetricsScraper:
+    def __init__(self, url, token=None, keep_buckets=False):
+        self.url = url
+        self.session = requests.Session()
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        self.keep_buckets = keep_buckets
+        self.first_text = None
+        self.last_text = None
+        self.peaks = {}
+
+    def scrape(self):
+        response = self.session.get(self.url, timeout=10)
+        response.raise_for_status()
+        text = response.text
+        if self.first_text is None:
+            self.first_text = text
+        self.last_text = text
+
+        samples = parse_metrics(text, self.keep_buckets)
+        for series, value in samples.items():
+            if series.startswith(("nodejs_eventloop", "nodejs_memory_bytes", "mongodb_pool", "upload_bytes_in_flight", "http_requests_in_flight")):
+                self.peaks[series] = max(self.peaks.get(series, value), value)
+        return samples
+
+    def summary(self):
+        """Peak resource gauges and per-route latency quantiles over the run"""
+        lines = ["=== Peaks ==="]
+        for series in sorted(self.peaks):
+            lines.append(f"{series} {self.peaks[series]:g}")
+
+        if self.first_text and self.last_text:
+            lines.append("=== Latency over the run (bucket upper bounds) ===")
+            before = parse_buckets(self.first_text)
+            for (name, labels), after in sorted(parse_buckets(self.last_text).items()):
+                if name != "http_request_duration_seconds":
+                    continue
+                start = dict(before.get((name, labels), []))
+                deltas = [(bound, count - start.get(bound, 0)) for bound, count in after]
+                if deltas[-1][1] <= 0:
+                    continue
+                p50, p95, p99 = (quantile(deltas, q) for q in (0.5, 0.95, 0.99))
+                label_text = ",".join(f"{k}={v}" for k, v in labels)
+                lines.append(f"{label_text} n={deltas[-1][1]:g} p50<={p50}s p95<={p95}s p99<={p99}s")
+        return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record /api/metrics during a load run")
+    parser.add_argument("--url", default=f"{BASE_URL}/api/metrics")
+    parser.add_argument("--token", default=os.environ.get("METRICS_TOKEN"))
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between scrapes")
+    parser.add_argument("--out", default="metrics.ndjson", help="NDJSON file, one scrape per line")
+    parser.add_argument("--buckets", action="store_true", help="also record histogram buckets")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="load command to run while scraping (after --)")
+    args = parser.parse_args()
+
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    scraper = MetricsScraper(args.url, args.token, args.buckets)
+    process = subprocess.Popen(command) if command else None
+
+    print(f"📈 Scraping {args.url} every {args.interval}s into {args.out}")
+    try:
+        with open(args.out, "a", encoding="utf-8") as out:
+            while process is None or process.poll() is None:
+                started = time.time()
+                try:
+                    samples = scraper.scrape()
+                    out.write(json.dumps({"ts": started, "samples": samples}) + "\n")
+                    out.flush()
+                except requests.RequestException as e:
+                    print(f"Scrape failed: {e}", file=sys.stderr)
+                time.sleep(max(0.0, args.interval - (time.time() - started)))
+            # One last scrape so the summary covers the whole run.
+            try:
+                scraper.scrape()
+            except requests.RequestException:
+                pass
+    except KeyboardInterrupt:
+        pass
+
+    print(scraper.summary())
+    return process.returncode if process else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
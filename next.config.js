@@ -6,6 +6,10 @@ const nextConfig = {
   experimental: {
     // Remove if not using Server Components
     serverComponentsExternalPackages: ['mongodb'],
+    // Tree-shake barrel imports so routes only ship the icons/helpers they use
+    optimizePackageImports: ['lucide-react', 'date-fns', 'recharts'],
+    // Runs instrumentation.js on boot to start the readiness warmup
+    instrumentationHook: true,
   },
   webpack(config, { dev }) {
     if (dev) {
@@ -0,0 +1,73 @@
+#!/usr/bin/env node
+// Compares each app route's first-load JavaScript (gzip) against the budgets
+// in bundle-budget.json. Runs after `next build`.
+//
+//   node scripts/check-bundle-budget.js           exit non-zero when a route is over budget
+//   node scripts/check-bundle-budget.js --warn    report only, never fail
+//   node scripts/check-bundle-budget.js --update  set every budget from this build plus headroom
+//
+// Routes without a budget are reported but never fail; budgets are meant to
+// be recorded with --update from a real production build, not guessed.
+
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const root = path.join(__dirname, '..');
+const nextDir = path.join(root, '.next');
+const manifestPath = path.join(nextDir, 'app-build-manifest.json');
+const budgetPath = path.join(root, 'bundle-budget.json');
+const budget = JSON.parse(fs.readFileSync(budgetPath, 'utf8'));
+
+const warnOnly = process.argv.includes('--warn');
+const update = process.argv.includes('--update');
+
+if (!fs.existsSync(manifestPath)) {
+  console.error('Bundle budget: .next/app-build-manifest.json not found, run `next build` first');
+  process.exit(warnOnly ? 0 : 1);
+}
+
+const { pages } = JSON.parse(fs.readFileSync(manifestPath, 'utf8'));
+const gzipCache = new Map();
+
+function gzipSize(file) {
+  if (!gzipCache.has(file)) {
+    const filepath = path.join(nextDir, file);
+    const size = fs.existsSync(filepath) ? zlib.gzipSync(fs.readFileSync(filepath)).length : 0;
+    gzipCache.set(file, size);
+  }
+  return gzipCache.get(file);
+}
+
+let failed = false;
+const rows = [];
+const measured = {};
+
+for (const [route, files] of Object.entries(pages)) {
+  if (!route.endsWith('/page')) continue;
+
+  const js = [...new Set(files)].filter((file) => file.endsWith('.js'));
+  const kb = js.reduce((sum, file) => sum + gzipSize(file), 0) / 1024;
+  measured[route] = kb;
+
+  const limit = budget.routes[route] ?? null;
+  const over = limit !== null && kb > limit;
+  failed = failed || over;
+  rows.push({ route, kb: kb.toFixed(1), limit: limit ?? '-', status: limit === null ? 'no budget' : over ? 'OVER' : 'ok' });
+}
+
+console.table(rows);
+
+if (update) {
+  const headroom = 1 + (budget.headroomPercent ?? 10) / 100;
+  budget.routes = Object.fromEntries(
+    Object.entries(measured)
+      .sort(([a], [b]) => a.localeCompare(b))
+      .map(([route, kb]) => [route, Math.ceil(kb * headroom)])
+  );
+  fs.writeFileSync(budgetPath, `${JSON.stringify(budget, null, 2)}\n`);
+  console.log(`Bundle budget: recorded ${Object.keys(budget.routes).length} routes in bundle-budget.json`);
+} else if (failed) {
+  console.error('Bundle budget exceeded; see bundle-budget.json');
+  if (!warnOnly) process.exit(1);
+}
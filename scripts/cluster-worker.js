@@ -0,0 +1,26 @@
+// Preloaded into each cluster worker (node --require) ahead of the standalone
+// server.js. Counts HTTP requests and reports them with the worker's memory
+// usage to the primary over IPC.
+
+const cluster = require('cluster');
+const diagnosticsChannel = require('diagnostics_channel');
+
+if (cluster.isWorker) {
+  const REPORT_INTERVAL_MS = parseInt(process.env.CLUSTER_WORKER_REPORT_MS || '5000', 10);
+  let requests = 0;
+  let inFlight = 0;
+
+  diagnosticsChannel.subscribe('http.server.request.start', () => {
+    requests++;
+    inFlight++;
+  });
+  diagnosticsChannel.subscribe('http.server.response.finish', () => {
+    inFlight = Math.max(0, inFlight - 1);
+  });
+
+  setInterval(() => {
+    if (!process.connected) return;
+    const { rss, heapUsed } = process.memoryUsage();
+    process.send({ type: 'worker-stats', requests, inFlight, rss, heapUsed });
+  }, REPORT_INTERVAL_MS).unref();
+}
@@ -0,0 +1,155 @@
+#!/usr/bin/env node
+// Runs the standalone Next.js server (.next/standalone/server.js) on every
+// core. Workers share the listening port through node:cluster, each gets an
+// equal slice of the Mongo connection budget, crashed workers are replaced,
+// and SIGHUP replaces workers one at a time without dropping the port.
+//
+//   CLUSTER_WORKERS        worker count (default: available cores)
+//   MONGO_POOL_BUDGET      total Mongo connections across workers (default 100)
+//   CLUSTER_DRAIN_MS       time a retiring worker gets to finish requests
+//   CLUSTER_REPORT_MS      interval for the per-worker RSS/request report
+
+const cluster = require('cluster');
+const os = require('os');
+const path = require('path');
+
+const root = path.join(__dirname, '..');
+const serverPath = process.env.CLUSTER_SERVER || path.join(root, '.next', 'standalone', 'server.js');
+
+const WORKERS = parseInt(process.env.CLUSTER_WORKERS || String(os.availableParallelism()), 10);
+const POOL_BUDGET = parseInt(process.env.MONGO_POOL_BUDGET || '100', 10);
+const DRAIN_MS = parseInt(process.env.CLUSTER_DRAIN_MS || '15000', 10);
+const REPORT_MS = parseInt(process.env.CLUSTER_REPORT_MS || '60000', 10);
+const RESTART_BACKOFF_MS = 1000;
+const MAX_RESTART_BACKOFF_MS = 30000;
+
+// Sized for WORKERS + 1 so the extra worker that exists during a rolling
+// restart stays inside the budget.
+const poolSize = Math.max(2, Math.floor(POOL_BUDGET / (WORKERS + 1)));
+
+const stats = new Map();
+const retiring = new Set();
+let shuttingDown = false;
+let rolling = false;
+let crashBackoff = RESTART_BACKOFF_MS;
+
+cluster.setupPrimary({
+  exec: serverPath,
+  execArgv: [...process.execArgv, '--require', path.join(__dirname, 'cluster-worker.js')]
+});
+
+function fork() {
+  const worker = cluster.fork({
+    MONGO_MAX_POOL_SIZE: String(poolSize),
+    // Lets lib/shutdown.js flush buffers before the worker exits.
+    NEXT_MANUAL_SIG_HANDLE: 'true'
+  });
+  stats.set(worker.id, { pid: worker.process.pid, requests: 0, inFlight: 0, rss: 0, heapUsed: 0, startedAt: Date.now() });
+  worker.on('message', (message) => {
+    if (message && message.type === 'worker-stats') {
+      Object.assign(stats.get(worker.id) || {}, message);
+    }
+  });
+  return worker;
+}
+
+function waitForListening(worker) {
+  return new Promise((resolve, reject) => {
+    worker.once('listening', resolve);
+    worker.once('exit', (code) => reject(new Error(`worker ${worker.process.pid} exited with code ${code} before listening`)));
+  });
+}
+
+// Stops accepting new connections on the worker, then sends SIGTERM so its
+// shutdown hooks run once in-flight requests had time to finish.
+function retire(worker) {
+  retiring.add(worker.id);
+  return new Promise((resolve) => {
+    const timer = setTimeout(() => worker.process.kill('SIGTERM'), DRAIN_MS);
+    worker.once('exit', () => {
+      clearTimeout(timer);
+      resolve();
+    });
+    worker.disconnect();
+  });
+}
+
+async function rollingRestart() {
+  if (rolling || shuttingDown) return;
+  rolling = true;
+  console.log(`Cluster: rolling restart of ${Object.keys(cluster.workers).length} workers`);
+  try {
+    for (const worker of Object.values(cluster.workers)) {
+      if (retiring.has(worker.id)) continue;
+      const replacement = fork();
+      await waitForListening(replacement);
+      await retire(worker);
+    }
+    console.log('Cluster: rolling restart complete');
+  } catch (error) {
+    // Keep the remaining old workers serving when a new build fails to boot.
+    console.error('Cluster: rolling restart aborted:', error.message);
+  } finally {
+    rolling = false;
+  }
+}
+
+function report() {
+  const rows = Object.values(cluster.workers).map((worker) => {
+    const s = stats.get(worker.id) || {};
+    return {
+      worker: worker.id,
+      pid: s.pid,
+      requests: s.requests,
+      inFlight: s.inFlight,
+      rssMB: Math.round((s.rss || 0) / 1024 / 1024),
+      heapMB: Math.round((s.heapUsed || 0) / 1024 / 1024),
+      uptimeS: Math.round((Date.now() - s.startedAt) / 1000)
+    };
+  });
+  console.log(`Cluster: ${JSON.stringify(rows)}`);
+}
+
+function shutdown(signal) {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  console.log(`Cluster: ${signal} received, stopping workers`);
+  for (const worker of Object.values(cluster.workers)) {
+    worker.process.kill(signal);
+  }
+  // Exits once every worker is gone (see the 'exit' handler).
+  if (Object.keys(cluster.workers).length === 0) process.exit(0);
+}
+
+cluster.on('exit', (worker, code, signal) => {
+  stats.delete(worker.id);
+  const planned = retiring.delete(worker.id) || worker.exitedAfterDisconnect;
+
+  if (shuttingDown) {
+    if (Object.keys(cluster.workers).length === 0) process.exit(0);
+    return;
+  }
+  if (planned) return;
+
+  console.error(`Cluster: worker ${worker.process.pid} died (${signal || code}), restarting in ${crashBackoff}ms`);
+  setTimeout(() => {
+    if (!shuttingDown) fork();
+  }, crashBackoff);
+  // Back off while workers keep crashing; reset once one stays up.
+  crashBackoff = Math.min(crashBackoff * 2, MAX_RESTART_BACKOFF_MS);
+});
+
+cluster.on('listening', () => {
+  setTimeout(() => {
+    crashBackoff = RESTART_BACKOFF_MS;
+  }, MAX_RESTART_BACKOFF_MS).unref();
+});
+
+console.log(`Cluster: starting ${WORKERS} workers of ${serverPath}, Mongo pool ${poolSize} per worker`);
+for (let i = 0; i < WORKERS; i++) fork();
+
+process.on('SIGHUP', rollingRestart);
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));
+process.on('SIGUSR2', report);
+setInterval(report, REPORT_MS).unref();
@@ -0,0 +1,55 @@
+#!/usr/bin/env bash
+# Starts a local three-member replica set for exercising read routing and
+# read-your-own-writes (lib/consistency.js). Requires mongod and mongosh.
+#
+#   scripts/mongo-replset.sh start   # members on 27017-27019 under $RS_DIR
+#   scripts/mongo-replset.sh stop
+#
+# Then run the app with:
+#   MONGO_URL="mongodb://127.0.0.1:27017,127.0.0.1:27018,127.0.0.1:27019/?replicaSet=rs0"
+#   MONGO_READ_PREFERENCE=secondary
+# To make lag visible, pause replication on one secondary with
+#   mongosh --port 27018 --eval 'db.fsyncLock()'   (and db.fsyncUnlock())
+
+set -euo pipefail
+
+RS_NAME="${RS_NAME:-rs0}"
+RS_DIR="${RS_DIR:-/tmp/lostandfound-rs}"
+PORTS=(27017 27018 27019)
+
+start() {
+  for port in "${PORTS[@]}"; do
+    mkdir -p "$RS_DIR/$port"
+    mongod --replSet "$RS_NAME" --port "$port" --bind_ip 127.0.0.1 \
+      --dbpath "$RS_DIR/$port" --logpath "$RS_DIR/$port.log" --fork
+  done
+
+  mongosh --quiet --port "${PORTS[0]}" --eval "
+    try {
+      rs.status();
+    } catch (e) {
+      rs.initiate({
+        _id: '$RS_NAME',
+        members: [
+          { _id: 0, host: '127.0.0.1:${PORTS[0]}', priority: 2 },
+          { _id: 1, host: '127.0.0.1:${PORTS[1]}' },
+          { _id: 2, host: '127.0.0.1:${PORTS[2]}' }
+        ]
+      });
+    }
+    while (!db.hello().isWritablePrimary) sleep(500);
+    print('Replica set $RS_NAME ready');
+  "
+}
+
+stop() {
+  for port in "${PORTS[@]}"; do
+    mongosh --quiet --port "$port" --eval 'db.getSiblingDB("admin").shutdownServer()' || true
+  done
+}
+
+case "${1:-start}" in
+  start) start ;;
+  stop) stop ;;
+  *) echo "usage: $0 [start|stop]" >&2; exit 1 ;;
+esac
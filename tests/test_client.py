@@ -0,0 +1,227 @@
+"""
+Offline tests for lostfound_client: model parsing, retries, re-login and
+pagination, against an in-process API served through httpx.MockTransport
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from lostfound_client import APIError, AuthenticationError, Item, ItemInput, LostFoundClient
+
+BASE_URL = "http://lostfound.test"
+
+ITEM = {
+    "_id": "65f000000000000000000001",
+    "id": "item-1",
+    "title": "Black wallet",
+    "description": "Leather wallet",
+    "category": "Accessories",
+    "status": "found",
+    "location": "Library",
+    "date": "2024-05-01",
+    "verified": True,
+    "matches": [{"id": "item-2", "title": "Lost wallet", "status": "lost", "score": 0.82}],
+    "features": {"side": "found"},
+}
+
+
+class FakeAPI:
+    """Minimal Lost & Found API: NextAuth login plus scripted route responses"""
+
+    def __init__(self, password="secret"):
+        self.password = password
+        self.requests = []
+        self.logins = 0
+        self.session_valid = False
+        self.routes = {}
+
+    def on(self, method, path, *responses):
+        """Queue responses for a route; the last one repeats"""
+        self.routes[(method, path)] = list(responses)
+
+    def handler(self, request):
+        self.requests.append(request)
+        path = request.url.path
+
+        if path == "/api/auth/csrf":
+            return httpx.Response(200, json={"csrfToken": "csrf"})
+        if path == "/api/auth/callback/credentials":
+            self.logins += 1
+            self.session_valid = dict(httpx.QueryParams(request.content.decode()))["password"] == self.password
+            return httpx.Response(200, json={"url": f"{BASE_URL}/"})
+        if path == "/api/auth/session":
+            if not self.session_valid:
+                return httpx.Response(200, json={})
+            return httpx.Response(200, json={"user": {"id": "u1", "email": "a@b.c", "role": "admin"}})
+
+        queue = self.routes.get((request.method, path))
+        if not queue:
+            return httpx.Response(404, json={"error": "Not found"})
+        response = queue.pop(0) if len(queue) > 1 else queue[0]
+        return response(request) if callable(response) else response
+
+    def client(self, **kwargs):
+        kwargs.setdefault("retries", 3)
+        return LostFoundClient(BASE_URL, transport=httpx.MockTransport(self.handler), **kwargs)
+
+    def calls(self, method, path):
+        return [r for r in self.requests if r.method == method and r.url.path == path]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def busy(status=503):
+    # Retry-After: 0 keeps the retry loop from sleeping.
+    return httpx.Response(status, headers={"Retry-After": "0"}, json={"error": "Service busy"})
+
+
+def test_item_from_dict_keeps_unknown_fields_in_extra():
+    item = Item.from_dict(ITEM)
+
+    assert item.id == "item-1"
+    assert item.verified is True
+    assert item.matches[0].id == "item-2"
+    assert item.matches[0].score == 0.82
+    assert item.extra == {"features": {"side": "found"}}
+
+
+def test_item_input_omits_unset_fields():
+    body = ItemInput("Keys", "Car keys", "Keys", "lost", "Gym", "2024-05-02").to_dict()
+
+    assert body == {
+        "title": "Keys",
+        "description": "Car keys",
+        "category": "Keys",
+        "status": "lost",
+        "location": "Gym",
+        "date": "2024-05-02",
+    }
+
+
+def test_retries_busy_responses_until_success():
+    api = FakeAPI()
+    api.on("GET", "/api/items/item-1", busy(503), busy(429), httpx.Response(200, json={"item": ITEM}))
+
+    async def scenario():
+        async with api.client() as client:
+            return await client.get_item("item-1")
+
+    item = run(scenario())
+    assert item.title == "Black wallet"
+    assert len(api.calls("GET", "/api/items/item-1")) == 3
+
+
+def test_gives_up_after_retries_with_retry_after():
+    api = FakeAPI()
+    api.on("GET", "/api/items/item-1", busy(503))
+
+    async def scenario():
+        async with api.client(retries=2) as client:
+            await client.get_item("item-1")
+
+    with pytest.raises(APIError) as excinfo:
+        run(scenario())
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.retry_after == 0
+    assert len(api.calls("GET", "/api/items/item-1")) == 3
+
+
+def test_client_errors_are_not_retried():
+    api = FakeAPI()
+    api.on("GET", "/api/items/missing", httpx.Response(404, json={"error": "Item not found"}))
+
+    async def scenario():
+        async with api.client() as client:
+            await client.get_item("missing")
+
+    with pytest.raises(APIError) as excinfo:
+        run(scenario())
+    assert excinfo.value.message == "Item not found"
+    assert len(api.calls("GET", "/api/items/missing")) == 1
+
+
+def test_relogs_in_once_on_expired_session():
+    api = FakeAPI()
+
+    def items(request):
+        if not api.session_valid:
+            return httpx.Response(401, json={"error": "Unauthorized"})
+        return httpx.Response(200, json={"items": [ITEM], "hasMore": False, "page": 1, "limit": 24})
+
+    api.on("GET", "/api/items", items)
+
+    async def scenario():
+        async with api.client(email="a@b.c", password="secret") as client:
+            api.session_valid = False
+            # Concurrent 401s share a single re-login.
+            return await asyncio.gather(client.list_items(), client.list_items())
+
+    pages = run(scenario())
+    assert [page.items[0].id for page in pages] == ["item-1", "item-1"]
+    assert api.logins == 2
+
+
+def test_login_rejects_invalid_credentials():
+    api = FakeAPI()
+
+    async def scenario():
+        async with api.client(email="a@b.c", password="wrong"):
+            pass
+
+    # NextAuth answers a bad password without a session rather than an error.
+    with pytest.raises(AuthenticationError):
+        run(scenario())
+
+
+def test_iter_items_follows_pages_until_has_more_is_false():
+    api = FakeAPI()
+
+    def items(request):
+        page = int(request.url.params["page"])
+        item = dict(ITEM, id=f"item-{page}")
+        return httpx.Response(200, json={"items": [item], "hasMore": page < 3, "page": page, "limit": 1})
+
+    api.on("GET", "/api/items", items)
+
+    async def scenario():
+        async with api.client() as client:
+            return [item.id async for item in client.iter_items(page_size=1, status="Found")]
+
+    assert run(scenario()) == ["item-1", "item-2", "item-3"]
+    assert all(r.url.params["status"] == "Found" for r in api.calls("GET", "/api/items"))
+
+
+def test_iter_notifications_follows_cursor():
+    api = FakeAPI()
+
+    def inbox(request):
+        cursor = request.url.params.get("cursor")
+        notification = {"id": cursor or "n1", "type": "item_matched", "title": "Match", "message": "m"}
+        return httpx.Response(200, json={"notifications": [notification], "nextCursor": None if cursor else "n2"})
+
+    api.on("GET", "/api/notifications", inbox)
+
+    async def scenario():
+        async with api.client() as client:
+            return [n.id async for n in client.iter_notifications()]
+
+    assert run(scenario()) == ["n1", "n2"]
+
+
+def test_create_item_reuses_idempotency_key_across_retries():
+    api = FakeAPI()
+    api.on("POST", "/api/items", busy(503), httpx.Response(201, json={"item": ITEM}))
+
+    async def scenario():
+        async with api.client() as client:
+            return await client.create_item(ItemInput("Wallet", "d", "c", "found", "l", "2024-05-01"))
+
+    run(scenario())
+    keys = {r.headers["Idempotency-Key"] for r in api.calls("POST", "/api/items")}
+    assert len(keys) == 1
+    assert json.loads(api.calls("POST", "/api/items")[0].content)["title"] == "Wallet"
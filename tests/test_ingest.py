@@ -0,0 +1,155 @@
+"""
+Offline tests for the bulk ingestion CLI: checkpointing, the AIMD limiter,
+status normalisation and worker error handling
+"""
+
+import asyncio
+import json
+
+from lostfound_client.errors import APIError
+from lostfound_client.ingest import AdaptiveLimiter, Checkpoint, Ingestor, normalize_status
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_checkpoint_round_trips_through_the_state_file(tmp_path):
+    path = tmp_path / "state.json"
+    checkpoint = Checkpoint(str(path), flush_every=100)
+    checkpoint.mark_failed("r1", "boom")
+    checkpoint.mark_done("r1", "item-1")
+    checkpoint.mark_failed("r2", "bad row")
+    checkpoint.save()
+
+    restored = Checkpoint(str(path))
+    assert restored.done == {"r1": "item-1"}
+    assert restored.failed == {"r2": "bad row"}
+    assert not (tmp_path / "state.json.tmp").exists()
+
+
+def test_checkpoint_flushes_every_n_updates(tmp_path):
+    path = tmp_path / "state.json"
+    checkpoint = Checkpoint(str(path), flush_every=2)
+
+    checkpoint.mark_done("r1", "item-1")
+    assert not path.exists()
+    checkpoint.mark_done("r2", "item-2")
+    assert json.loads(path.read_text())["done"] == {"r1": "item-1", "r2": "item-2"}
+
+
+def test_limiter_halves_on_throttle_and_grows_by_one_per_window():
+    limiter = AdaptiveLimiter(8)
+
+    limiter.throttle(retry_after=0)
+    assert limiter.limit == 4
+    limiter.throttle(retry_after=0)
+    limiter.throttle(retry_after=0)
+    limiter.throttle(retry_after=0)
+    assert limiter.limit == 1
+
+    limiter.success()
+    assert limiter.limit == 2
+    limiter.success()
+    assert limiter.limit == 2
+    limiter.success()
+    assert limiter.limit == 3
+
+
+def test_limiter_never_exceeds_its_maximum():
+    limiter = AdaptiveLimiter(2)
+    for _ in range(10):
+        limiter.success()
+    assert limiter.limit == 2
+
+
+def test_limiter_caps_work_in_flight():
+    limiter = AdaptiveLimiter(2)
+    peak = 0
+
+    async def task():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def scenario():
+        await asyncio.gather(*(task() for _ in range(6)))
+
+    run(scenario())
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+class FakeIngestor(Ingestor):
+    """Ingestor whose per-record work is scripted instead of calling the API"""
+
+    def __init__(self, checkpoint, outcomes, concurrency=2):
+        super().__init__(None, checkpoint, "test", ".", concurrency, "id", max_attempts=2)
+        self.outcomes = outcomes
+
+    async def ingest_record(self, record_id, record):
+        outcome = self.outcomes[record_id]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_run_records_unexpected_row_errors_and_finishes(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path / "state.json"))
+    outcomes = {
+        "r1": "item-1",
+        "r2": KeyError("item"),
+        "r3": APIError(400, "Missing required fields"),
+        "r4": "item-4",
+    }
+    ingestor = FakeIngestor(checkpoint, outcomes)
+    records = [{"id": record_id} for record_id in outcomes]
+
+    run(asyncio.wait_for(ingestor.run(records, report_interval=60), timeout=5))
+
+    assert ingestor.created == 2
+    assert ingestor.failed == 2
+    assert checkpoint.done == {"r1": "item-1", "r4": "item-4"}
+    assert checkpoint.failed["r2"].startswith("KeyError")
+    assert set(Checkpoint(str(tmp_path / "state.json")).failed) == {"r2", "r3"}
+
+
+def test_run_skips_records_already_done(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path / "state.json"))
+    checkpoint.mark_done("r1", "item-1")
+    ingestor = FakeIngestor(checkpoint, {"r2": "item-2"})
+
+    run(ingestor.run([{"id": "r1"}, {"id": "r2"}], report_interval=60))
+
+    assert ingestor.skipped == 1
+    assert ingestor.created == 1
+
+
+def test_normalize_status_matches_the_api_values():
+    assert normalize_status(None) == "Found"
+    assert normalize_status("  ") == "Found"
+    assert normalize_status("lost") == "Lost"
+    assert normalize_status(" FOUND ") == "Found"
+    assert normalize_status("Claimed") == "Claimed"
+
+
+class RecordingClient:
+    """Stands in for LostFoundClient and keeps the items it was asked to create"""
+
+    def __init__(self):
+        self.created = []
+
+    async def create_item(self, item, idempotency_key=None):
+        self.created.append(item)
+        return type("Created", (), {"id": f"item-{len(self.created)}"})()
+
+
+def test_ingest_record_sends_normalized_status(tmp_path):
+    client = RecordingClient()
+    ingestor = Ingestor(client, Checkpoint(str(tmp_path / "state.json")), "test", ".", 1, "id", max_attempts=1)
+
+    run(ingestor.ingest_record("r1", {"title": "Keys", "status": "lost"}))
+    run(ingestor.ingest_record("r2", {"title": "Wallet"}))
+
+    assert [item.status for item in client.created] == ["Lost", "Found"]